@@ -0,0 +1,149 @@
+"""In-process mock of the Straker Verify API for benchmarks.
+
+Serves /v1/projects (cursor-paginated), /v1/projects/{id} and /v1/stats
+through an httpx.MockTransport, with configurable latency and payload size.
+Response bodies are rendered up front so the benchmarks measure the client,
+not the mock.
+"""
+
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import httpx
+
+
+STATUSES = ["complete", "complete", "complete", "processing", "pending", "failed"]
+
+
+def make_project(index: int, files: int, padding: int, now: datetime) -> Dict[str, Any]:
+    """Build one project as the API would return it.
+
+    Args:
+        index: Project number
+        files: Files attached to the project
+        padding: Extra description characters, to grow the payload
+        now: Reference time
+
+    Returns:
+        Project JSON object
+    """
+    rng = random.Random(index)
+    status = rng.choice(STATUSES)
+    updated_at = now - timedelta(minutes=index)
+    project = {
+        "id": f"proj-{index:08d}",
+        "name": f"Benchmark_Project_{index}",
+        "description": "x" * padding,
+        "source_language": "en",
+        "target_language": rng.choice(["es", "fr", "de", "ja"]),
+        "status": status,
+        "files": [
+            {
+                "id": f"file-{index:08d}-{n}",
+                "name": f"document_{n}.txt",
+                "size": rng.randrange(1024, 65536),
+                "mime_type": "text/plain",
+                "uploaded_at": (updated_at - timedelta(hours=1)).isoformat().replace("+00:00", "Z"),
+            }
+            for n in range(files)
+        ],
+        "created_at": (updated_at - timedelta(hours=2)).isoformat().replace("+00:00", "Z"),
+        "updated_at": updated_at.isoformat().replace("+00:00", "Z"),
+    }
+    if status == "complete":
+        project["quality_score"] = {
+            "overall": rng.uniform(70, 98),
+            "accuracy": rng.uniform(75, 99),
+            "fluency": rng.uniform(70, 97),
+            "terminology": rng.uniform(75, 98),
+            "style": rng.uniform(70, 95),
+        }
+        project["completed_at"] = project["updated_at"]
+    return project
+
+
+class MockAPI:
+    """Pre-rendered mock API served through an httpx transport."""
+
+    def __init__(
+        self,
+        projects: int = 10000,
+        page_size: int = 100,
+        latency: float = 0.0,
+        files_per_project: int = 1,
+        padding: int = 0,
+    ):
+        """Build the mock account.
+
+        Args:
+            projects: Number of projects
+            page_size: Projects per /v1/projects page
+            latency: Seconds to wait before each response
+            files_per_project: Files attached to each project
+            padding: Extra bytes of description per project
+        """
+        self.latency = latency
+        self.requests = 0
+        now = datetime.now(timezone.utc)
+        self.projects: List[Dict[str, Any]] = [
+            make_project(index, files_per_project, padding, now) for index in range(projects)
+        ]
+        self._details = {p["id"]: json.dumps(p).encode() for p in self.projects}
+
+        self._pages: Dict[str, bytes] = {}
+        for start in range(0, projects, page_size):
+            cursor = str(start) if start else ""
+            end = start + page_size
+            self._pages[cursor] = json.dumps({
+                "projects": self.projects[start:end],
+                "next_cursor": str(end) if end < projects else None,
+            }).encode()
+        self.page_bytes = sum(len(body) for body in self._pages.values())
+
+        complete = [p for p in self.projects if p["status"] == "complete"]
+        self._stats = json.dumps({
+            "total_projects": projects,
+            "active_projects": sum(p["status"] == "processing" for p in self.projects),
+            "completed_projects": len(complete),
+            "failed_projects": sum(p["status"] == "failed" for p in self.projects),
+            "total_files": projects * files_per_project,
+            "average_quality": sum(p["quality_score"]["overall"] for p in complete) / max(len(complete), 1),
+        }).encode()
+
+    def transport(self) -> httpx.MockTransport:
+        """Create a transport serving this account.
+
+        Returns:
+            httpx transport
+        """
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer one request.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            Response
+        """
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = request.url.path
+        headers = {"Content-Type": "application/json"}
+        if path == "/v1/projects":
+            body = self._pages.get(request.url.params.get("cursor", ""))
+            if body is not None:
+                return httpx.Response(200, content=body, headers=headers)
+        elif path == "/v1/stats":
+            return httpx.Response(200, content=self._stats, headers=headers)
+        elif path.startswith("/v1/projects/"):
+            body = self._details.get(path.rsplit("/", 1)[1])
+            if body is not None:
+                return httpx.Response(200, content=body, headers=headers)
+        return httpx.Response(404, json={"error": "not found"})
@@ -0,0 +1,327 @@
+"""Benchmark suite for the dashboard's refresh path.
+
+Measures API parse throughput against an in-process mock server, stats
+aggregation, dashboard compose/refresh time in a headless Textual app, and
+memory per 10k projects. Results are printed (and optionally written) as JSON
+so runs can be compared over time.
+
+Usage:
+    python -m benchmarks.run --projects 10000 --output results.json
+"""
+
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import click
+
+from src.api.client import StrakerVerifyClient
+from src.api.parsing import parse_project_page
+from src.api.project_index import ProjectIndex
+from src.api.synthetic import SyntheticBackend
+
+from .mock_api import MockAPI
+
+
+# Any key shaped like a real one sends the client down the real-API path
+BENCHMARK_API_KEY = "sk_test_" + "0" * 32
+BENCHMARK_BASE_URL = "https://benchmark.invalid"
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize timing samples.
+
+    Args:
+        samples: Durations in seconds
+
+    Returns:
+        Min, median and mean in seconds
+    """
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+
+async def measure(func: Callable[[], Awaitable[Any]], repeat: int) -> List[float]:
+    """Time an async callable several times.
+
+    Args:
+        func: Coroutine function to time
+        repeat: Number of runs
+
+    Returns:
+        Duration of each run in seconds
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def real_client(api: MockAPI) -> StrakerVerifyClient:
+    """Create a real-API client wired to the mock server, without caching.
+
+    Args:
+        api: Mock API
+
+    Returns:
+        Client
+    """
+    return StrakerVerifyClient(
+        BENCHMARK_API_KEY,
+        BENCHMARK_BASE_URL,
+        cache_enabled=False,
+        transport=api.transport(),
+    )
+
+
+async def bench_list_projects(api: MockAPI, repeat: int) -> Dict[str, Any]:
+    """Measure list_projects throughput over every page of the account.
+
+    Args:
+        api: Mock API
+        repeat: Number of runs
+
+    Returns:
+        Results
+    """
+    client = real_client(api)
+    try:
+        samples = await measure(client.list_projects, repeat)
+    finally:
+        await client.close()
+
+    best = min(samples)
+    return {
+        "seconds": summarize(samples),
+        "projects_per_second": len(api.projects) / best,
+        "megabytes_per_second": api.page_bytes / best / 1e6,
+    }
+
+
+async def bench_get_project(api: MockAPI, count: int, concurrency: int) -> Dict[str, Any]:
+    """Measure get_project throughput through the bounded hydration pool.
+
+    Args:
+        api: Mock API
+        count: Number of projects to fetch
+        concurrency: Requests in flight
+
+    Returns:
+        Results
+    """
+    client = real_client(api)
+    project_ids = [p["id"] for p in api.projects[:count]]
+
+    async def hydrate() -> None:
+        async for _ in client.get_projects(project_ids, concurrency=concurrency):
+            pass
+
+    try:
+        samples = await measure(hydrate, 1)
+    finally:
+        await client.close()
+    return {
+        "seconds": summarize(samples),
+        "projects_per_second": len(project_ids) / samples[0],
+    }
+
+
+async def bench_stats(projects: int, repeat: int) -> Dict[str, Any]:
+    """Measure building the project index and aggregating stats from it.
+
+    Args:
+        projects: Number of synthetic projects
+        repeat: Number of get_stats runs
+
+    Returns:
+        Results
+    """
+    backend = SyntheticBackend(projects=projects, latency=0)
+    generated = list(backend.generate_projects())
+
+    start = time.perf_counter()
+    index = ProjectIndex()
+    for project in generated:
+        index.put(project)
+    build = time.perf_counter() - start
+
+    client = StrakerVerifyClient("demo", cache_enabled=False, mock_backend=backend)
+    samples = await measure(client.get_stats, repeat)
+    return {
+        "index_build_seconds": build,
+        "get_stats_seconds": summarize(samples),
+    }
+
+
+def bench_memory(api: MockAPI, projects: int = 10000) -> Dict[str, Any]:
+    """Measure memory held by parsed projects in the project index.
+
+    Args:
+        api: Mock API (its first pages are parsed)
+        projects: Number of projects to hold
+
+    Returns:
+        Results
+    """
+    bodies = [
+        json.dumps({"projects": api.projects[start:start + 100]}).encode()
+        for start in range(0, min(projects, len(api.projects)), 100)
+    ]
+    gc.collect()
+    tracemalloc.start()
+    index = ProjectIndex()
+    for body in bodies:
+        for project in parse_project_page(body).projects:
+            index.put(project)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    held = len(index)
+    return {
+        "projects": held,
+        "bytes": current,
+        "peak_bytes": peak,
+        "bytes_per_10k_projects": current * 10000 / max(held, 1),
+    }
+
+
+async def bench_dashboard(projects: int, repeat: int) -> Dict[str, Any]:
+    """Measure dashboard startup, refresh and recompose in a headless app.
+
+    Args:
+        projects: Number of synthetic projects in the mock account
+        repeat: Number of refresh and recompose runs
+
+    Returns:
+        Results
+    """
+    from src.app import StrakerVerifyApp
+    from src.config import Settings
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        settings = Settings(
+            STRAKER_VERIFY_API_KEY="demo",
+            CACHE_ENABLED=False,
+            CACHE_DIR=cache_dir,
+            MOCK_PROJECTS=projects,
+            MOCK_LATENCY=0,
+            AUTO_REFRESH_INTERVAL=300,
+        )
+        app = StrakerVerifyApp(settings)
+
+        start = time.perf_counter()
+        async with app.run_test(size=(120, 40)) as pilot:
+            screen = app.screen
+            while screen._load_worker is None:
+                await pilot.pause()
+            await screen._load_worker.wait()
+            await pilot.pause()
+            startup = time.perf_counter() - start
+
+            async def refresh() -> None:
+                await screen.load_data()
+                await pilot.pause()
+
+            async def recompose() -> None:
+                await screen.recompose()
+                await pilot.pause()
+
+            refresh_samples = await measure(refresh, repeat)
+            recompose_samples = await measure(recompose, repeat)
+            widgets = len(list(screen.walk_children()))
+
+    return {
+        "startup_seconds": startup,
+        "refresh_seconds": summarize(refresh_samples),
+        "recompose_seconds": summarize(recompose_samples),
+        "widgets": widgets,
+    }
+
+
+async def run_all(
+    projects: int,
+    latency: float,
+    padding: int,
+    repeat: int,
+    concurrency: int,
+    skip_ui: bool,
+) -> Dict[str, Any]:
+    """Run every benchmark.
+
+    Args:
+        projects: Projects in the mock account
+        latency: Mock server latency in seconds
+        padding: Extra bytes per project payload
+        repeat: Runs per timed benchmark
+        concurrency: Requests in flight for get_project
+        skip_ui: Skip the Textual benchmark
+
+    Returns:
+        Results by benchmark name
+    """
+    api = MockAPI(projects=projects, latency=latency, padding=padding)
+    results: Dict[str, Any] = {
+        "list_projects": await bench_list_projects(api, repeat),
+        "get_project": await bench_get_project(api, min(projects, 1000), concurrency),
+        "get_stats": await bench_stats(projects, repeat),
+        "memory": bench_memory(api),
+    }
+    if not skip_ui:
+        results["dashboard"] = await bench_dashboard(projects, repeat)
+    return results
+
+
+@click.command()
+@click.option("--projects", default=10000, show_default=True, help="Projects in the mock account.")
+@click.option("--latency", default=0.0, show_default=True, help="Mock server latency in seconds.")
+@click.option("--padding", default=0, show_default=True, help="Extra bytes per project payload.")
+@click.option("--repeat", default=5, show_default=True, help="Runs per timed benchmark.")
+@click.option("--concurrency", default=4, show_default=True, help="Concurrent get_project requests.")
+@click.option("--skip-ui", is_flag=True, help="Skip the headless dashboard benchmark.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), help="Also write results to this file.")
+def main(
+    projects: int,
+    latency: float,
+    padding: int,
+    repeat: int,
+    concurrency: int,
+    skip_ui: bool,
+    output: Optional[Path],
+) -> None:
+    """Run the dashboard benchmarks and print JSON results."""
+    results = asyncio.run(run_all(projects, latency, padding, repeat, concurrency, skip_ui))
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "parameters": {
+            "projects": projects,
+            "latency": latency,
+            "padding": padding,
+            "repeat": repeat,
+            "concurrency": concurrency,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if output:
+        output.write_text(text + "\n")
+    click.echo(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""In-memory response cache for the Straker Verify API client.
+
+Provides a bounded, LRU-evicting cache with per-entry TTLs so that repeated
+dashboard refreshes don't hit the API for data that hasn't had time to change.
+"""
+
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import httpx
+
+from .resilience import RETRY_STATUSES
+
+
+# Default TTLs (in seconds) per endpoint. These are upper bounds: the
+# configured CACHE_TTL always wins if it is shorter.
+ENDPOINT_TTLS: Dict[str, float] = {
+    "stats": 15.0,
+    "projects": 15.0,
+    "project": 30.0,
+    "segments": 60.0,
+    "balance": 60.0,
+    "languages": 3600.0,
+}
+
+
+class ResponseCache:
+    """Bounded LRU cache with per-entry expiry."""
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        default_ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            default_ttl: TTL applied when none is given to set()
+            clock: Monotonic time source (overridable for testing)
+        """
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a fresh value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Get a value from the cache even if it has expired.
+
+        Expired entries are kept until evicted so they can be served when
+        the API is failing.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing
+        """
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds (defaults to default_ttl)
+        """
+        ttl = self.default_ttl if ttl is None else min(ttl, self.default_ttl)
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *prefixes: str) -> None:
+        """Drop cached entries.
+
+        Keys are tuples whose first element is the endpoint name, so passing
+        "projects" drops every cached page of the project list.
+
+        Args:
+            *prefixes: Endpoint names to drop; drops everything if empty
+        """
+        if not prefixes:
+            self._entries.clear()
+            return
+
+        for key in list(self._entries):
+            name = key[0] if isinstance(key, tuple) else key
+            if name in prefixes:
+                del self._entries[key]
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache.
+
+        Returns:
+            Hit ratio (0-1)
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cached(
+    endpoint: str,
+    fallback: Optional[Callable[[Any], Optional[Any]]] = None,
+    cache_attr: str = "_cache",
+) -> Callable:
+    """Decorate an async client method so its result is cached.
+
+    The cache key is the endpoint name plus the call arguments. List results
+    are copied on the way out so callers can sort or mutate them freely. If
+    the API is unavailable, the last cached value is served even if stale.
+
+    Args:
+        endpoint: Endpoint name, used for TTL lookup and invalidation
+        fallback: Function of the client giving a substitute result when the
+            API is unavailable and nothing is cached, or None if it has none.
+            Its results are never cached.
+        cache_attr: Name of the client attribute holding the ResponseCache
+            (None there disables caching)
+
+    Returns:
+        Method decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache: Optional[ResponseCache] = getattr(self, cache_attr)
+            key = (endpoint, *args, *sorted(kwargs.items()))
+            value = cache.get(key) if cache is not None else None
+            if value is None:
+                try:
+                    value = await func(self, *args, **kwargs)
+                except httpx.HTTPError as e:
+                    if not _is_unavailable(e):
+                        raise
+                    value = cache.get_stale(key) if cache is not None else None
+                    if value is None and fallback is not None:
+                        value = fallback(self)
+                    if value is None:
+                        raise
+                else:
+                    if cache is None:
+                        return value
+                    cache.set(key, value, ENDPOINT_TTLS.get(endpoint))
+
+            return list(value) if isinstance(value, list) else value
+
+        return wrapper
+
+    return decorator
+
+
+def _is_unavailable(error: httpx.HTTPError) -> bool:
+    """Check whether an error means the API is unavailable, not that the request was bad.
+
+    Args:
+        error: Error raised by a request
+
+    Returns:
+        True for transport errors, transient statuses and an open circuit
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRY_STATUSES
+    return True
@@ -5,26 +5,77 @@ Automatically detects real API keys and switches between mock and real API.
 """
 
 import asyncio
+import hashlib
+import importlib.util
+import os
 import random
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
+import aiofiles
 import httpx
 
+from .cache import ResponseCache, cached
+from .metrics import ClientMetrics
+from .parsing import (
+    decode_json,
+    parse_file_info,
+    parse_project,
+    parse_project_page,
+    parse_segments,
+)
+from .project_index import ProjectIndex
+from .resilience import RETRY_STATUSES, CircuitBreaker, RetryPolicy
+from .scores import SegmentScores
+from .singleflight import SingleFlight, coalesced
+from .synthetic import SyntheticBackend
+from .transfer import (
+    CHUNK_SIZE,
+    RESUMABLE_THRESHOLD,
+    MultipartFileBody,
+    ProgressCallback,
+    UploadProgress,
+    UploadResult,
+    content_total,
+    guess_mime_type,
+    hash_file,
+    iter_file_chunks,
+    part_path,
+    response_sha256,
+    response_validator,
+    unsatisfied_range_total,
+    validator_path,
+)
 from .models import (
     FileInfo,
     Language,
     Project,
     ProjectCreate,
+    ProjectPage,
     ProjectStats,
     ProjectStatus,
+    ProjectSync,
     QualityScore,
     Segment,
+    SegmentPage,
     TokenBalance,
 )
 
+if TYPE_CHECKING:
+    from ..config import Settings
+
+
+# Methods that are safe to retry automatically
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Segments fetched per page; windows are aligned to pages so they cache well
+SEGMENT_PAGE_SIZE = 100
+
+# Recently viewed segment pages kept for scrolling back
+SEGMENT_CACHE_SIZE = 32
+
 
 class StrakerVerifyClient:
     """Client for interacting with Straker Verify API.
@@ -34,35 +85,128 @@ class StrakerVerifyClient:
     - Real mode: For actual Straker Verify API calls
     """
 
-    def __init__(self, api_key: str, base_url: str = "https://api-verify.straker.ai"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api-verify.straker.ai",
+        cache_enabled: bool = True,
+        cache_ttl: int = 3600,
+        cache_size: int = 256,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_reset: float = 30.0,
+        mock_backend: Optional[SyntheticBackend] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """Initialize the Straker Verify client.
         
         Args:
             api_key: Straker Verify API key
             base_url: API base URL
+            cache_enabled: Cache GET responses in memory
+            cache_ttl: Maximum age of a cached response in seconds
+            cache_size: Maximum number of cached responses
+            max_connections: Maximum number of pooled HTTP connections
+            max_keepalive_connections: Maximum number of idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Use HTTP/2 when the optional h2 package is installed
+            timeout: Request timeout in seconds
+            max_retries: Retries for failed idempotent requests
+            circuit_breaker_threshold: Consecutive failures before failing fast
+            circuit_breaker_reset: Seconds to fail fast before trying again
+            mock_backend: Synthetic data and latency for mock mode
+            transport: Custom httpx transport for real-API requests (e.g. a
+                MockTransport for benchmarks)
         """
         self.api_key = api_key
         self.base_url = base_url
-        self._projects: Dict[str, Project] = {}
+        self._projects = ProjectIndex()
+        self._segment_scores: Dict[str, SegmentScores] = {}
+        # (project ID, file path, size, mtime) -> ID of an unfinished upload
+        self._upload_sessions: Dict[Tuple[str, str, int, int], str] = {}
         self._token_balance = 10000
+        self._mock = mock_backend or SyntheticBackend()
+        self._high_water_mark: Optional[datetime] = None
+        self._inflight = SingleFlight()
+        self.metrics = ClientMetrics()
+        self.retry_policy = RetryPolicy(max_attempts=max_retries + 1)
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=circuit_breaker_threshold,
+            reset_timeout=circuit_breaker_reset,
+        )
+        self._cache: Optional[ResponseCache] = (
+            ResponseCache(max_size=cache_size, default_ttl=cache_ttl)
+            if cache_enabled
+            else None
+        )
+        # Segment pages get their own LRU, kept even with caching disabled, so
+        # scrolling a long project never competes with the dashboard's
+        # entries or refetches the pages just viewed
+        self._segment_cache = ResponseCache(max_size=SEGMENT_CACHE_SIZE, default_ttl=cache_ttl)
         
         # Detect if this is a real API key or demo key
         self.use_real_api = self._is_real_api_key(api_key)
         
         if self.use_real_api:
-            # Initialize HTTP client for real API calls
+            # Initialize one pooled HTTP client for real API calls; it is
+            # reused for every request so refreshes run over warm connections
             self.http_client = httpx.AsyncClient(
                 base_url=base_url,
                 headers={
                     "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json",
                 },
-                timeout=30.0,
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                # HTTP/2 needs the optional h2 package (pip install httpx[http2])
+                http2=http2 and importlib.util.find_spec("h2") is not None,
+                transport=transport,
+                event_hooks=self.metrics.event_hooks,
             )
         else:
             # Initialize with mock data for demo
-            self._init_sample_data()
+            if self._mock.project_count:
+                for project in self._mock.generate_projects():
+                    self._projects[project.id] = project
+            else:
+                self._init_sample_data()
     
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "StrakerVerifyClient":
+        """Create a client configured from application settings.
+        
+        Args:
+            settings: Application settings
+            
+        Returns:
+            Configured client
+        """
+        return cls(
+            api_key=settings.straker_verify_api_key,
+            base_url=settings.straker_verify_base_url,
+            cache_enabled=settings.cache_enabled,
+            cache_ttl=settings.cache_ttl,
+            cache_size=settings.cache_max_entries,
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+            http2=settings.http2,
+            timeout=settings.http_timeout,
+            max_retries=settings.http_max_retries,
+            circuit_breaker_threshold=settings.circuit_breaker_threshold,
+            circuit_breaker_reset=settings.circuit_breaker_reset,
+            mock_backend=SyntheticBackend.from_settings(settings),
+        )
+
     def _is_real_api_key(self, api_key: str) -> bool:
         """Detect if this is a real API key or a demo key.
         
@@ -100,6 +244,7 @@ class StrakerVerifyClient:
     def _init_sample_data(self) -> None:
         """Initialize sample data for demo purposes."""
         # Create a completed project
+        campaign_file_id = str(uuid4())
         project1 = Project(
             id=str(uuid4()),
             name="Marketing_Campaign_ES",
@@ -116,7 +261,7 @@ class StrakerVerifyClient:
             ),
             files=[
                 FileInfo(
-                    id=str(uuid4()),
+                    id=campaign_file_id,
                     name="campaign_content.txt",
                     size=2048,
                     mime_type="text/plain",
@@ -126,6 +271,7 @@ class StrakerVerifyClient:
             segments=[
                 Segment(
                     id=str(uuid4()),
+                    file_id=campaign_file_id,
                     source_text="Welcome to our new product launch event.",
                     target_text="Bienvenido a nuestro evento de lanzamiento de producto.",
                     quality_score=QualityScore(
@@ -138,6 +284,7 @@ class StrakerVerifyClient:
                 ),
                 Segment(
                     id=str(uuid4()),
+                    file_id=campaign_file_id,
                     source_text="Join us for an exciting showcase of innovation.",
                     target_text="Únase a nosotros para una emocionante exhibición de innovación.",
                     quality_score=QualityScore(
@@ -150,6 +297,7 @@ class StrakerVerifyClient:
                 ),
                 Segment(
                     id=str(uuid4()),
+                    file_id=campaign_file_id,
                     source_text="Experience the future of technology today.",
                     target_text="Experimente el futuro de la tecnología hoy.",
                     quality_score=QualityScore(
@@ -191,33 +339,15 @@ class StrakerVerifyClient:
         )
         self._projects[project2.id] = project2
 
-    async def get_languages(self) -> List[Language]:
-        """Get list of supported languages.
+    def _default_languages(self) -> List[Language]:
+        """Get the built-in list of supported languages.
+        
+        Used in mock mode, and when the API is unavailable and no languages
+        are cached.
         
         Returns:
             List of supported languages
         """
-        if self.use_real_api:
-            # Real API call
-            try:
-                response = await self.http_client.get("/v1/languages")
-                response.raise_for_status()
-                data = response.json()
-                
-                languages = []
-                for lang in data.get("languages", []):
-                    languages.append(Language(
-                        id=lang["id"],
-                        code=lang["code"],
-                        name=lang["name"],
-                    ))
-                return languages
-            except httpx.HTTPError:
-                # Fall back to default list
-                pass
-        
-        # Mock mode or fallback
-        await asyncio.sleep(0.1)  # Simulate API call
         return [
             Language(id="en", code="en", name="English"),
             Language(id="es", code="es", name="Spanish"),
@@ -229,6 +359,37 @@ class StrakerVerifyClient:
             Language(id="zh", code="zh", name="Chinese"),
         ]
 
+    @cached("languages", fallback=_default_languages)
+    @coalesced("languages")
+    async def get_languages(self) -> List[Language]:
+        """Get list of supported languages.
+        
+        If the API is unavailable, the last cached list is served, or failing
+        that the built-in list.
+        
+        Returns:
+            List of supported languages
+        """
+        if self.use_real_api:
+            # Real API call
+            response = await self._request("GET", "/v1/languages")
+            data = decode_json(response.content)
+            
+            languages = []
+            for lang in data.get("languages", []):
+                languages.append(Language(
+                    id=lang["id"],
+                    code=lang["code"],
+                    name=lang["name"],
+                ))
+            return languages
+        
+        # Mock mode
+        await self._mock.delay()  # Simulate API call
+        return self._default_languages()
+
+    @cached("balance")
+    @coalesced("balance")
     async def get_token_balance(self) -> TokenBalance:
         """Get current token balance.
         
@@ -237,17 +398,12 @@ class StrakerVerifyClient:
         """
         if self.use_real_api:
             # Real API call
-            try:
-                response = await self.http_client.get("/v1/account/balance")
-                response.raise_for_status()
-                data = response.json()
-                return TokenBalance(balance=data.get("balance", 0))
-            except httpx.HTTPError:
-                # Fall back to 0 on error
-                return TokenBalance(balance=0)
+            response = await self._request("GET", "/v1/account/balance")
+            data = decode_json(response.content)
+            return TokenBalance(balance=data.get("balance", 0))
         else:
             # Mock mode
-            await asyncio.sleep(0.1)  # Simulate API call
+            await self._mock.delay()  # Simulate API call
             return TokenBalance(balance=self._token_balance)
 
     async def create_project(self, project_data: ProjectCreate) -> Project:
@@ -259,7 +415,7 @@ class StrakerVerifyClient:
         Returns:
             Created project
         """
-        await asyncio.sleep(0.2)  # Simulate API call
+        await self._mock.delay(2)  # Simulate API call
         
         project = Project(
             id=str(uuid4()),
@@ -275,54 +431,223 @@ class StrakerVerifyClient:
         )
         
         self._projects[project.id] = project
+        self.invalidate_cache("projects", "stats")
         return project
 
     async def upload_file(
-        self, project_id: str, file_path: Path
+        self,
+        project_id: str,
+        file_path: Path,
+        progress: Optional[ProgressCallback] = None,
     ) -> FileInfo:
         """Upload a file to a project.
         
+        The file is streamed from disk, so memory use stays flat regardless
+        of file size. Files over RESUMABLE_THRESHOLD are sent as a resumable
+        upload session in chunks, each of which is retried on its own.
+        
         Args:
             project_id: Project ID
             file_path: Path to file to upload
+            progress: Called with (bytes sent, file size)
             
         Returns:
             File information
             
         Raises:
             ValueError: If project not found or file doesn't exist
+            httpx.HTTPError: If the upload fails
         """
+        if not file_path.is_file():
+            raise ValueError(f"File {file_path} not found")
+        
+        if self.use_real_api:
+            try:
+                if file_path.stat().st_size > RESUMABLE_THRESHOLD:
+                    file_info = await self._upload_resumable(project_id, file_path, progress)
+                else:
+                    body = MultipartFileBody(file_path, progress=progress)
+                    response = await self._request(
+                        "POST",
+                        f"/v1/projects/{project_id}/files",
+                        content=body,
+                        headers=body.headers,
+                    )
+                    file_info = parse_file_info(decode_json(response.content))
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    raise ValueError(f"Project {project_id} not found") from e
+                raise
+            self._segment_scores.pop(project_id, None)
+            self.invalidate_cache("projects", "project", "segments", "stats")
+            return file_info
+        
+        # Mock mode
         if project_id not in self._projects:
             raise ValueError(f"Project {project_id} not found")
         
-        if not file_path.exists():
-            raise ValueError(f"File {file_path} not found")
-        
-        await asyncio.sleep(0.5)  # Simulate upload
+        await self._mock.delay(5)  # Simulate upload
         
         file_info = FileInfo(
             id=str(uuid4()),
             name=file_path.name,
             size=file_path.stat().st_size,
-            mime_type="text/plain",  # Simplified for demo
+            mime_type=guess_mime_type(file_path),
             uploaded_at=datetime.now(),
         )
+        if progress:
+            progress(file_info.size, file_info.size)
         
         project = self._projects[project_id]
         project.files.append(file_info)
         project.status = ProjectStatus.PROCESSING
         project.updated_at = datetime.now()
+        self._projects.put(project)
         
         # Simulate processing by generating segments
-        await self._simulate_processing(project_id)
+        await self._simulate_processing(project_id, file_info.id)
+        self.invalidate_cache("projects", "project", "segments", "stats")
         
         return file_info
 
-    async def _simulate_processing(self, project_id: str) -> None:
+    async def _upload_resumable(
+        self,
+        project_id: str,
+        file_path: Path,
+        progress: Optional[ProgressCallback],
+        chunk_size: int = RESUMABLE_THRESHOLD,
+    ) -> FileInfo:
+        """Upload a large file through a resumable upload session.
+        
+        Each chunk is a PUT with a Content-Range header, so a failed chunk is
+        retried by _request without resending what the server already has.
+        The session ID is remembered until the upload completes, so if the
+        upload fails, uploading the same unchanged file to the same project
+        again resumes the session from the offset the server reports instead
+        of starting over.
+        
+        Args:
+            project_id: Project ID
+            file_path: File to upload
+            progress: Called with (bytes sent, file size)
+            chunk_size: Bytes per chunk
+            
+        Returns:
+            File information for the completed upload
+            
+        Raises:
+            httpx.HTTPError: If any step of the upload fails
+        """
+        stat = file_path.stat()
+        size = stat.st_size
+        key = (project_id, str(file_path.resolve()), size, stat.st_mtime_ns)
+        session = None
+        upload_id = self._upload_sessions.get(key)
+        if upload_id is not None:
+            try:
+                response = await self._request("GET", f"/v1/uploads/{upload_id}")
+                session = decode_json(response.content)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in (404, 410):
+                    raise
+                # The session expired; start a new one
+                del self._upload_sessions[key]
+        if session is None:
+            response = await self._request(
+                "POST",
+                f"/v1/projects/{project_id}/uploads",
+                json={"name": file_path.name, "size": size, "mime_type": guess_mime_type(file_path)},
+            )
+            session = decode_json(response.content)
+            upload_id = self._upload_sessions[key] = session["upload_id"]
+        offset = session.get("offset", 0)
+        
+        while offset < size:
+            end = min(offset + chunk_size, size)
+            chunk = b"".join([
+                piece async for piece in iter_file_chunks(file_path, offset, end)
+            ])
+            response = await self._request(
+                "PUT",
+                f"/v1/uploads/{upload_id}",
+                content=chunk,
+                headers={
+                    "Content-Range": f"bytes {offset}-{end - 1}/{size}",
+                    "Content-Type": "application/octet-stream",
+                },
+            )
+            offset = end
+            if progress:
+                progress(offset, size)
+        
+        response = await self._request("POST", f"/v1/uploads/{upload_id}/complete")
+        self._upload_sessions.pop(key, None)
+        return parse_file_info(decode_json(response.content))
+
+    async def upload_files(
+        self,
+        project_id: str,
+        paths: Iterable[Path],
+        concurrency: int = 4,
+        progress: Optional[Callable[[UploadProgress], None]] = None,
+    ) -> AsyncIterator[UploadResult]:
+        """Upload many files to a project with bounded concurrency.
+        
+        A fixed pool of workers uploads files in parallel. A failed file does
+        not stop the batch; its error is reported in its result instead.
+        
+        Args:
+            project_id: Project ID
+            paths: Files to upload
+            concurrency: Maximum number of uploads in flight
+            progress: Called with an UploadProgress event as each file's bytes are sent
+            
+        Yields:
+            Upload results, in completion order
+            
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        pending: "asyncio.Queue[Path]" = asyncio.Queue()
+        for path in dict.fromkeys(paths):
+            pending.put_nowait(path)
+        total = pending.qsize()
+        results: "asyncio.Queue[UploadResult]" = asyncio.Queue()
+        
+        async def worker() -> None:
+            while True:
+                try:
+                    path = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                def report(sent: int, size: Optional[int], path: Path = path) -> None:
+                    progress(UploadProgress(path, sent, size or 0))
+                
+                try:
+                    file_info = await self.upload_file(
+                        project_id, path, report if progress else None
+                    )
+                    await results.put(UploadResult(path, file_info, None))
+                except Exception as e:
+                    await results.put(UploadResult(path, None, e))
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, total))]
+        try:
+            for _ in range(total):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def _simulate_processing(self, project_id: str, file_id: Optional[str] = None) -> None:
         """Simulate file processing (for demo purposes).
         
         Args:
             project_id: Project ID
+            file_id: ID of the file the segments come from
         """
         project = self._projects[project_id]
         
@@ -334,9 +659,11 @@ class StrakerVerifyClient:
             ("Thank you for your interest.", "Gracias por su interés."),
         ]
         
+        scores = await self.get_segment_scores(project_id)
         for source, target in sample_texts:
             segment = Segment(
                 id=str(uuid4()),
+                file_id=file_id,
                 source_text=source,
                 target_text=target,
                 quality_score=QualityScore(
@@ -348,22 +675,18 @@ class StrakerVerifyClient:
                 ),
             )
             project.segments.append(segment)
+            scores.append(segment.quality_score)
         
         # Calculate overall quality
-        if project.segments:
-            avg_quality = sum(s.quality_score.overall for s in project.segments if s.quality_score) / len(project.segments)
-            project.quality_score = QualityScore(
-                overall=avg_quality,
-                accuracy=sum(s.quality_score.accuracy for s in project.segments if s.quality_score and s.quality_score.accuracy) / len(project.segments),
-                fluency=sum(s.quality_score.fluency for s in project.segments if s.quality_score and s.quality_score.fluency) / len(project.segments),
-                terminology=sum(s.quality_score.terminology for s in project.segments if s.quality_score and s.quality_score.terminology) / len(project.segments),
-                style=sum(s.quality_score.style for s in project.segments if s.quality_score and s.quality_score.style) / len(project.segments),
-            )
+        project.quality_score = scores.summary() or project.quality_score
         
         project.status = ProjectStatus.COMPLETE
         project.completed_at = datetime.now()
         project.updated_at = datetime.now()
+        self._projects.put(project)
 
+    @cached("project")
+    @coalesced("project")
     async def get_project(self, project_id: str) -> Project:
         """Get project details.
         
@@ -379,59 +702,81 @@ class StrakerVerifyClient:
         if self.use_real_api:
             # Real API call
             try:
-                response = await self.http_client.get(f"/v1/projects/{project_id}")
-                response.raise_for_status()
-                data = response.json()
-                
-                # Parse files
-                files = []
-                for file_data in data.get("files", []):
-                    files.append(FileInfo(
-                        id=file_data["id"],
-                        name=file_data["name"],
-                        size=file_data["size"],
-                        mime_type=file_data.get("mime_type", "application/octet-stream"),
-                        uploaded_at=datetime.fromisoformat(file_data["uploaded_at"].replace("Z", "+00:00")),
-                    ))
-                
-                # Parse quality score if available
-                quality_score = None
-                if "quality_score" in data:
-                    qs = data["quality_score"]
-                    quality_score = QualityScore(
-                        overall=qs.get("overall", 0),
-                        accuracy=qs.get("accuracy"),
-                        fluency=qs.get("fluency"),
-                        terminology=qs.get("terminology"),
-                        style=qs.get("style"),
-                    )
-                
-                return Project(
-                    id=data["id"],
-                    name=data["name"],
-                    description=data.get("description", ""),
-                    source_language=data["source_language"],
-                    target_language=data["target_language"],
-                    status=ProjectStatus(data["status"]),
-                    quality_score=quality_score,
-                    files=files,
-                    segments=[],  # Segments loaded separately
-                    created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                    updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00")),
-                    completed_at=datetime.fromisoformat(data["completed_at"].replace("Z", "+00:00")) if data.get("completed_at") else None,
-                    human_verified=data.get("human_verified", False),
-                )
-            except httpx.HTTPError as e:
-                raise ValueError(f"Project {project_id} not found") from e
+                response = await self._request("GET", f"/v1/projects/{project_id}")
+                return parse_project(decode_json(response.content))
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    raise ValueError(f"Project {project_id} not found") from e
+                raise
         else:
             # Mock mode
-            await asyncio.sleep(0.1)  # Simulate API call
+            await self._mock.delay()  # Simulate API call
             
             if project_id not in self._projects:
                 raise ValueError(f"Project {project_id} not found")
             
             return self._projects[project_id]
 
+    async def get_projects(
+        self, project_ids: Iterable[str], concurrency: int = 4
+    ) -> AsyncIterator[Project]:
+        """Fetch full details for many projects with bounded concurrency.
+        
+        A fixed pool of workers fetches projects so the request rate stays
+        predictable. Duplicate IDs are fetched once, a project already being
+        fetched by another caller shares that request (see get_project's
+        single-flight), and results are yielded as soon as each one completes.
+        
+        Args:
+            project_ids: IDs of projects to fetch
+            concurrency: Maximum number of requests in flight
+            
+        Yields:
+            Project details, in completion order (missing projects are skipped)
+            
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        pending: "asyncio.Queue[str]" = asyncio.Queue()
+        for project_id in dict.fromkeys(project_ids):
+            pending.put_nowait(project_id)
+        total = pending.qsize()
+        results: "asyncio.Queue[Any]" = asyncio.Queue()
+        
+        async def worker() -> None:
+            while True:
+                try:
+                    project_id = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await results.put(await self.get_project(project_id))
+                except ValueError:
+                    # Project was deleted since it was listed
+                    await results.put(None)
+                except Exception as e:
+                    await results.put(e)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, total))]
+        try:
+            for _ in range(total):
+                result = await results.get()
+                if isinstance(result, Exception):
+                    raise result
+                if result is not None:
+                    known = self._projects.record(result.id)
+                    # A cached detail may be older than a summary synced since
+                    if self.use_real_api and (known is None or result.updated_at >= known.updated_at):
+                        self._projects[result.id] = result
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+
+    @cached("projects")
+    @coalesced("projects")
     async def list_projects(self) -> List[Project]:
         """List all projects.
         
@@ -439,40 +784,182 @@ class StrakerVerifyClient:
             List of projects
         """
         if self.use_real_api:
-            # Real API call
-            try:
-                response = await self.http_client.get("/v1/projects")
-                response.raise_for_status()
-                data = response.json()
-                
-                # Convert API response to Project objects
-                projects = []
-                for item in data.get("projects", []):
-                    projects.append(Project(
-                        id=item["id"],
-                        name=item["name"],
-                        description=item.get("description", ""),
-                        source_language=item["source_language"],
-                        target_language=item["target_language"],
-                        status=ProjectStatus(item["status"]),
-                        files=[],  # Will be populated when getting project details
-                        segments=[],
-                        created_at=datetime.fromisoformat(item["created_at"].replace("Z", "+00:00")),
-                        updated_at=datetime.fromisoformat(item["updated_at"].replace("Z", "+00:00")),
-                    ))
-                return projects
-            except httpx.HTTPError as e:
-                # Fall back to empty list on error
-                return []
+            # Real API call; errors propagate so a stale cached list can be
+            # served instead of an empty dashboard
+            projects = []
+            async for page in self.iter_projects():
+                projects.extend(page)
+            return projects
         else:
             # Mock mode
-            await asyncio.sleep(0.1)  # Simulate API call
+            await self._mock.delay()  # Simulate API call
             return list(self._projects.values())
 
+    async def iter_projects(self, page_size: int = 100) -> AsyncIterator[List[Project]]:
+        """Iterate over all projects one page at a time.
+        
+        Projects are ordered most recently updated first. Only one page is
+        held in memory at a time, so callers can render the first page
+        immediately and fetch more on demand.
+        
+        Args:
+            page_size: Number of projects per page
+            
+        Yields:
+            Pages of projects
+            
+        Raises:
+            ValueError: If page_size is less than 1
+            httpx.HTTPError: If a page request fails (real API only)
+        """
+        if page_size < 1:
+            raise ValueError("Page size must be at least 1")
+        if self.use_real_api:
+            async for data in self._fetch_project_pages({"limit": page_size}):
+                page = data.projects
+                self._merge_projects(page)
+                yield page
+        else:
+            # Mock mode
+            records = sorted(self._projects.records(), key=lambda r: r.updated_at, reverse=True)
+            for start in range(0, len(records), page_size):
+                await self._mock.delay()  # Simulate API call
+                page = [record.to_project() for record in records[start:start + page_size]]
+                self._advance_high_water_mark(page)
+                yield page
+
+    async def _fetch_project_pages(self, params: Dict[str, Any]) -> AsyncIterator[ProjectPage]:
+        """Fetch /v1/projects response pages, following cursors.
+        
+        Args:
+            params: Query parameters for every page
+            
+        Yields:
+            Parsed response pages
+        """
+        cursor: Optional[str] = None
+        while True:
+            page_params = {"sort": "-updated_at", **params}
+            if cursor:
+                page_params["cursor"] = cursor
+            
+            response = await self._request("GET", "/v1/projects", params=page_params)
+            data = parse_project_page(response.content)
+            yield data
+            
+            # Servers without pagination return everything in one response
+            cursor = data.next_cursor
+            if not cursor or not data.projects:
+                return
+
+    @coalesced("sync")
+    async def sync_projects(self, page_size: int = 100) -> ProjectSync:
+        """Fetch only the projects that changed since the last sync.
+        
+        The client tracks the newest updated_at it has seen (the high-water
+        mark) and asks the API for projects updated since then. If the server
+        can't filter by update time, the full list is fetched and diffed
+        against the local id-indexed store instead, which also reveals
+        deleted projects.
+        
+        Args:
+            page_size: Number of projects per page
+            
+        Returns:
+            Changed and removed projects
+            
+        Raises:
+            httpx.HTTPError: If a page request fails (real API only)
+        """
+        since = self.high_water_mark
+        
+        if not self.use_real_api:
+            # Mock mode: the local store is the source of truth
+            await self._mock.delay()  # Simulate API call
+            changed = [
+                record.to_project() for record in self._projects.records()
+                if since is None or record.updated_at > since
+            ]
+            self._advance_high_water_mark(changed)
+            return ProjectSync(changed=changed, full=since is None, high_water_mark=self.high_water_mark)
+        
+        params: Dict[str, Any] = {"limit": page_size}
+        if since is not None:
+            params["updated_since"] = since.isoformat()
+        
+        fetched: List[Project] = []
+        deleted: List[str] = []
+        full = since is None
+        async for data in self._fetch_project_pages(params):
+            page = data.projects
+            deleted.extend(data.deleted_ids)
+            # Anything older than the mark means the filter was ignored
+            if since is not None and any(p.updated_at < since for p in page):
+                full = True
+            fetched.extend(page)
+        
+        changed = self._merge_projects(fetched)
+        if full:
+            seen = {p.id for p in fetched}
+            deleted.extend(project_id for project_id in self._projects if project_id not in seen)
+        
+        removed = [project_id for project_id in dict.fromkeys(deleted) if project_id in self._projects]
+        for project_id in removed:
+            del self._projects[project_id]
+            self._segment_scores.pop(project_id, None)
+        
+        if changed or removed:
+            self.invalidate_cache("projects", "stats")
+        return ProjectSync(changed=changed, removed=removed, full=full, high_water_mark=self.high_water_mark)
+
+    @property
+    def high_water_mark(self) -> Optional[datetime]:
+        """Newest project updated_at seen by this client.
+        
+        Returns:
+            High-water mark, or None before the first projects are seen
+        """
+        return self._high_water_mark
+
+    def _advance_high_water_mark(self, projects: List[Project]) -> None:
+        """Move the high-water mark past the given projects.
+        
+        Args:
+            projects: Projects that have been seen
+        """
+        for project in projects:
+            if self._high_water_mark is None or project.updated_at > self._high_water_mark:
+                self._high_water_mark = project.updated_at
+
+    def _merge_projects(self, projects: List[Project]) -> List[Project]:
+        """Merge fetched projects into the local id-indexed store.
+        
+        Args:
+            projects: Projects fetched from the API
+            
+        Returns:
+            Projects that were new or changed
+        """
+        changed = []
+        for project in projects:
+            known = self._projects.record(project.id)
+            if known is not None and known.updated_at > project.updated_at:
+                # Never let an older response overwrite a newer one
+                continue
+            if known is None or known.updated_at != project.updated_at or known.status != project.status:
+                self._projects[project.id] = project
+                self._segment_scores.pop(project.id, None)
+                changed.append(project)
+        self._advance_high_water_mark(projects)
+        return changed
+
     async def get_project_segments(
         self, project_id: str, file_id: Optional[str] = None
     ) -> List[Segment]:
-        """Get segments for a project.
+        """Get all segments for a project.
+        
+        Prefer get_segment_window or iter_segments for large projects; this
+        loads every segment.
         
         Args:
             project_id: Project ID
@@ -484,13 +971,181 @@ class StrakerVerifyClient:
         Raises:
             ValueError: If project not found
         """
-        await asyncio.sleep(0.1)  # Simulate API call
+        segments = []
+        async for page in self.iter_segments(project_id, file_id=file_id):
+            segments.extend(page)
+        return segments
+
+    async def iter_segments(
+        self,
+        project_id: str,
+        file_id: Optional[str] = None,
+        page_size: int = SEGMENT_PAGE_SIZE,
+    ) -> AsyncIterator[List[Segment]]:
+        """Iterate over a project's segments one page at a time.
+        
+        Args:
+            project_id: Project ID
+            file_id: Optional file ID to filter segments
+            page_size: Segments per page
+            
+        Yields:
+            Pages of segments, in order
+            
+        Raises:
+            ValueError: If project not found
+        """
+        offset = 0
+        while True:
+            page = await self.get_segment_page(project_id, file_id=file_id, offset=offset, limit=page_size)
+            if page.segments:
+                yield page.segments
+            offset += len(page.segments)
+            if not page.segments or offset >= page.total:
+                return
+
+    async def get_segment_window(
+        self,
+        project_id: str,
+        start: int,
+        count: int,
+        file_id: Optional[str] = None,
+        page_size: int = SEGMENT_PAGE_SIZE,
+    ) -> SegmentPage:
+        """Get the segments in a window, e.g. the rows around a viewport.
+        
+        The window is fetched as the page-aligned pages that cover it, so
+        scrolling back and forth is served from the LRU of recently viewed
+        pages instead of refetching.
+        
+        Args:
+            project_id: Project ID
+            start: Index of the first segment wanted
+            count: Number of segments wanted
+            file_id: Optional file ID to filter segments
+            page_size: Segments per page
+            
+        Returns:
+            Segments in the window (fewer at the end of the list) and the total
+            
+        Raises:
+            ValueError: If project not found
+        """
+        start = max(0, start)
+        first = start // page_size * page_size
+        offsets = range(first, start + max(count, 1), page_size)
+        pages = await asyncio.gather(*(
+            self.get_segment_page(project_id, file_id=file_id, offset=offset, limit=page_size)
+            for offset in offsets
+        ))
+        
+        segments = [segment for page in pages for segment in page.segments]
+        skip = start - first
+        return SegmentPage(
+            segments=segments[skip:skip + count],
+            offset=start,
+            total=pages[-1].total,
+        )
+
+    @cached("segments", cache_attr="_segment_cache")
+    @coalesced("segments")
+    async def get_segment_page(
+        self,
+        project_id: str,
+        file_id: Optional[str] = None,
+        offset: int = 0,
+        limit: int = SEGMENT_PAGE_SIZE,
+    ) -> SegmentPage:
+        """Get one page of a project's segments.
+        
+        The last SEGMENT_CACHE_SIZE pages viewed are kept in their own LRU,
+        for the "segments" endpoint TTL, whether or not response caching is
+        enabled.
+        
+        Args:
+            project_id: Project ID
+            file_id: Optional file ID to filter segments
+            offset: Index of the first segment
+            limit: Maximum number of segments
+            
+        Returns:
+            Page of segments
+            
+        Raises:
+            ValueError: If project not found
+        """
+        if self.use_real_api:
+            params: Dict[str, Any] = {"offset": offset, "limit": limit}
+            if file_id:
+                params["file_id"] = file_id
+            try:
+                response = await self._request(
+                    "GET", f"/v1/projects/{project_id}/segments", params=params
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    raise ValueError(f"Project {project_id} not found") from e
+                raise
+            data = decode_json(response.content)
+            segments = parse_segments(data.get("segments", []))
+            return SegmentPage(
+                segments=segments,
+                offset=offset,
+                total=data.get("total", offset + len(segments)),
+            )
+        
+        # Mock mode
+        await self._mock.delay()  # Simulate API call
         
         if project_id not in self._projects:
             raise ValueError(f"Project {project_id} not found")
         
-        project = self._projects[project_id]
-        return project.segments
+        # Generated segments come first, then any added by uploads
+        generated = self._mock.segment_count(project_id, file_id)
+        page = self._mock.segments(project_id, offset, limit, file_id)
+        
+        segments = self._projects.record(project_id).segments
+        if file_id:
+            segments = [s for s in segments if s.file_id == file_id]
+        start = max(0, offset - generated)
+        page.extend(segments[start:start + limit - len(page)])
+        return SegmentPage(
+            segments=page,
+            offset=offset,
+            total=generated + len(segments),
+        )
+
+    async def get_segment_scores(self, project_id: str) -> SegmentScores:
+        """Get a project's per-segment quality scores in columnar form.
+        
+        The store is built once, by streaming the project's segment pages
+        without keeping the segments, and reused until the project's segments
+        change.
+        
+        Args:
+            project_id: Project ID
+            
+        Returns:
+            Columnar segment scores
+            
+        Raises:
+            ValueError: If project not found
+        """
+        scores = self._segment_scores.get(project_id)
+        if scores is None:
+            if self.use_real_api:
+                scores = SegmentScores()
+                async for page in self.iter_segments(project_id):
+                    scores.extend(segment.quality_score for segment in page)
+            elif project_id in self._projects:
+                scores = SegmentScores()
+                for page in self._mock.iter_segments(project_id):
+                    scores.extend(segment.quality_score for segment in page)
+                scores.extend(segment.quality_score for segment in self._projects.record(project_id).segments)
+            else:
+                raise ValueError(f"Project {project_id} not found")
+            self._segment_scores[project_id] = scores
+        return scores
 
     async def request_human_verification(self, project_id: str) -> Project:
         """Request human verification for a project.
@@ -504,7 +1159,7 @@ class StrakerVerifyClient:
         Raises:
             ValueError: If project not found
         """
-        await asyncio.sleep(0.2)  # Simulate API call
+        await self._mock.delay(2)  # Simulate API call
         
         if project_id not in self._projects:
             raise ValueError(f"Project {project_id} not found")
@@ -516,93 +1171,267 @@ class StrakerVerifyClient:
         # Simulate quality improvement after human verification
         if project.quality_score:
             project.quality_score.overall = min(100, project.quality_score.overall + 5)
+        self._projects.put(project)
         
+        self.invalidate_cache("projects", "project", "stats", "balance")
         return project
 
-    async def download_file(self, file_id: str, output_path: Path) -> None:
+    async def download_file(
+        self,
+        file_id: str,
+        output_path: Path,
+        progress: Optional[ProgressCallback] = None,
+        expected_sha256: Optional[str] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
         """Download a file.
         
+        The file is streamed to a ``.part`` file next to output_path in
+        chunks, so memory use stays flat regardless of file size, and renamed
+        into place only once complete. An interrupted download is resumed
+        with an HTTP Range request, both on retry and on the next call, as
+        long as If-Range confirms the file hasn't changed on the server.
+        
         Args:
             file_id: File ID
             output_path: Path to save the file
+            progress: Called with (bytes downloaded, total bytes if known)
+            expected_sha256: Hex SHA-256 to verify; defaults to the checksum
+                advertised by the server, if any
+            chunk_size: Bytes per chunk
+            
+        Raises:
+            ValueError: If the downloaded file fails checksum verification
+            httpx.HTTPError: If the download fails
         """
-        if self.use_real_api:
-            # Real API call
-            try:
-                response = await self.http_client.get(f"/v1/files/{file_id}/download")
-                response.raise_for_status()
-                output_path.write_bytes(response.content)
-                return
-            except httpx.HTTPError:
-                pass
+        if not self.use_real_api:
+            # Mock mode
+            await self._mock.delay(3)  # Simulate download
+            content = b"Sample translated content"
+            output_path.write_bytes(content)
+            if progress:
+                progress(len(content), len(content))
+            return
         
-        # Mock mode or fallback
-        await asyncio.sleep(0.3)  # Simulate download
-        output_path.write_text("Sample translated content")
-    
+        partial = part_path(output_path)
+        trial = self.circuit_breaker.before_request()
+        
+        try:
+            attempt = 0
+            while True:
+                try:
+                    checksum = await self._download_to_part(file_id, partial, progress, chunk_size)
+                    break
+                except httpx.HTTPError as e:
+                    response = e.response if isinstance(e, httpx.HTTPStatusError) else None
+                    if response is None:
+                        self.metrics.record_transport_error(e)
+                    if response is not None and response.status_code not in RETRY_STATUSES:
+                        self.circuit_breaker.record_success()
+                        raise
+                    if not self.retry_policy.should_retry(attempt, response):
+                        self.circuit_breaker.record_failure()
+                        raise
+                    # Bytes already written are kept; the next attempt resumes
+                    delay = self.retry_policy.delay(attempt, response)
+                    self.metrics.record_retry("GET", f"/v1/files/{file_id}/download", delay)
+                    await asyncio.sleep(delay)
+                    attempt += 1
+            self.circuit_breaker.record_success()
+        finally:
+            if trial:
+                self.circuit_breaker.release_trial()
+        
+        expected = (expected_sha256 or checksum or "").lower()
+        if expected:
+            hasher = hashlib.sha256()
+            await hash_file(partial, hasher, chunk_size)
+            if hasher.hexdigest() != expected:
+                partial.unlink()
+                validator_path(partial).unlink(missing_ok=True)
+                raise ValueError(f"Checksum mismatch downloading file {file_id}")
+        
+        os.replace(partial, output_path)
+        validator_path(partial).unlink(missing_ok=True)
+
+    async def _download_to_part(
+        self,
+        file_id: str,
+        partial: Path,
+        progress: Optional[ProgressCallback],
+        chunk_size: int,
+    ) -> Optional[str]:
+        """Stream a download into a partial file, resuming from its current size.
+        
+        A partial file is only resumed with If-Range and the ETag or
+        Last-Modified it was fetched at (stored next to it), so a file that
+        changed on the server is downloaded again from the start instead of
+        being spliced onto old bytes.
+        
+        Args:
+            file_id: File ID
+            partial: Partial file to append to
+            progress: Progress callback
+            chunk_size: Bytes per chunk
+            
+        Returns:
+            Checksum advertised by the server, if any
+            
+        Raises:
+            httpx.HTTPError: If the request or stream fails
+        """
+        validator_file = validator_path(partial)
+        offset = partial.stat().st_size if partial.exists() else 0
+        validator = validator_file.read_text().strip() if offset and validator_file.exists() else ""
+        # Without a validator the partial file can't be trusted; start over
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator} if validator else {}
+        
+        async with self.http_client.stream(
+            "GET", f"/v1/files/{file_id}/download", headers=headers
+        ) as response:
+            if response.status_code == 416 and headers:
+                if unsatisfied_range_total(response) == offset:
+                    # The partial file already holds the whole download
+                    return response_sha256(response)
+                # The file no longer matches what was downloaded; start over
+                partial.unlink()
+                validator_file.unlink(missing_ok=True)
+                return await self._download_to_part(file_id, partial, progress, chunk_size)
+            response.raise_for_status()
+            
+            if response.status_code != 206:
+                # Range ignored, or If-Range found the file changed
+                offset = 0
+                validator = response_validator(response) or ""
+                if validator:
+                    validator_file.write_text(validator)
+                else:
+                    validator_file.unlink(missing_ok=True)
+            total = content_total(response, offset)
+            
+            async with aiofiles.open(partial, "ab" if offset else "wb") as f:
+                done = offset
+                async for chunk in response.aiter_bytes(chunk_size):
+                    await f.write(chunk)
+                    done += len(chunk)
+                    if progress:
+                        progress(done, total)
+            
+            return response_sha256(response)
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request to the real API with retries and a circuit breaker.
+        
+        Idempotent requests are retried on transport errors and transient
+        status codes with jittered exponential backoff, honoring Retry-After.
+        Repeated failures open the circuit breaker so further calls fail fast
+        instead of piling onto a struggling backend.
+        
+        Args:
+            method: HTTP method
+            path: Request path
+            **kwargs: Additional arguments for httpx.AsyncClient.request
+            
+        Returns:
+            Successful response
+            
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            httpx.HTTPError: If the request ultimately fails
+        """
+        trial = self.circuit_breaker.before_request()
+        retryable = method.upper() in IDEMPOTENT_METHODS
+        
+        try:
+            attempt = 0
+            while True:
+                response: Optional[httpx.Response] = None
+                try:
+                    response = await self.http_client.request(method, path, **kwargs)
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    if response is None:
+                        self.metrics.record_transport_error(e)
+                    if response is not None and response.status_code not in RETRY_STATUSES:
+                        # The backend is healthy; the request itself was bad
+                        self.circuit_breaker.record_success()
+                        raise
+                    if not retryable or not self.retry_policy.should_retry(attempt, response):
+                        self.circuit_breaker.record_failure()
+                        raise
+                
+                    delay = self.retry_policy.delay(attempt, response)
+                    self.metrics.record_retry(method, path, delay)
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+            
+                self.circuit_breaker.record_success()
+                return response
+        finally:
+            if trial:
+                self.circuit_breaker.release_trial()
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """Get request metrics recorded so far, including cache hit ratio.
+        
+        Returns:
+            JSON-serializable metrics (see ClientMetrics.snapshot)
+        """
+        return self.metrics.snapshot(cache=self._cache)
+
+    def invalidate_cache(self, *endpoints: str) -> None:
+        """Drop cached responses.
+        
+        Args:
+            *endpoints: Endpoint names to drop (e.g. "projects"); drops all if empty
+        """
+        if self._cache is not None:
+            self._cache.invalidate(*endpoints)
+        if not endpoints or "segments" in endpoints:
+            self._segment_cache.invalidate()
+
     async def close(self) -> None:
-        """Close the HTTP client connection."""
-        if self.use_real_api and hasattr(self, 'http_client'):
+        """Close the HTTP client connection pool."""
+        if self.use_real_api and hasattr(self, 'http_client') and not self.http_client.is_closed:
             await self.http_client.aclose()
 
+    def _local_stats(self) -> Optional[ProjectStats]:
+        """Compute statistics from the projects synced so far.
+        
+        Used when the API is unavailable and no stats are cached. Only the
+        pages loaded so far are counted, so the result is a lower bound.
+        
+        Returns:
+            Project statistics, or None if no projects are known
+        """
+        return self._projects.stats() if self._projects else None
+
+    @cached("stats", fallback=_local_stats)
+    @coalesced("stats")
     async def get_stats(self) -> ProjectStats:
         """Get project statistics.
         
+        If the API is unavailable, the last cached stats are served, or
+        failing that stats computed from the projects synced so far.
+        
         Returns:
             Project statistics
         """
         if self.use_real_api:
             # Real API call
-            try:
-                response = await self.http_client.get("/v1/stats")
-                response.raise_for_status()
-                data = response.json()
-                
-                return ProjectStats(
-                    total_projects=data.get("total_projects", 0),
-                    active_projects=data.get("active_projects", 0),
-                    completed_projects=data.get("completed_projects", 0),
-                    failed_projects=data.get("failed_projects", 0),
-                    total_files=data.get("total_files", 0),
-                    average_quality=data.get("average_quality"),
-                )
-            except httpx.HTTPError:
-                # Fall back to calculating from projects list
-                projects = await self.list_projects()
-                completed = [p for p in projects if p.status == ProjectStatus.COMPLETE]
-                
-                avg_quality = None
-                if completed:
-                    quality_scores = [p.quality_score.overall for p in completed if p.quality_score]
-                    if quality_scores:
-                        avg_quality = sum(quality_scores) / len(quality_scores)
-                
-                return ProjectStats(
-                    total_projects=len(projects),
-                    active_projects=len([p for p in projects if p.status == ProjectStatus.PROCESSING]),
-                    completed_projects=len(completed),
-                    failed_projects=len([p for p in projects if p.status == ProjectStatus.FAILED]),
-                    total_files=sum(len(p.files) for p in projects),
-                    average_quality=avg_quality,
-                )
-        else:
-            # Mock mode
-            await asyncio.sleep(0.1)  # Simulate API call
-            
-            projects = list(self._projects.values())
-            completed = [p for p in projects if p.status == ProjectStatus.COMPLETE]
-            
-            avg_quality = None
-            if completed:
-                quality_scores = [p.quality_score.overall for p in completed if p.quality_score]
-                if quality_scores:
-                    avg_quality = sum(quality_scores) / len(quality_scores)
+            response = await self._request("GET", "/v1/stats")
+            data = decode_json(response.content)
             
             return ProjectStats(
-                total_projects=len(projects),
-                active_projects=len([p for p in projects if p.status == ProjectStatus.PROCESSING]),
-                completed_projects=len(completed),
-                failed_projects=len([p for p in projects if p.status == ProjectStatus.FAILED]),
-                total_files=sum(len(p.files) for p in projects),
-                average_quality=avg_quality,
-            )
\ No newline at end of file
+                total_projects=data.get("total_projects", 0),
+                active_projects=data.get("active_projects", 0),
+                completed_projects=data.get("completed_projects", 0),
+                failed_projects=data.get("failed_projects", 0),
+                total_files=data.get("total_files", 0),
+                average_quality=data.get("average_quality"),
+            )
+        else:
+            # Mock mode
+            await self._mock.delay()  # Simulate API call
+            return self._projects.stats()
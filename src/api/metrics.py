@@ -0,0 +1,349 @@
+"""Request instrumentation for the Straker Verify API client.
+
+ClientMetrics plugs into httpx event hooks and records, per endpoint, a
+latency histogram, bytes sent and received, status codes, errors and retries.
+Latency is measured to the response headers; bytes received are counted from
+the body as it streams, so compressed, chunked and partially read responses
+are measured too. Every response is logged as a structured JSON line once its
+body is closed (see utils.log.setup_logging), and snapshot() returns
+everything recorded so far.
+
+Summarize a log file from the command line with:
+    python -m src.api.metrics straker_verify_dashboard.log*
+"""
+
+import json
+import logging
+import statistics
+import sys
+import time
+from collections import Counter, deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional
+
+import httpx
+
+
+logger = logging.getLogger("straker_verify.http")
+# Stay silent until setup_logging adds a handler; stderr would corrupt the TUI
+logger.addHandler(logging.NullHandler())
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Latencies kept per endpoint for percentiles
+SAMPLE_WINDOW = 1000
+
+# Path segments that name a sub-resource rather than an ID
+RESOURCE_NAMES = {"segments", "files", "uploads", "download", "complete", "balance", "stats"}
+
+
+def endpoint_name(method: str, path: str) -> str:
+    """Name the endpoint a request hits, with IDs replaced by placeholders.
+
+    Args:
+        method: HTTP method
+        path: Request path
+
+    Returns:
+        Endpoint name, e.g. "GET /v1/projects/{id}"
+    """
+    parts = path.strip("/").split("/")
+    for index in range(1, len(parts)):
+        if parts[index - 1] in {"projects", "files", "uploads"} and parts[index] not in RESOURCE_NAMES:
+            parts[index] = "{id}"
+    return f"{method.upper()} /{'/'.join(parts)}"
+
+
+def percentile(samples: List[float], q: float) -> Optional[float]:
+    """Get a percentile of latency samples.
+
+    Args:
+        samples: Samples
+        q: Percentile between 0 and 100
+
+    Returns:
+        The percentile, or None without samples
+    """
+    if not samples:
+        return None
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[max(0, min(98, round(q) - 1))]
+
+
+class EndpointMetrics:
+    """Counters and latency histogram for one endpoint."""
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.status_codes: Counter = Counter()
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.samples: Deque[float] = deque(maxlen=SAMPLE_WINDOW)
+
+    def record(self, latency_ms: float) -> None:
+        """Record one request's latency.
+
+        Args:
+            latency_ms: Latency in milliseconds
+        """
+        self.requests += 1
+        self.samples.append(latency_ms)
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarize the endpoint.
+
+        Returns:
+            Counters, percentiles and histogram
+        """
+        samples = sorted(self.samples)
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items())},
+            "p50_ms": percentile(samples, 50),
+            "p95_ms": percentile(samples, 95),
+            "max_ms": samples[-1] if samples else None,
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+class MeteredStream(httpx.AsyncByteStream):
+    """Response body stream that counts the bytes read from the wire."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[int], None]):
+        """Wrap a response stream.
+
+        Args:
+            stream: Original response stream
+            on_close: Called once, with the number of bytes read, when the
+                stream is closed
+        """
+        self._stream = stream
+        self._on_close: Optional[Callable[[int], None]] = on_close
+        self.bytes_read = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close(self.bytes_read)
+
+
+class ClientMetrics:
+    """Collects request metrics through httpx event hooks."""
+
+    def __init__(self):
+        """Initialize with nothing recorded."""
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        self.in_flight = 0
+        self.started = time.monotonic()
+
+    def endpoint(self, name: str) -> EndpointMetrics:
+        """Get the metrics for an endpoint, creating them on first use.
+
+        Args:
+            name: Endpoint name
+
+        Returns:
+            Endpoint metrics
+        """
+        metrics = self.endpoints.get(name)
+        if metrics is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    @property
+    def event_hooks(self) -> Dict[str, list]:
+        """Event hooks to pass to httpx.AsyncClient.
+
+        Returns:
+            Hooks by event name
+        """
+        return {"request": [self.on_request], "response": [self.on_response]}
+
+    async def on_request(self, request: httpx.Request) -> None:
+        """Note when a request starts.
+
+        Args:
+            request: Outgoing request
+        """
+        request.extensions["metrics_started"] = time.perf_counter()
+        self.in_flight += 1
+
+    async def on_response(self, response: httpx.Response) -> None:
+        """Record a response once its headers arrive.
+
+        Bytes received are added, and the request logged, when the body is
+        closed.
+
+        Args:
+            response: Incoming response
+        """
+        request = response.request
+        started = request.extensions.get("metrics_started", time.perf_counter())
+        latency_ms = (time.perf_counter() - started) * 1000
+        request.extensions["metrics_done"] = True
+        self.in_flight = max(0, self.in_flight - 1)
+
+        name = endpoint_name(request.method, request.url.path)
+        metrics = self.endpoint(name)
+        metrics.record(latency_ms)
+        metrics.status_codes[response.status_code] += 1
+        if response.status_code >= 400:
+            metrics.errors += 1
+        sent = int(request.headers.get("Content-Length") or 0)
+        metrics.bytes_sent += sent
+
+        def on_close(received: int) -> None:
+            metrics.bytes_received += received
+            logger.info("http_request", extra={"fields": {
+                "endpoint": name,
+                "status": response.status_code,
+                "latency_ms": round(latency_ms, 2),
+                "bytes_sent": sent,
+                "bytes_received": received,
+            }})
+
+        response.stream = MeteredStream(response.stream, on_close)
+
+    def record_transport_error(self, error: httpx.HTTPError) -> None:
+        """Record a connection, timeout or streaming failure.
+
+        Args:
+            error: The transport error
+        """
+        try:
+            request = error.request
+        except RuntimeError:
+            return
+        if not request.extensions.get("metrics_done"):
+            # Failed before any response arrived
+            self.in_flight = max(0, self.in_flight - 1)
+        name = endpoint_name(request.method, request.url.path)
+        self.endpoint(name).errors += 1
+        logger.warning("http_error", extra={"fields": {"endpoint": name, "error": repr(error)}})
+
+    def record_retry(self, method: str, path: str, delay: float) -> None:
+        """Record that a request is about to be retried.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            delay: Seconds until the retry
+        """
+        name = endpoint_name(method, path)
+        self.endpoint(name).retries += 1
+        logger.info("http_retry", extra={"fields": {"endpoint": name, "delay_s": round(delay, 3)}})
+
+    def snapshot(self, cache: Optional[Any] = None) -> Dict[str, Any]:
+        """Summarize everything recorded so far.
+
+        Args:
+            cache: Response cache to report hit ratio for, if any
+
+        Returns:
+            JSON-serializable metrics
+        """
+        endpoints = {name: metrics.snapshot() for name, metrics in sorted(self.endpoints.items())}
+        snapshot: Dict[str, Any] = {
+            "uptime_s": round(time.monotonic() - self.started, 1),
+            "in_flight": self.in_flight,
+            "requests": sum(e["requests"] for e in endpoints.values()),
+            "errors": sum(e["errors"] for e in endpoints.values()),
+            "retries": sum(e["retries"] for e in endpoints.values()),
+            "endpoints": endpoints,
+        }
+        if cache is not None:
+            snapshot["cache"] = {
+                "entries": len(cache),
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "hit_ratio": cache.hit_ratio,
+            }
+        return snapshot
+
+
+def summarize_log(lines: Iterable[str]) -> Dict[str, Any]:
+    """Rebuild per-endpoint metrics from JSON log lines.
+
+    Args:
+        lines: Lines of a LOG_FILE (and its rotated backups)
+
+    Returns:
+        Per-endpoint summaries, as in ClientMetrics.snapshot
+    """
+    metrics = ClientMetrics()
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        name = entry.get("endpoint")
+        if not name:
+            continue
+        endpoint = metrics.endpoint(name)
+        if entry.get("event") == "http_request":
+            endpoint.record(entry["latency_ms"])
+            endpoint.status_codes[entry["status"]] += 1
+            endpoint.errors += entry["status"] >= 400
+            endpoint.bytes_sent += entry.get("bytes_sent", 0)
+            endpoint.bytes_received += entry.get("bytes_received", 0)
+        elif entry.get("event") == "http_retry":
+            endpoint.retries += 1
+        elif entry.get("event") == "http_error":
+            endpoint.errors += 1
+    return {name: endpoint.snapshot() for name, endpoint in sorted(metrics.endpoints.items())}
+
+
+def main(argv: List[str]) -> int:
+    """Print a per-endpoint latency summary of log files.
+
+    Args:
+        argv: Command-line arguments (log file paths)
+
+    Returns:
+        Exit code
+    """
+    if not argv:
+        print("Usage: python -m src.api.metrics LOG_FILE [LOG_FILE ...]", file=sys.stderr)
+        return 2
+
+    def lines() -> Iterable[str]:
+        for path in argv:
+            with open(path, encoding="utf-8") as f:
+                yield from f
+
+    summary = summarize_log(lines())
+
+    print(f"{'endpoint':<40} {'reqs':>6} {'errs':>5} {'retry':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name, endpoint in sorted(summary.items(), key=lambda item: -(item[1]["p95_ms"] or 0)):
+        print(
+            f"{name:<40} {endpoint['requests']:>6} {endpoint['errors']:>5} {endpoint['retries']:>5} "
+            f"{endpoint['p50_ms'] or 0:>8.1f} {endpoint['p95_ms'] or 0:>8.1f} {endpoint['max_ms'] or 0:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
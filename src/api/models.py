@@ -61,6 +61,7 @@ class Segment(BaseModel):
     """Translation segment model."""
 
     id: str = Field(..., description="Segment ID")
+    file_id: Optional[str] = Field(default=None, description="ID of the file the segment came from")
     source_text: str = Field(..., description="Source text")
     target_text: str = Field(..., description="Target text")
     quality_score: Optional[QualityScore] = Field(
@@ -69,6 +70,14 @@ class Segment(BaseModel):
     issues: List[str] = Field(default_factory=list, description="List of issues")
 
 
+class SegmentPage(BaseModel):
+    """One page of a project's segments."""
+
+    segments: List[Segment] = Field(default_factory=list, description="Segments in this page")
+    offset: int = Field(..., description="Index of the first segment in this page")
+    total: int = Field(..., description="Total number of segments matching the query")
+
+
 class FileInfo(BaseModel):
     """File information model."""
 
@@ -169,4 +178,25 @@ class ProjectStats(BaseModel):
     total_files: int = Field(default=0, description="Total number of files processed")
     average_quality: Optional[float] = Field(
         None, ge=0, le=100, description="Average quality score"
-    )
\ No newline at end of file
+    )
+
+
+class ProjectPage(BaseModel):
+    """One page of the /v1/projects listing, as sent by the API."""
+
+    projects: List[Project] = Field(default_factory=list, description="Projects in this page")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page")
+    deleted_ids: List[str] = Field(
+        default_factory=list, description="IDs of projects deleted since updated_since"
+    )
+
+
+class ProjectSync(BaseModel):
+    """Result of a delta project sync."""
+
+    changed: List[Project] = Field(default_factory=list, description="New or updated projects")
+    removed: List[str] = Field(default_factory=list, description="IDs of deleted projects")
+    full: bool = Field(default=False, description="Whether a full listing was diffed")
+    high_water_mark: Optional[datetime] = Field(
+        None, description="Newest updated_at seen after this sync"
+    )
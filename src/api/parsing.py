@@ -0,0 +1,90 @@
+"""Decoding of Straker Verify API payloads into models.
+
+Payloads are validated once, here at the API boundary, by pydantic-core.
+Project list pages are validated straight from the raw response bytes; other
+responses are decoded with orjson when it is installed.
+"""
+
+import json
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from .models import FileInfo, Project, ProjectPage, Segment
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# JSON decoder for responses that aren't validated from bytes; replaceable
+json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# Validates a whole list of segments in one call into pydantic-core
+SEGMENT_LIST = TypeAdapter(List[Segment])
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a JSON response body.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Decoded JSON
+    """
+    return json_loads(content)
+
+
+def parse_project_page(content: bytes) -> ProjectPage:
+    """Parse a /v1/projects response body directly from bytes.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Page of projects
+    """
+    return ProjectPage.model_validate_json(content)
+
+
+def parse_segments(items: List[Dict[str, Any]]) -> List[Segment]:
+    """Parse a list of segment objects in a single validation pass.
+
+    Args:
+        items: Segment JSON objects
+
+    Returns:
+        Segments
+    """
+    return SEGMENT_LIST.validate_python(items)
+
+
+def parse_file_info(data: Dict[str, Any]) -> FileInfo:
+    """Parse a file object.
+
+    Args:
+        data: File JSON
+
+    Returns:
+        File information
+    """
+    return FileInfo.model_validate(data)
+
+
+def parse_project(data: Dict[str, Any]) -> Project:
+    """Parse a project object, from either a list page or the detail endpoint.
+
+    Segments are never taken from project payloads; they are loaded
+    separately, page by page.
+
+    Args:
+        data: Project JSON
+
+    Returns:
+        Project
+    """
+    if data.get("segments"):
+        data = {key: value for key, value in data.items() if key != "segments"}
+    return Project.model_validate(data)
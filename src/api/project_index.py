@@ -0,0 +1,141 @@
+"""Id-indexed project store with running statistics.
+
+Keeps the counters behind ProjectStats up to date as projects are inserted,
+replaced and removed, so statistics never need a pass over every project.
+"""
+
+from collections import Counter
+from typing import Dict, Iterator, MutableMapping, Optional, ValuesView
+
+from .models import Project, ProjectStats, ProjectStatus
+from .records import ProjectRecord
+
+
+class ProjectIndex(MutableMapping[str, Project]):
+    """Mapping of project ID to project that maintains ProjectStats incrementally.
+
+    Projects are held as compact ProjectRecord tuples. Reading one builds a
+    new Project, so after changing it, store it again (``index[p.id] = p``
+    or ``put``) to update the index and its statistics. Use ``record`` and
+    ``records`` to read stored fields without building models.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._projects: Dict[str, ProjectRecord] = {}
+        self._status_counts: Counter = Counter()
+        self._total_files = 0
+        self._quality_sum = 0.0
+        self._quality_count = 0
+
+    def __getitem__(self, project_id: str) -> Project:
+        return self._projects[project_id].to_project()
+
+    def __setitem__(self, project_id: str, project: Project) -> None:
+        record = ProjectRecord.from_project(project)
+        previous = self._projects.get(project_id)
+        if previous is not None:
+            self._retract(previous)
+        self._projects[project_id] = record
+        self._record(record)
+
+    def __delitem__(self, project_id: str) -> None:
+        self._retract(self._projects.pop(project_id))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._projects)
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def __contains__(self, project_id: object) -> bool:
+        return project_id in self._projects
+
+    def record(self, project_id: str) -> Optional[ProjectRecord]:
+        """Get a stored project's record without building a model.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Project record, or None if not stored
+        """
+        return self._projects.get(project_id)
+
+    def records(self) -> ValuesView[ProjectRecord]:
+        """Get every stored project's record without building models.
+
+        Returns:
+            View of the project records
+        """
+        return self._projects.values()
+
+    def put(self, project: Project) -> None:
+        """Insert or update a project, keyed by its ID.
+
+        Args:
+            project: Project to store
+        """
+        self[project.id] = project
+
+    def _record(self, record: ProjectRecord) -> None:
+        """Add a project's contribution to the running statistics.
+
+        Args:
+            record: Record being stored
+        """
+        self._status_counts[record.status] += 1
+        self._total_files += len(record.files)
+        quality = _quality(record)
+        if quality is not None:
+            self._quality_sum += quality
+            self._quality_count += 1
+
+    def _retract(self, record: ProjectRecord) -> None:
+        """Remove a stored project's contribution.
+
+        Args:
+            record: Record being replaced or removed
+        """
+        self._status_counts[record.status] -= 1
+        self._total_files -= len(record.files)
+        quality = _quality(record)
+        if quality is not None:
+            self._quality_sum -= quality
+            self._quality_count -= 1
+            if not self._quality_count:
+                self._quality_sum = 0.0
+
+    def stats(self) -> ProjectStats:
+        """Get statistics for the stored projects in constant time.
+
+        Returns:
+            Project statistics
+        """
+        average_quality = None
+        if self._quality_count:
+            # Clamp away float drift from repeated add/subtract
+            average_quality = min(100.0, max(0.0, self._quality_sum / self._quality_count))
+
+        return ProjectStats(
+            total_projects=len(self._projects),
+            active_projects=self._status_counts[ProjectStatus.PROCESSING],
+            completed_projects=self._status_counts[ProjectStatus.COMPLETE],
+            failed_projects=self._status_counts[ProjectStatus.FAILED],
+            total_files=self._total_files,
+            average_quality=average_quality,
+        )
+
+
+def _quality(record: ProjectRecord) -> Optional[float]:
+    """Get the quality a project contributes to the average.
+
+    Args:
+        record: Project record
+
+    Returns:
+        Overall quality of a scored, completed project, otherwise None
+    """
+    if record.status == ProjectStatus.COMPLETE and record.quality:
+        return record.quality.overall
+    return None
@@ -0,0 +1,138 @@
+"""Compact in-memory records of projects.
+
+Projects are validated into pydantic models once, when a response is parsed.
+Long-lived collections (the client's project index, the dashboard list and
+its snapshot) keep these tuples instead, and only build a model again when
+one is asked for.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .models import FileInfo, Project, ProjectStatus, QualityScore, Segment
+
+
+class QualityRecord(NamedTuple):
+    """Quality score fields of a stored project."""
+
+    overall: float
+    accuracy: Optional[float]
+    fluency: Optional[float]
+    terminology: Optional[float]
+    style: Optional[float]
+
+
+class FileRecord(NamedTuple):
+    """File fields of a stored project."""
+
+    id: str
+    name: str
+    size: int
+    mime_type: Optional[str]
+    uploaded_at: Optional[datetime]
+    download_url: Optional[str]
+
+
+class ProjectRecord(NamedTuple):
+    """Every field of a project, without per-instance model overhead."""
+
+    id: str
+    name: str
+    description: Optional[str]
+    source_language: str
+    target_language: str
+    status: ProjectStatus
+    quality: Optional[QualityRecord]
+    files: Tuple[FileRecord, ...]
+    segments: Tuple[Segment, ...]
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime]
+    human_verified: bool
+    metadata: Optional[Dict[str, Any]]
+
+    @classmethod
+    def from_project(cls, project: Project) -> "ProjectRecord":
+        """Build a record from a validated project.
+
+        Args:
+            project: Project to store
+
+        Returns:
+            Project record
+        """
+        score = project.quality_score
+        return cls(
+            id=project.id,
+            name=project.name,
+            description=project.description,
+            source_language=project.source_language,
+            target_language=project.target_language,
+            status=project.status,
+            quality=QualityRecord(
+                score.overall, score.accuracy, score.fluency, score.terminology, score.style
+            ) if score else None,
+            files=tuple(
+                FileRecord(f.id, f.name, f.size, f.mime_type, f.uploaded_at, f.download_url)
+                for f in project.files
+            ),
+            segments=tuple(project.segments),
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+            completed_at=project.completed_at,
+            human_verified=project.human_verified,
+            metadata=dict(project.metadata) if project.metadata else None,
+        )
+
+    def to_project(self) -> Project:
+        """Build a new project from the record without validating it again.
+
+        Returns:
+            Project (changes to it don't affect the record)
+        """
+        return Project.model_construct(
+            id=self.id,
+            name=self.name,
+            description=self.description,
+            source_language=self.source_language,
+            target_language=self.target_language,
+            status=self.status,
+            quality_score=QualityScore.model_construct(**self.quality._asdict()) if self.quality else None,
+            files=[FileInfo.model_construct(**f._asdict()) for f in self.files],
+            segments=list(self.segments),
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            completed_at=self.completed_at,
+            human_verified=self.human_verified,
+            metadata=dict(self.metadata) if self.metadata else {},
+        )
+
+
+class ProjectRow(NamedTuple):
+    """Compact row model holding only what a project card displays."""
+
+    id: str
+    name: str
+    status: str
+    language_pair: str
+    updated_at: datetime
+    quality: Optional[float]
+
+    @classmethod
+    def from_project(cls, project: Project) -> "ProjectRow":
+        """Build a row from a project.
+
+        Args:
+            project: Project to display
+
+        Returns:
+            Project row
+        """
+        return cls(
+            id=project.id,
+            name=project.name,
+            status=project.status.value,
+            language_pair=project.language_pair,
+            updated_at=project.updated_at,
+            quality=project.quality_score.overall if project.quality_score else None,
+        )
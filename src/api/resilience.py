@@ -0,0 +1,183 @@
+"""Retry and circuit breaker primitives for the real-API request path."""
+
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import httpx
+
+
+# Status codes worth retrying: rate limiting and transient server failures
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class RetryPolicy:
+    """Jittered exponential backoff with Retry-After support."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts: Total attempts per request, including the first
+            base_delay: Backoff for the first retry in seconds
+            max_delay: Upper bound on any single wait in seconds
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, attempt: int, response: Optional[httpx.Response] = None) -> bool:
+        """Check whether a failed attempt should be retried.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            response: Response received, or None for a transport error
+
+        Returns:
+            True if another attempt should be made
+        """
+        if attempt + 1 >= self.max_attempts:
+            return False
+        return response is None or response.status_code in RETRY_STATUSES
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Compute how long to wait before the next attempt.
+
+        Honors the server's Retry-After header when present, otherwise uses
+        full-jitter exponential backoff so clients don't retry in lockstep.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            response: Response received, or None for a transport error
+
+        Returns:
+            Delay in seconds
+        """
+        retry_after = parse_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """Stops sending requests to a backend that keeps failing.
+
+    After failure_threshold consecutive failures the circuit opens and
+    requests fail fast for reset_timeout seconds. Then a single trial request
+    is let through (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before a trial request
+            clock: Monotonic time source (overridable for testing)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current breaker state.
+
+        Returns:
+            One of CLOSED, OPEN or HALF_OPEN
+        """
+        if self.opened_at is None:
+            return self.CLOSED
+        if self._clock() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_request(self) -> bool:
+        """Check that a request may be sent.
+
+        Returns:
+            True if the request is the half-open trial; the caller must then
+            call release_trial() when it finishes, whatever the outcome
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                trial request already in flight
+        """
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._trial_in_flight):
+            raise CircuitOpenError("Straker Verify API unavailable; circuit breaker open")
+        if state == self.HALF_OPEN:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        """Free the half-open trial slot.
+
+        Needed when the trial ends without an outcome (e.g. it was cancelled);
+        otherwise the circuit would stay half-open and reject every request.
+        """
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
@@ -0,0 +1,241 @@
+"""Columnar store of per-segment quality scores.
+
+Scores are kept in one packed float column per dimension instead of one
+pydantic object per segment, so aggregating a project's quality is a handful
+of vectorized passes. NumPy is used when installed; otherwise the columns are
+plain ``array('d')`` buffers aggregated in Python.
+"""
+
+import math
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import QualityScore
+
+
+# Score columns, in QualityScore field order
+DIMENSIONS = ("overall", "accuracy", "fluency", "terminology", "style")
+
+# Missing scores are stored as NaN and ignored by every aggregate
+MISSING = math.nan
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Import NumPy on first use, so it doesn't slow down startup.
+
+    Returns:
+        The numpy module, or None if it isn't installed
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return numpy
+
+
+class SegmentScores:
+    """Per-segment quality scores stored as one float64 column per dimension."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._columns: Dict[str, array] = {name: array("d") for name in DIMENSIONS}
+
+    def append(self, score: Optional[QualityScore]) -> None:
+        """Add one segment's scores.
+
+        Args:
+            score: Segment quality score, or None if not scored yet
+        """
+        for name, column in self._columns.items():
+            value = getattr(score, name, None) if score is not None else None
+            column.append(MISSING if value is None else value)
+
+    def extend(self, scores: Iterable[Optional[QualityScore]]) -> None:
+        """Add many segments' scores.
+
+        Args:
+            scores: Segment quality scores
+        """
+        for score in scores:
+            self.append(score)
+
+    def __len__(self) -> int:
+        return len(self._columns["overall"])
+
+    def column(self, dimension: str = "overall") -> Sequence[float]:
+        """Get a copy of the column for a dimension, NaN where missing.
+
+        A copy rather than a view, so the store can keep growing while the
+        caller holds it (arrays can't be resized while a view exports them).
+
+        Args:
+            dimension: One of DIMENSIONS
+
+        Returns:
+            A NumPy array if NumPy is installed, else an array('d')
+
+        Raises:
+            ValueError: If the dimension is unknown
+        """
+        view = self._view(dimension)
+        return view.copy() if _numpy() is not None else array("d", view)
+
+    def _view(self, dimension: str) -> Sequence[float]:
+        """Get the column for a dimension without copying it.
+
+        The result must not outlive the calling method: while a NumPy view
+        exists, append() and extend() fail with BufferError.
+
+        Args:
+            dimension: One of DIMENSIONS
+
+        Returns:
+            A NumPy view of the column if NumPy is installed, else the array
+
+        Raises:
+            ValueError: If the dimension is unknown
+        """
+        if dimension not in self._columns:
+            raise ValueError(f"Unknown quality dimension {dimension}")
+        column = self._columns[dimension]
+        np = _numpy()
+        if np is not None:
+            return np.frombuffer(column, dtype=np.float64) if len(column) else np.empty(0)
+        return column
+
+    def _values(self, dimension: str):
+        """Get a dimension's scores with missing values dropped.
+
+        Args:
+            dimension: One of DIMENSIONS
+
+        Returns:
+            NumPy array or list of scores
+        """
+        column = self._view(dimension)
+        np = _numpy()
+        if np is not None:
+            # Boolean indexing copies, so no view escapes
+            return column[~np.isnan(column)]
+        return [value for value in column if not math.isnan(value)]
+
+    def count(self, dimension: str = "overall") -> int:
+        """Count segments with a score for a dimension.
+
+        Args:
+            dimension: One of DIMENSIONS
+
+        Returns:
+            Number of scored segments
+        """
+        return len(self._values(dimension))
+
+    def mean(self, dimension: str = "overall") -> Optional[float]:
+        """Average score for a dimension.
+
+        Args:
+            dimension: One of DIMENSIONS
+
+        Returns:
+            Mean score, or None if no segment is scored
+        """
+        values = self._values(dimension)
+        if not len(values):
+            return None
+        np = _numpy()
+        if np is not None:
+            return float(values.mean())
+        return math.fsum(values) / len(values)
+
+    def min_max(self, dimension: str = "overall") -> Optional[Tuple[float, float]]:
+        """Lowest and highest score for a dimension.
+
+        Args:
+            dimension: One of DIMENSIONS
+
+        Returns:
+            (min, max), or None if no segment is scored
+        """
+        values = self._values(dimension)
+        if not len(values):
+            return None
+        np = _numpy()
+        if np is not None:
+            return float(values.min()), float(values.max())
+        return min(values), max(values)
+
+    def percentile(self, q: float, dimension: str = "overall") -> Optional[float]:
+        """Score at a percentile, interpolating linearly between segments.
+
+        Args:
+            q: Percentile between 0 and 100
+            dimension: One of DIMENSIONS
+
+        Returns:
+            Score at the percentile, or None if no segment is scored
+
+        Raises:
+            ValueError: If q is outside 0-100
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        values = self._values(dimension)
+        if not len(values):
+            return None
+        np = _numpy()
+        if np is not None:
+            return float(np.percentile(values, q))
+
+        ordered = sorted(values)
+        position = (len(ordered) - 1) * q / 100
+        lower = math.floor(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    def histogram(
+        self,
+        bins: int = 10,
+        dimension: str = "overall",
+        value_range: Tuple[float, float] = (0.0, 100.0),
+    ) -> List[int]:
+        """Count scores into equal-width bins.
+
+        Args:
+            bins: Number of bins
+            dimension: One of DIMENSIONS
+            value_range: (low, high) edges of the first and last bin
+
+        Returns:
+            Count per bin; the last bin includes its upper edge
+        """
+        values = self._values(dimension)
+        np = _numpy()
+        if np is not None:
+            counts, _ = np.histogram(values, bins=bins, range=value_range)
+            return counts.tolist()
+
+        low, high = value_range
+        width = (high - low) / bins
+        edges = [low + width * i for i in range(1, bins)]
+        counts = [0] * bins
+        for value in values:
+            if low <= value <= high:
+                counts[bisect_right(edges, value)] += 1
+        return counts
+
+    def summary(self) -> Optional[QualityScore]:
+        """Average every dimension into a project-level quality score.
+
+        Returns:
+            Mean quality score, or None if no segment is scored
+        """
+        overall = self.mean("overall")
+        if overall is None:
+            return None
+        return QualityScore(
+            overall=overall,
+            **{name: self.mean(name) for name in DIMENSIONS[1:]},
+        )
@@ -0,0 +1,78 @@
+"""Request coalescing (single-flight) for the Straker Verify API client.
+
+Concurrent callers asking for the same thing share one in-flight request
+instead of each sending their own.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Tracks in-flight calls so duplicates can await the same result."""
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory once per key, sharing the result with concurrent callers.
+
+        The shared call keeps running if one caller is cancelled (for example
+        by a timeout), so the remaining callers still get the result.
+
+        Args:
+            key: Identity of the call
+            factory: Coroutine function performing the call
+
+        Returns:
+            Result of the call
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._calls[key] = future
+            future.add_done_callback(functools.partial(self._finish, key))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        """Forget a finished call.
+
+        Args:
+            key: Identity of the call
+            future: The finished call
+        """
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved even if every caller gave up
+            future.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+def coalesced(endpoint: str) -> Callable:
+    """Decorate an async client method so identical concurrent calls share one request.
+
+    Calls are identical when they have the same endpoint name and arguments.
+    List results are copied for each caller.
+
+    Args:
+        endpoint: Endpoint name
+
+    Returns:
+        Method decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = (endpoint, *args, *sorted(kwargs.items()))
+            value = await self._inflight.do(key, lambda: func(self, *args, **kwargs))
+            return list(value) if isinstance(value, list) else value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,124 @@
+"""Persistent on-disk snapshot of dashboard data.
+
+Keeps the last known project rows and stats in a small SQLite database
+under the cache directory, so the dashboard can paint immediately on startup
+and reconcile with the API in the background.
+"""
+
+import hashlib
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from .models import ProjectStats
+from .records import ProjectRow
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS project_rows (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    language_pair TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    quality REAL
+);
+CREATE TABLE IF NOT EXISTS stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    data TEXT NOT NULL
+);
+-- Segments were once saved here too; nothing reads them
+DROP TABLE IF EXISTS segments;
+-- Full projects were once saved here; the dashboard only needs its rows
+DROP TABLE IF EXISTS projects;
+"""
+
+
+class SnapshotStore:
+    """SQLite-backed store for the last known dashboard data.
+
+    One database file is kept per account (API key + base URL), so switching
+    keys never shows another account's projects.
+    """
+
+    def __init__(self, cache_dir: Path, api_key: str, base_url: str):
+        """Initialize the snapshot store.
+
+        Args:
+            cache_dir: Directory to keep the database in
+            api_key: API key the snapshot belongs to
+            base_url: API base URL the snapshot belongs to
+        """
+        account = hashlib.sha256(f"{base_url}|{api_key}".encode()).hexdigest()[:16]
+        self.path = Path(cache_dir).expanduser() / f"snapshot-{account}.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the snapshot database.
+
+        A fresh connection is used per operation so saves can run in a worker
+        thread without sharing a connection across threads.
+
+        Returns:
+            SQLite connection
+        """
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def load_project_rows(self) -> List[ProjectRow]:
+        """Load the last saved project rows, most recently updated first.
+
+        Returns:
+            List of project rows
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT id, name, status, language_pair, updated_at, quality"
+                " FROM project_rows ORDER BY updated_at DESC"
+            ).fetchall()
+        return [
+            ProjectRow(id, name, status, language_pair, datetime.fromisoformat(updated_at), quality)
+            for id, name, status, language_pair, updated_at, quality in rows
+        ]
+
+    def save_project_rows(self, rows: Iterable[ProjectRow], replace: bool = True) -> None:
+        """Save project rows to the snapshot.
+
+        Args:
+            rows: Project rows to save
+            replace: Drop previously saved rows that aren't in rows
+        """
+        with closing(self._connect()) as conn, conn:
+            if replace:
+                conn.execute("DELETE FROM project_rows")
+            conn.executemany(
+                "INSERT OR REPLACE INTO project_rows"
+                " (id, name, status, language_pair, updated_at, quality) VALUES (?, ?, ?, ?, ?, ?)",
+                [row._replace(updated_at=row.updated_at.isoformat()) for row in rows],
+            )
+
+    def load_stats(self) -> Optional[ProjectStats]:
+        """Load the last saved stats.
+
+        Returns:
+            Project statistics, or None if never saved
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT data FROM stats WHERE id = 1").fetchone()
+        return ProjectStats.model_validate_json(row[0]) if row else None
+
+    def save_stats(self, stats: ProjectStats) -> None:
+        """Save stats to the snapshot.
+
+        Args:
+            stats: Project statistics
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO stats (id, data) VALUES (1, ?)",
+                (stats.model_dump_json(),),
+            )
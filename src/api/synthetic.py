@@ -0,0 +1,293 @@
+"""Synthetic data for the mock backend.
+
+Generates accounts of any size for demo mode, so the dashboard can be run and
+benchmarked at production volume offline. Everything is derived from a seed,
+so the same settings always produce the same account. Segments are never
+stored: each one is regenerated from (seed, project, index) when asked for,
+so millions of them cost no memory.
+"""
+
+import asyncio
+import math
+import random
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .models import FileInfo, Project, ProjectStatus, QualityScore, Segment
+
+if TYPE_CHECKING:
+    from ..config import Settings
+
+
+# Default share of projects in each status
+DEFAULT_STATUS_MIX = {
+    ProjectStatus.COMPLETE: 0.6,
+    ProjectStatus.PROCESSING: 0.2,
+    ProjectStatus.PENDING: 0.15,
+    ProjectStatus.FAILED: 0.05,
+}
+
+LANGUAGES = ["es", "fr", "de", "it", "pt", "ja", "zh", "ko", "nl", "sv"]
+
+SAMPLE_TEXTS = [
+    ("Welcome to our new product launch event.", "Bienvenido a nuestro evento de lanzamiento de producto."),
+    ("Join us for an exciting showcase of innovation.", "Únase a nosotros para una emocionante exhibición de innovación."),
+    ("Experience the future of technology today.", "Experimente el futuro de la tecnología hoy."),
+    ("Thank you for your interest.", "Gracias por su interés."),
+    ("Please read the safety instructions carefully.", "Lea atentamente las instrucciones de seguridad."),
+    ("Your order has been shipped.", "Su pedido ha sido enviado."),
+]
+
+PROJECT_NAMES = ["Marketing_Campaign", "Product_Docs", "Support_Articles", "Legal_Terms", "App_Strings", "Release_Notes"]
+
+
+def parse_status_mix(value: str) -> Dict[ProjectStatus, float]:
+    """Parse a status mix such as "complete=0.6,processing=0.3,failed=0.1".
+
+    Args:
+        value: Comma-separated status=weight pairs
+
+    Returns:
+        Weight per status
+
+    Raises:
+        ValueError: If a status or weight is invalid, a weight is negative or
+            the weights sum to zero
+    """
+    mix = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        status, _, weight = item.partition("=")
+        try:
+            share = float(weight)
+        except ValueError:
+            raise ValueError(f"Invalid weight in status mix: {item.strip()!r}") from None
+        if not math.isfinite(share) or share < 0:
+            raise ValueError(f"Status mix weights must be non-negative: {item.strip()!r}")
+        mix[ProjectStatus(status.strip().lower())] = share
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError(f"Invalid status mix: {value!r}")
+    return mix
+
+
+class SyntheticBackend:
+    """Deterministic generator of mock projects, segments and latency."""
+
+    def __init__(
+        self,
+        projects: int = 0,
+        segments_per_project: int = 100,
+        status_mix: Optional[Dict[ProjectStatus, float]] = None,
+        latency: float = 0.1,
+        latency_sigma: float = 0.0,
+        seed: int = 0,
+    ):
+        """Initialize the generator.
+
+        Args:
+            projects: Number of projects to generate (0 keeps the built-in
+                sample projects)
+            segments_per_project: Segments in each processed project
+            status_mix: Relative weight of each project status
+            latency: Median simulated API latency in seconds
+            latency_sigma: Spread of the log-normal latency distribution
+                (0 for a fixed latency)
+            seed: Seed all data is derived from
+        """
+        self.project_count = projects
+        self.segments_per_project = segments_per_project
+        self.status_mix = status_mix or DEFAULT_STATUS_MIX
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.seed = seed
+        self._latency_rng = random.Random(f"{seed}:latency")
+        # Project ID -> (project index, file IDs, segment count)
+        self._layout: Dict[str, Tuple[int, List[str], int]] = {}
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "SyntheticBackend":
+        """Create a generator configured from application settings.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            Configured generator
+        """
+        return cls(
+            projects=settings.mock_projects,
+            segments_per_project=settings.mock_segments_per_project,
+            status_mix=parse_status_mix(settings.mock_status_mix),
+            latency=settings.mock_latency,
+            latency_sigma=settings.mock_latency_sigma,
+            seed=settings.mock_seed,
+        )
+
+    async def delay(self, scale: float = 1.0) -> None:
+        """Sleep for one simulated API round trip.
+
+        Args:
+            scale: Multiple of the median latency (e.g. 5 for an upload)
+        """
+        delay = self.latency * scale
+        if self.latency_sigma:
+            delay *= self._latency_rng.lognormvariate(0, self.latency_sigma)
+        await asyncio.sleep(delay)
+
+    def generate_projects(self, now: Optional[datetime] = None) -> Iterator[Project]:
+        """Generate the account's projects, without segments.
+
+        Args:
+            now: Reference time for timestamps
+
+        Yields:
+            Projects, newest first
+        """
+        now = now or datetime.now()
+        statuses = list(self.status_mix)
+        weights = [self.status_mix[status] for status in statuses]
+
+        for index in range(self.project_count):
+            rng = random.Random(f"{self.seed}:project:{index}")
+            status = rng.choices(statuses, weights)[0]
+            target = rng.choice(LANGUAGES)
+            updated_at = now - timedelta(minutes=index * 7 + rng.randrange(7))
+            created_at = updated_at - timedelta(hours=rng.randrange(1, 72))
+
+            files = [
+                FileInfo(
+                    id=f"{self.seed:x}-{index:08x}-{n}",
+                    name=f"document_{index}_{n}.txt",
+                    size=rng.randrange(1024, 512 * 1024),
+                    mime_type="text/plain",
+                    uploaded_at=created_at,
+                )
+                for n in range(rng.randint(1, 3))
+            ]
+            segment_count = (
+                self.segments_per_project
+                if status in (ProjectStatus.COMPLETE, ProjectStatus.PROCESSING)
+                else 0
+            )
+
+            project = Project(
+                id=f"{self.seed:x}-{index:08x}",
+                name=f"{rng.choice(PROJECT_NAMES)}_{index}_{target.upper()}",
+                description="Synthetic project",
+                source_language="en",
+                target_language=target,
+                status=status,
+                quality_score=self._quality(rng) if status == ProjectStatus.COMPLETE else None,
+                files=files,
+                created_at=created_at,
+                updated_at=updated_at,
+                completed_at=updated_at if status == ProjectStatus.COMPLETE else None,
+            )
+            self._layout[project.id] = (index, [f.id for f in files], segment_count)
+            yield project
+
+    def _quality(self, rng: random.Random) -> QualityScore:
+        """Generate a quality score.
+
+        Args:
+            rng: Random source
+
+        Returns:
+            Quality score
+        """
+        return QualityScore(
+            overall=rng.uniform(70, 98),
+            accuracy=rng.uniform(75, 99),
+            fluency=rng.uniform(70, 97),
+            terminology=rng.uniform(75, 98),
+            style=rng.uniform(70, 95),
+        )
+
+    def segment_count(self, project_id: str, file_id: Optional[str] = None) -> int:
+        """Count a generated project's segments.
+
+        Args:
+            project_id: Project ID
+            file_id: Optional file ID to count segments for
+
+        Returns:
+            Number of generated segments (0 for projects not generated here)
+        """
+        layout = self._layout.get(project_id)
+        if layout is None:
+            return 0
+        _, file_ids, count = layout
+        if file_id is None:
+            return count
+        if file_id not in file_ids:
+            return 0
+        # Segments are dealt to files round-robin
+        position = file_ids.index(file_id)
+        return len(range(position, count, len(file_ids)))
+
+    def segments(
+        self,
+        project_id: str,
+        offset: int,
+        limit: int,
+        file_id: Optional[str] = None,
+    ) -> List[Segment]:
+        """Generate a slice of a project's segments.
+
+        Args:
+            project_id: Project ID
+            offset: Index of the first segment (within file_id if given)
+            limit: Maximum number of segments
+            file_id: Optional file ID to filter segments
+
+        Returns:
+            Generated segments
+        """
+        layout = self._layout.get(project_id)
+        if layout is None:
+            return []
+        _, file_ids, _ = layout
+        if file_id is not None and file_id not in file_ids:
+            return []
+        end = min(offset + limit, self.segment_count(project_id, file_id))
+        if file_id is None:
+            return [self.segment(project_id, index) for index in range(offset, end)]
+
+        position, stride = file_ids.index(file_id), len(file_ids)
+        return [self.segment(project_id, position + k * stride) for k in range(offset, end)]
+
+    def segment(self, project_id: str, index: int) -> Segment:
+        """Generate one segment.
+
+        Args:
+            project_id: Project ID
+            index: Segment index within the project
+
+        Returns:
+            The segment, identical on every call
+        """
+        project_index, file_ids, _ = self._layout[project_id]
+        rng = random.Random(f"{self.seed}:segment:{project_index}:{index}")
+        source, target = rng.choice(SAMPLE_TEXTS)
+        return Segment(
+            id=f"{project_id}-{index:08x}",
+            file_id=file_ids[index % len(file_ids)],
+            source_text=source,
+            target_text=target,
+            quality_score=self._quality(rng),
+            issues=["Minor fluency issue detected"] if rng.random() < 0.1 else [],
+        )
+
+    def iter_segments(self, project_id: str, page_size: int = 1000) -> Iterator[List[Segment]]:
+        """Generate all of a project's segments, a page at a time.
+
+        Args:
+            project_id: Project ID
+            page_size: Segments per page
+
+        Yields:
+            Pages of segments
+        """
+        for offset in range(0, self.segment_count(project_id), page_size):
+            yield self.segments(project_id, offset, page_size)
@@ -0,0 +1,257 @@
+"""Helpers for streaming file transfers."""
+
+import base64
+import hashlib
+import mimetypes
+from pathlib import Path
+from typing import AsyncIterator, Callable, NamedTuple, Optional
+from uuid import uuid4
+
+import aiofiles
+import httpx
+
+from .models import FileInfo
+
+
+# Size of each chunk read from or written to disk
+CHUNK_SIZE = 1024 * 1024
+
+# Files larger than this are uploaded in resumable chunks
+RESUMABLE_THRESHOLD = 8 * 1024 * 1024
+
+# Progress callback: (bytes transferred so far, total bytes if known)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class UploadProgress(NamedTuple):
+    """Progress event for one file in a batch upload."""
+
+    path: Path
+    bytes_sent: int
+    total: int
+
+
+class UploadResult(NamedTuple):
+    """Outcome of uploading one file in a batch upload."""
+
+    path: Path
+    file: Optional[FileInfo]
+    error: Optional[Exception]
+
+
+def guess_mime_type(path: Path) -> str:
+    """Guess a file's MIME type from its name.
+
+    Args:
+        path: File path
+
+    Returns:
+        MIME type
+    """
+    return mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+
+async def iter_file_chunks(
+    path: Path,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Read a byte range of a file one chunk at a time.
+
+    Args:
+        path: File to read
+        start: First byte to read
+        end: Byte to stop before (defaults to end of file)
+        chunk_size: Bytes per read
+
+    Yields:
+        File chunks
+    """
+    async with aiofiles.open(path, "rb") as f:
+        await f.seek(start)
+        remaining = None if end is None else end - start
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = await f.read(size)
+            if not chunk:
+                return
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+
+class MultipartFileBody:
+    """Streaming multipart/form-data body for a single file.
+
+    The file is read from disk chunk by chunk as the request is sent, so it
+    never has to fit in memory.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        field: str = "file",
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """Initialize the body.
+
+        Args:
+            path: File to send
+            field: Form field name
+            progress: Called with (bytes sent, file size)
+            chunk_size: Bytes per read
+        """
+        self.path = path
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self.size = path.stat().st_size
+        self.boundary = uuid4().hex
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{path.name}"\r\n'
+            f"Content-Type: {guess_mime_type(path)}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+    @property
+    def headers(self) -> dict:
+        """Request headers describing the body.
+
+        Returns:
+            Content-Type and Content-Length headers
+        """
+        return {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary}",
+            "Content-Length": str(len(self._head) + self.size + len(self._tail)),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+        sent = 0
+        async for chunk in iter_file_chunks(self.path, chunk_size=self.chunk_size):
+            yield chunk
+            sent += len(chunk)
+            if self.progress:
+                self.progress(sent, self.size)
+        yield self._tail
+
+
+def part_path(output_path: Path) -> Path:
+    """Get the temporary path a download is written to before it completes.
+
+    Args:
+        output_path: Final output path
+
+    Returns:
+        Path of the partial download
+    """
+    return output_path.with_name(output_path.name + ".part")
+
+
+def validator_path(partial: Path) -> Path:
+    """Get the path storing the validator of a partial download.
+
+    Args:
+        partial: Partial download path
+
+    Returns:
+        Path of the file holding the ETag or Last-Modified it was fetched at
+    """
+    return partial.with_name(partial.name + ".validator")
+
+
+def response_validator(response: httpx.Response) -> Optional[str]:
+    """Get a validator that If-Range can use to resume a download safely.
+
+    If-Range only accepts a strong ETag or a Last-Modified date.
+
+    Args:
+        response: Download response
+
+    Returns:
+        Strong ETag, else Last-Modified, else None
+    """
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def unsatisfied_range_total(response: httpx.Response) -> Optional[int]:
+    """Get the full size a 416 response reports in "Content-Range: bytes */N".
+
+    Args:
+        response: 416 response
+
+    Returns:
+        Size in bytes, or None if not reported
+    """
+    content_range = response.headers.get("Content-Range", "")
+    if content_range.startswith("bytes */"):
+        total = content_range[len("bytes */"):]
+        if total.isdigit():
+            return int(total)
+    return None
+
+
+async def hash_file(path: Path, hasher: "hashlib._Hash", chunk_size: int = CHUNK_SIZE) -> None:
+    """Feed a file's contents into a hash, one chunk at a time.
+
+    Args:
+        path: File to read
+        hasher: Hash object to update
+        chunk_size: Bytes per read
+    """
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(chunk_size):
+            hasher.update(chunk)
+
+
+def response_sha256(response: httpx.Response) -> Optional[str]:
+    """Get the SHA-256 checksum a download response advertises.
+
+    Understands both ``X-Checksum-SHA256`` (hex) and ``Digest: sha-256=``
+    (base64) headers.
+
+    Args:
+        response: Download response
+
+    Returns:
+        Lowercase hex digest, or None if not advertised
+    """
+    checksum = response.headers.get("X-Checksum-SHA256")
+    if checksum:
+        return checksum.strip().lower()
+
+    for digest in response.headers.get("Digest", "").split(","):
+        algorithm, _, value = digest.strip().partition("=")
+        if algorithm.lower() == "sha-256" and value:
+            try:
+                return base64.b64decode(value).hex()
+            except ValueError:
+                return None
+    return None
+
+
+def content_total(response: httpx.Response, offset: int) -> Optional[int]:
+    """Work out the full size of a download from its response headers.
+
+    Args:
+        response: Download response
+        offset: Bytes already on disk before this response
+
+    Returns:
+        Total size in bytes, or None if unknown
+    """
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        if total.isdigit():
+            return int(total)
+
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit():
+        return offset + int(length)
+    return None
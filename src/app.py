@@ -1,5 +1,10 @@
 """Main Textual application for Straker Verify Dashboard."""
 
+import asyncio
+import importlib
+from typing import TYPE_CHECKING, Optional
+
+from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
@@ -7,6 +12,11 @@ from textual.widgets import Footer, Header, Static
 
 from .config import Settings
 from .screens.dashboard import DashboardScreen
+from .utils.scheduler import RefreshScheduler
+from .utils.startup import StartupProfile
+
+if TYPE_CHECKING:
+    from .api.client import StrakerVerifyClient
 
 
 class StrakerVerifyApp(App):
@@ -116,20 +126,73 @@ class StrakerVerifyApp(App):
         Binding("p", "view_projects", "Projects", show=True),
         Binding("s", "settings", "Settings", show=True),
         Binding("r", "refresh", "Refresh", show=True),
+        Binding("d", "diagnostics", "Diagnostics", show=True),
         Binding("q", "quit", "Quit", show=True),
     ]
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        startup: Optional[StartupProfile] = None,
+        exit_after_startup: bool = False,
+    ):
         """Initialize the application.
         
         Args:
             settings: Application settings
+            startup: Startup profile to record milestones in
+            exit_after_startup: Exit once the first refresh has finished
+                (for --profile-startup)
         """
         super().__init__()
         self.settings = settings
+        self.startup = startup or StartupProfile()
+        self.exit_after_startup = exit_after_startup
+        # One long-lived client shared by all screens, built on first use so
+        # httpx and the API modules load after the first frame is painted
+        self._client: Optional["StrakerVerifyClient"] = None
+        self.refresh_scheduler = RefreshScheduler(
+            interval=settings.auto_refresh_interval,
+            idle_timeout=settings.auto_refresh_idle_timeout,
+        )
         self.title = "Straker Verify Dashboard"
         self.sub_title = "Translation Quality Management"
 
+    @property
+    def client(self) -> "StrakerVerifyClient":
+        """Get the shared API client, building it if needed.
+        
+        Returns:
+            API client
+        """
+        if self._client is None:
+            from .api.client import StrakerVerifyClient
+            
+            self._client = StrakerVerifyClient.from_settings(self.settings)
+            self.mark_startup("client_ready")
+        return self._client
+
+    async def get_client(self) -> "StrakerVerifyClient":
+        """Get the shared API client, importing its modules in a thread.
+        
+        Returns:
+            API client
+        """
+        if self._client is None:
+            # The import is the slow part; keep it off the event loop
+            await asyncio.to_thread(importlib.import_module, ".api.client", __package__)
+        return self.client
+
+    def mark_startup(self, name: str) -> None:
+        """Record a startup milestone.
+        
+        Args:
+            name: Milestone name
+        """
+        self.startup.mark(name)
+        if self.exit_after_startup and name == "first_refresh":
+            self.exit()
+
     def compose(self) -> ComposeResult:
         """Compose the application layout.
         
@@ -144,6 +207,34 @@ class StrakerVerifyApp(App):
         # Push the dashboard screen
         self.push_screen(DashboardScreen(self.settings))
 
+    def on_ready(self) -> None:
+        """Handle the first frame being displayed."""
+        self.mark_startup("first_paint")
+
+    async def on_event(self, event: events.Event) -> None:
+        """Handle all events, noting user input for auto-refresh.
+        
+        Args:
+            event: Event to handle
+        """
+        if isinstance(event, (events.Key, events.MouseEvent)):
+            self.refresh_scheduler.record_activity()
+        await super().on_event(event)
+
+    def on_app_focus(self) -> None:
+        """Handle terminal focus - resume auto-refresh."""
+        self.refresh_scheduler.focused = True
+        self.refresh_scheduler.record_activity()
+
+    def on_app_blur(self) -> None:
+        """Handle terminal blur - pause auto-refresh."""
+        self.refresh_scheduler.focused = False
+
+    async def on_unmount(self) -> None:
+        """Handle application unmount event - close the shared client."""
+        if self._client is not None:
+            await self._client.close()
+
     def action_new_project(self) -> None:
         """Handle new project action."""
         self.notify("New Project - Coming soon!", severity="information")
@@ -160,6 +251,15 @@ class StrakerVerifyApp(App):
         """Handle settings action."""
         self.notify("Settings - Coming soon!", severity="information")
 
+    def action_diagnostics(self) -> None:
+        """Toggle the diagnostics overlay."""
+        from .screens.diagnostics import DiagnosticsScreen
+        
+        if isinstance(self.screen, DiagnosticsScreen):
+            self.pop_screen()
+        else:
+            self.push_screen(DiagnosticsScreen())
+
     def action_refresh(self) -> None:
         """Handle refresh action."""
         self.notify("Refreshing...", severity="information")
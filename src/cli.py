@@ -0,0 +1,358 @@
+"""Headless command-line mode for scripting and monitoring.
+
+Queries the API with the same StrakerVerifyClient the dashboard uses and
+prints the result as a table, JSON or NDJSON, without starting Textual:
+
+    python -m src.main stats --format json
+    python -m src.main projects --status processing --format ndjson
+    python -m src.main quality PROJECT_ID [PROJECT_ID ...]
+
+Project lists are written as each page arrives, so even very large accounts
+start printing immediately and are never held in memory as text. If a listing
+fails partway, JSON output is left without its closing bracket so it can't be
+mistaken for a complete list. Exit codes are 0 on success, 1 if any query
+failed and 130 if interrupted.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+import click
+
+from .api.models import ProjectStatus
+from .config import Settings, init_settings
+from .utils.log import setup_logging
+
+if TYPE_CHECKING:
+    from .api.client import StrakerVerifyClient
+    from .api.models import Project
+
+
+OUTPUT_FORMATS = ("table", "json", "ndjson")
+
+# (key, header, width) of each table column
+PROJECT_COLUMNS = [
+    ("id", "ID", 36),
+    ("name", "NAME", 32),
+    ("status", "STATUS", 10),
+    ("languages", "LANGUAGES", 9),
+    ("quality", "QUALITY", 7),
+    ("files", "FILES", 5),
+    ("updated_at", "UPDATED", 19),
+]
+
+QUALITY_COLUMNS = [
+    ("id", "ID", 36),
+    ("status", "STATUS", 10),
+    ("segments", "SEGMENTS", 8),
+    ("overall", "OVERALL", 7),
+    ("p10", "P10", 6),
+    ("p50", "P50", 6),
+    ("p90", "P90", 6),
+    ("error", "ERROR", 0),
+]
+
+# Percentiles reported by the quality command
+QUALITY_PERCENTILES = (10, 50, 90)
+
+
+def format_cell(value: Any) -> str:
+    """Format a value for a table cell.
+
+    Args:
+        value: Cell value
+
+    Returns:
+        Cell text ("-" for missing values)
+    """
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value)
+
+
+class RecordWriter:
+    """Writes records to a stream one at a time as a table, JSON or NDJSON.
+
+    JSON output is a single array, written incrementally.
+    """
+
+    def __init__(
+        self,
+        output_format: str,
+        columns: Sequence[Tuple[str, str, int]],
+        stream: Optional[TextIO] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            output_format: One of OUTPUT_FORMATS
+            columns: (key, header, width) of each table column; a width of 0
+                leaves the column unpadded
+            stream: Output stream (defaults to stdout)
+        """
+        self.output_format = output_format
+        self.columns = columns
+        self.stream = stream or sys.stdout
+        self.count = 0
+
+    def _table_row(self, cells: List[str]) -> str:
+        """Lay out one table row.
+
+        Args:
+            cells: Cell texts, one per column
+
+        Returns:
+            The row, without trailing whitespace
+        """
+        parts = []
+        for (_, _, width), cell in zip(self.columns, cells):
+            if width and len(cell) > width:
+                cell = cell[:width - 1] + "…"
+            parts.append(cell.ljust(width))
+        return "  ".join(parts).rstrip()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one record.
+
+        Args:
+            record: JSON-serializable record
+        """
+        if self.output_format == "ndjson":
+            line = json.dumps(record)
+        elif self.output_format == "json":
+            line = ("[\n  " if not self.count else ",\n  ") + json.dumps(record)
+        else:
+            line = self._table_row([format_cell(record.get(key)) for key, _, _ in self.columns])
+            if not self.count:
+                line = self._table_row([header for _, header, _ in self.columns]) + "\n" + line
+
+        self.stream.write(line if self.output_format == "json" else line + "\n")
+        self.stream.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        """Finish the output.
+
+        Only call this once every record has been written: it ends the JSON
+        array, so output cut short by an error must be left unterminated.
+        """
+        if self.output_format == "json":
+            self.stream.write("\n]\n" if self.count else "[]\n")
+        elif self.output_format == "table" and not self.count:
+            self.stream.write("No results\n")
+        self.stream.flush()
+
+
+def project_record(project: "Project") -> Dict[str, Any]:
+    """Describe a project for output.
+
+    Args:
+        project: Project
+
+    Returns:
+        JSON-serializable record
+    """
+    return {
+        "id": project.id,
+        "name": project.name,
+        "status": project.status.value,
+        "languages": f"{project.source_language}-{project.target_language}",
+        "quality": project.quality_score.overall if project.quality_score else None,
+        "files": len(project.files),
+        "created_at": project.created_at.isoformat(timespec="seconds"),
+        "updated_at": project.updated_at.isoformat(timespec="seconds"),
+        "completed_at": project.completed_at.isoformat(timespec="seconds") if project.completed_at else None,
+    }
+
+
+async def quality_record(client: "StrakerVerifyClient", project_id: str) -> Dict[str, Any]:
+    """Summarize a project's quality from its per-segment scores.
+
+    Args:
+        client: API client
+        project_id: Project ID
+
+    Returns:
+        JSON-serializable record
+
+    Raises:
+        ValueError: If project not found
+    """
+    project = await client.get_project(project_id)
+    scores = await client.get_segment_scores(project_id)
+    summary = scores.summary() or project.quality_score
+    record: Dict[str, Any] = {
+        "id": project.id,
+        "name": project.name,
+        "status": project.status.value,
+        "segments": scores.count(),
+        **(summary.model_dump() if summary else {"overall": None}),
+    }
+    for q in QUALITY_PERCENTILES:
+        record[f"p{q}"] = scores.percentile(q)
+    min_max = scores.min_max()
+    record["min"], record["max"] = min_max if min_max else (None, None)
+    record["histogram"] = scores.histogram() if len(scores) else []
+    return record
+
+
+async def iter_projects(
+    client: "StrakerVerifyClient",
+    page_size: int,
+    statuses: Sequence[str] = (),
+    limit: Optional[int] = None,
+) -> AsyncIterator["Project"]:
+    """Stream projects, most recently updated first.
+
+    Args:
+        client: API client
+        page_size: Projects per API page
+        statuses: Only yield projects in these statuses (all if empty)
+        limit: Stop after this many projects
+
+    Yields:
+        Projects
+    """
+    count = 0
+    async for page in client.iter_projects(page_size=page_size):
+        for project in page:
+            if statuses and project.status.value not in statuses:
+                continue
+            yield project
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
+def load_settings() -> Settings:
+    """Load settings and set up logging, exiting on configuration errors.
+
+    Returns:
+        Application settings
+    """
+    try:
+        settings = init_settings()
+    except ValueError as e:
+        click.echo(f"Configuration Error: {e}", err=True)
+        sys.exit(1)
+    setup_logging(settings.log_level, settings.log_file)
+    return settings
+
+
+def run_with_client(settings: Settings, query: Callable[["StrakerVerifyClient"], Awaitable[int]]) -> None:
+    """Run a query against a fresh client and exit with its exit code.
+
+    Args:
+        settings: Application settings
+        query: Coroutine function taking the client and returning an exit code
+    """
+    from .api.client import StrakerVerifyClient
+
+    async def main() -> int:
+        client = StrakerVerifyClient.from_settings(settings)
+        try:
+            return await query(client)
+        finally:
+            await client.close()
+
+    try:
+        code = asyncio.run(main())
+    except KeyboardInterrupt:
+        click.echo("Interrupted", err=True)
+        code = 130
+    except BrokenPipeError:
+        # The reader (e.g. head) went away; don't fail again flushing stdout at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        code = 1
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        code = 1
+    sys.exit(code)
+
+
+format_option = click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="table",
+    show_default=True,
+    help="Output format.",
+)
+
+
+@click.command()
+@format_option
+def stats(output_format: str) -> None:
+    """Print account statistics."""
+    settings = load_settings()
+
+    async def query(client: "StrakerVerifyClient") -> int:
+        record = (await client.get_stats()).model_dump(mode="json")
+        if output_format == "json":
+            click.echo(json.dumps(record, indent=2))
+        elif output_format == "ndjson":
+            click.echo(json.dumps(record))
+        else:
+            width = max(len(key) for key in record)
+            for key, value in record.items():
+                click.echo(f"{key.replace('_', ' '):<{width}}  {format_cell(value)}")
+        return 0
+
+    run_with_client(settings, query)
+
+
+@click.command()
+@format_option
+@click.option(
+    "--status",
+    "statuses",
+    multiple=True,
+    type=click.Choice([status.value for status in ProjectStatus]),
+    help="Only list projects in this status (repeatable).",
+)
+@click.option("--limit", type=click.IntRange(min=1), help="List at most this many projects.")
+@click.option("--page-size", type=click.IntRange(1, 1000), help="Projects per API request.")
+def projects(output_format: str, statuses: Tuple[str, ...], limit: Optional[int], page_size: Optional[int]) -> None:
+    """List projects, most recently updated first, streaming as pages arrive."""
+    settings = load_settings()
+
+    async def query(client: "StrakerVerifyClient") -> int:
+        writer = RecordWriter(output_format, PROJECT_COLUMNS)
+        async for project in iter_projects(client, page_size or settings.projects_page_size, statuses, limit):
+            writer.write(project_record(project))
+        writer.close()
+        return 0
+
+    run_with_client(settings, query)
+
+
+@click.command()
+@format_option
+@click.argument("project_ids", nargs=-1, required=True)
+def quality(output_format: str, project_ids: Tuple[str, ...]) -> None:
+    """Print quality summaries for projects, from their per-segment scores.
+
+    A project that can't be loaded gets a record with an "error" field and
+    the command exits with status 1.
+    """
+    settings = load_settings()
+
+    async def query(client: "StrakerVerifyClient") -> int:
+        writer = RecordWriter(output_format, QUALITY_COLUMNS)
+        code = 0
+        for project_id in project_ids:
+            try:
+                record = await quality_record(client, project_id)
+            except Exception as e:
+                record = {"id": project_id, "error": str(e)}
+                code = 1
+            writer.write(record)
+        writer.close()
+        return code
+
+    run_with_client(settings, query)
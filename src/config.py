@@ -7,6 +7,8 @@ from typing import Optional
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .api.synthetic import parse_status_mix
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -55,6 +57,58 @@ class Settings(BaseSettings):
         description="Cache TTL in seconds",
         alias="CACHE_TTL",
     )
+    cache_max_entries: int = Field(
+        default=256,
+        description="Maximum number of cached API responses",
+        alias="CACHE_MAX_ENTRIES",
+    )
+    cache_dir: str = Field(
+        default="~/.cache/straker-verify-dashboard",
+        description="Directory for the on-disk dashboard snapshot",
+        alias="CACHE_DIR",
+    )
+
+    # HTTP connection settings
+    http_max_connections: int = Field(
+        default=10,
+        description="Maximum number of pooled HTTP connections",
+        alias="HTTP_MAX_CONNECTIONS",
+    )
+    http_max_keepalive_connections: int = Field(
+        default=10,
+        description="Maximum number of idle keep-alive connections",
+        alias="HTTP_MAX_KEEPALIVE_CONNECTIONS",
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle connection is kept open",
+        alias="HTTP_KEEPALIVE_EXPIRY",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 (requires httpx[http2])",
+        alias="HTTP2",
+    )
+    http_timeout: float = Field(
+        default=30.0,
+        description="HTTP request timeout in seconds",
+        alias="HTTP_TIMEOUT",
+    )
+    http_max_retries: int = Field(
+        default=3,
+        description="Retries for failed idempotent API requests",
+        alias="HTTP_MAX_RETRIES",
+    )
+    circuit_breaker_threshold: int = Field(
+        default=5,
+        description="Consecutive API failures before failing fast",
+        alias="CIRCUIT_BREAKER_THRESHOLD",
+    )
+    circuit_breaker_reset: float = Field(
+        default=30.0,
+        description="Seconds to fail fast before retrying the API",
+        alias="CIRCUIT_BREAKER_RESET",
+    )
 
     # Logging settings
     log_level: str = Field(
@@ -79,6 +133,53 @@ class Settings(BaseSettings):
         description="Auto-refresh interval in seconds",
         alias="AUTO_REFRESH_INTERVAL",
     )
+    auto_refresh_idle_timeout: int = Field(
+        default=300,
+        description="Pause auto-refresh after this many idle seconds (0 to never pause)",
+        alias="AUTO_REFRESH_IDLE_TIMEOUT",
+    )
+    projects_page_size: int = Field(
+        default=50,
+        description="Number of projects fetched per page",
+        alias="PROJECTS_PAGE_SIZE",
+    )
+    hydrate_concurrency: int = Field(
+        default=4,
+        description="Concurrent requests when fetching project details",
+        alias="HYDRATE_CONCURRENCY",
+    )
+
+    # Demo mode settings
+    mock_projects: int = Field(
+        default=0,
+        description="Number of synthetic projects in demo mode (0 for the built-in samples)",
+        alias="MOCK_PROJECTS",
+    )
+    mock_segments_per_project: int = Field(
+        default=100,
+        description="Synthetic segments per processed project",
+        alias="MOCK_SEGMENTS_PER_PROJECT",
+    )
+    mock_status_mix: str = Field(
+        default="complete=0.6,processing=0.2,pending=0.15,failed=0.05",
+        description="Relative share of synthetic projects in each status",
+        alias="MOCK_STATUS_MIX",
+    )
+    mock_latency: float = Field(
+        default=0.1,
+        description="Median simulated API latency in seconds",
+        alias="MOCK_LATENCY",
+    )
+    mock_latency_sigma: float = Field(
+        default=0.0,
+        description="Spread of the log-normal simulated latency (0 for fixed)",
+        alias="MOCK_LATENCY_SIGMA",
+    )
+    mock_seed: int = Field(
+        default=0,
+        description="Seed for synthetic demo data",
+        alias="MOCK_SEED",
+    )
 
     @field_validator("log_level")
     @classmethod
@@ -110,6 +211,33 @@ class Settings(BaseSettings):
             raise ValueError("Auto-refresh interval must be at most 300 seconds")
         return v
 
+    @field_validator("projects_page_size")
+    @classmethod
+    def validate_projects_page_size(cls, v: int) -> int:
+        """Validate projects page size."""
+        if v < 1:
+            raise ValueError("Projects page size must be at least 1")
+        if v > 1000:
+            raise ValueError("Projects page size must be at most 1000")
+        return v
+
+    @field_validator("hydrate_concurrency")
+    @classmethod
+    def validate_hydrate_concurrency(cls, v: int) -> int:
+        """Validate hydration concurrency."""
+        if v < 1:
+            raise ValueError("Hydrate concurrency must be at least 1")
+        if v > 64:
+            raise ValueError("Hydrate concurrency must be at most 64")
+        return v
+
+    @field_validator("mock_status_mix")
+    @classmethod
+    def validate_mock_status_mix(cls, v: str) -> str:
+        """Validate mock status mix."""
+        parse_status_mix(v)
+        return v
+
 
 def get_settings() -> Settings:
     """Get application settings.
@@ -1,28 +1,49 @@
 """Main entry point for Straker Verify Dashboard."""
 
+import time
+
+# Measure startup from before any heavy import
+STARTED = time.perf_counter()
+
+import json
 import sys
-from pathlib import Path
 
-from .app import StrakerVerifyApp
+import click
+
+from .cli import projects, quality, stats
 from .config import init_settings
+from .utils.log import setup_logging
+from .utils.startup import StartupProfile
 
 
-def main() -> int:
+def run(profile_startup: bool = False) -> int:
     """Run the Straker Verify Dashboard application.
-    
+
+    Args:
+        profile_startup: Exit after the first refresh and print startup timings
+
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    startup = StartupProfile(STARTED)
     try:
         # Initialize settings
         settings = init_settings()
-        
+        setup_logging(settings.log_level, settings.log_file)
+        startup.mark("settings_loaded")
+
+        # Textual is only imported once the configuration is known to be good
+        from .app import StrakerVerifyApp
+        startup.mark("app_imported")
+
         # Create and run the application
-        app = StrakerVerifyApp(settings)
+        app = StrakerVerifyApp(settings, startup=startup, exit_after_startup=profile_startup)
         app.run()
-        
+
+        if profile_startup:
+            print(json.dumps(startup.report(), indent=2))
         return 0
-        
+
     except ValueError as e:
         # Configuration error
         print(f"Configuration Error: {e}", file=sys.stderr)
@@ -30,12 +51,12 @@ def main() -> int:
         print("1. Copied .env.example to .env", file=sys.stderr)
         print("2. Added your Straker Verify API key to .env", file=sys.stderr)
         return 1
-        
+
     except KeyboardInterrupt:
         # User interrupted
         print("\nInterrupted by user", file=sys.stderr)
         return 130
-        
+
     except Exception as e:
         # Unexpected error
         print(f"Unexpected Error: {e}", file=sys.stderr)
@@ -44,5 +65,31 @@ def main() -> int:
         return 1
 
 
+@click.group(invoke_without_command=True)
+@click.option(
+    "--profile-startup",
+    is_flag=True,
+    help="Exit after the first refresh and print time to first paint and other startup timings.",
+)
+@click.option("--once", is_flag=True, help="Print account stats once and exit, without starting the TUI.")
+@click.option("--json", "as_json", is_flag=True, help="Print stats once as JSON and exit (implies --once).")
+@click.pass_context
+def main(ctx: click.Context, profile_startup: bool, once: bool, as_json: bool) -> None:
+    """Run the Straker Verify Dashboard.
+
+    Use a subcommand to query the API headlessly instead, e.g. from cron.
+    """
+    if ctx.invoked_subcommand is not None:
+        return
+    if once or as_json:
+        ctx.invoke(stats, output_format="json" if as_json else "table")
+    sys.exit(run(profile_startup))
+
+
+main.add_command(stats)
+main.add_command(projects)
+main.add_command(quality)
+
+
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    main()
@@ -1,24 +1,35 @@
 """Dashboard screen for Straker Verify application."""
 
 import asyncio
-from typing import List, Optional
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set
 
 from textual.app import ComposeResult
-from textual.containers import Container, Horizontal, Vertical, VerticalScroll
+from textual.css.query import NoMatches
+from textual.containers import Horizontal
 from textual.screen import Screen
 from textual.widgets import Button, Label, Static
 from textual.reactive import Reactive
+from textual.worker import Worker
 
-from ..api.client import StrakerVerifyClient
-from ..api.models import Project, ProjectStats
-from ..config import Settings
-from ..utils.formatters import (
-    format_number,
-    format_percentage,
-    format_quality_bar,
-    format_status_badge,
-    format_time_ago,
+from ..api.models import (
+    Language,
+    Project,
+    ProjectStats,
+    ProjectStatus,
+    ProjectSync,
+    TokenBalance,
 )
+from ..api.records import ProjectRow
+from ..api.store import SnapshotStore
+from ..config import Settings
+from ..utils.formatters import format_number, format_percentage
+from ..widgets.project_list import ProjectList
+
+if TYPE_CHECKING:
+    from ..api.client import StrakerVerifyClient
 
 
 class StatBox(Static):
@@ -45,40 +56,15 @@ class StatBox(Static):
         yield Label(self.value_text, classes="stat-value")
         yield Label(self.label_text, classes="stat-label")
 
-
-class ProjectCard(Static):
-    """Widget for displaying a project card."""
-
-    def __init__(self, project: Project, **kwargs):
-        """Initialize project card.
+    def set_value(self, value: str) -> None:
+        """Update the displayed value in place.
         
         Args:
-            project: Project to display
-            **kwargs: Additional widget arguments
-        """
-        super().__init__(**kwargs)
-        self.project = project
-
-    def compose(self) -> ComposeResult:
-        """Compose the project card.
-        
-        Yields:
-            Project card widgets
+            value: New stat value
         """
-        # Project header with name and status
-        with Horizontal(classes="project-header"):
-            yield Label(self.project.name)
-            yield Static(format_status_badge(self.project.status.value))
-        
-        # Language pair and time
-        with Horizontal(classes="project-meta"):
-            yield Label(self.project.language_pair)
-            yield Label(format_time_ago(self.project.updated_at))
-        
-        # Quality score if available
-        if self.project.quality_score:
-            quality_text = f"Quality: {format_quality_bar(self.project.quality_score.overall)} {format_percentage(self.project.quality_score.overall)}"
-            yield Label(quality_text)
+        if value != self.value_text:
+            self.value_text = value
+            self.query_one(".stat-value", Label).update(value)
 
 
 class DashboardScreen(Screen):
@@ -89,6 +75,15 @@ class DashboardScreen(Screen):
         background: $surface;
     }
     
+    .account-bar {
+        height: 1;
+        margin: 0 1;
+    }
+    
+    .account-bar .balance {
+        width: auto;
+    }
+    
     .stats-container {
         height: 7;
         margin: 1;
@@ -107,18 +102,6 @@ class DashboardScreen(Screen):
         margin: 1;
     }
     
-    .project-card {
-        height: auto;
-        border: solid $primary;
-        margin-bottom: 1;
-        padding: 1;
-    }
-    
-    .loading {
-        content-align: center middle;
-        height: 100%;
-    }
-    
     .error {
         background: $error;
         color: $text;
@@ -127,8 +110,24 @@ class DashboardScreen(Screen):
     }
     """
 
+    # Per-request timeouts (seconds) for each dashboard panel
+    LOAD_TIMEOUTS = {
+        "stats": 15.0,
+        "projects": 30.0,
+        "balance": 10.0,
+        "languages": 10.0,
+    }
+
+    STAT_LABELS = {
+        "projects": "Projects",
+        "active": "Active",
+        "quality": "Avg Quality",
+        "files": "Files",
+    }
+
     stats: Reactive[Optional[ProjectStats]] = Reactive(None)
-    projects: Reactive[List[Project]] = Reactive([])
+    balance: Reactive[Optional[TokenBalance]] = Reactive(None)
+    languages: Reactive[List[Language]] = Reactive([])
     is_loading: Reactive[bool] = Reactive(True)
     error_message: Reactive[Optional[str]] = Reactive(None)
 
@@ -141,7 +140,18 @@ class DashboardScreen(Screen):
         """
         super().__init__(**kwargs)
         self.settings = settings
-        self.client: Optional[StrakerVerifyClient] = None
+        self.client: Optional["StrakerVerifyClient"] = None
+        self.store: Optional[SnapshotStore] = None
+        self._project_pages: Optional[AsyncIterator[List[Project]]] = None
+        # Rows of loaded projects by ID; the project list keeps their order
+        self.projects: Dict[str, ProjectRow] = {}
+        self._load_worker: Optional[Worker] = None
+        self._more_worker: Optional[Worker] = None
+        # IDs of snapshot projects the API hasn't confirmed still exist
+        self._provisional: Set[str] = set()
+        # Durations in seconds of the last refresh, recompose and each
+        # panel's fetch and update, shown on the diagnostics screen
+        self.timings: Dict[str, float] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the dashboard screen.
@@ -149,99 +159,451 @@ class DashboardScreen(Screen):
         Yields:
             Dashboard widgets
         """
+        error = Label(f"Error: {self.error_message}", id="error", classes="error")
+        error.display = bool(self.error_message)
+        yield error
+        
+        # Account bar
+        with Horizontal(classes="account-bar"):
+            yield Label(self._languages_text(), id="languages")
+            yield Label(self._balance_text(), id="balance", classes="balance")
+        
+        # Stats panel
+        with Horizontal(id="stats", classes="stats-container"):
+            yield from self._compose_stats()
+        
+        # Projects list
+        yield ProjectList(
+            self.projects.values(),
+            placeholder=self._projects_placeholder(),
+            id="projects",
+            classes="projects-scroll",
+        )
+
+    async def recompose(self) -> None:
+        """Rebuild the screen's widgets, timing how long it takes."""
+        started = time.perf_counter()
+        await super().recompose()
+        self.timings["recompose"] = time.perf_counter() - started
+
+    def _compose_stats(self) -> ComposeResult:
+        """Compose the stats panel contents.
+        
+        Yields:
+            Stat box widgets
+        """
+        values = self._stat_values()
+        for key, label in self.STAT_LABELS.items():
+            yield StatBox(label, values[key], id=f"stat-{key}", classes="stat-box")
+
+    def _stat_values(self) -> Dict[str, str]:
+        """Get the formatted value for each stat box.
+        
+        Returns:
+            Mapping of stat key to display value
+        """
+        if self.stats is None:
+            placeholder = "…" if self.is_loading else "N/A"
+            return {key: placeholder for key in self.STAT_LABELS}
+        
+        return {
+            "projects": format_number(self.stats.total_projects),
+            "active": format_number(self.stats.active_projects),
+            "quality": format_percentage(self.stats.average_quality) if self.stats.average_quality else "N/A",
+            "files": format_number(self.stats.total_files),
+        }
+
+    def _projects_placeholder(self) -> str:
+        """Get the text shown when the project list is empty.
+        
+        Returns:
+            Placeholder text
+        """
         if self.is_loading:
-            yield Container(
-                Label("Loading dashboard...", classes="loading"),
-                classes="loading",
-            )
-        elif self.error_message:
-            yield Container(
-                Label(f"Error: {self.error_message}", classes="error"),
-                classes="error",
-            )
-        else:
-            # Stats panel
-            with Horizontal(classes="stats-container"):
-                if self.stats:
-                    yield StatBox(
-                        "Projects",
-                        format_number(self.stats.total_projects),
-                        classes="stat-box",
-                    )
-                    yield StatBox(
-                        "Active",
-                        format_number(self.stats.active_projects),
-                        classes="stat-box",
-                    )
-                    yield StatBox(
-                        "Avg Quality",
-                        format_percentage(self.stats.average_quality) if self.stats.average_quality else "N/A",
-                        classes="stat-box",
-                    )
-                    yield StatBox(
-                        "Files",
-                        format_number(self.stats.total_files),
-                        classes="stat-box",
-                    )
-            
-            # Projects list
-            with VerticalScroll(classes="projects-scroll"):
-                if self.projects:
-                    for project in self.projects:
-                        yield ProjectCard(project, classes="project-card")
-                else:
-                    yield Label("No projects yet. Create one to get started!")
+            return "Loading projects..."
+        return "No projects yet. Create one to get started!"
+
+    def _balance_text(self) -> str:
+        """Get the token balance label text.
+        
+        Returns:
+            Balance text
+        """
+        if self.balance is None:
+            return "Balance: …"
+        return f"Balance: {format_number(self.balance.balance)} {self.balance.currency}"
+
+    def _languages_text(self) -> str:
+        """Get the supported languages label text.
+        
+        Returns:
+            Languages text
+        """
+        if not self.languages:
+            return "Languages: …"
+        return f"Languages: {', '.join(lang.code.upper() for lang in self.languages)}"
 
     async def on_mount(self) -> None:
         """Handle screen mount event."""
-        await self.load_data()
+        # Paint the last known data straight away, then reconcile with the API
+        self.load_snapshot()
+        self.call_after_refresh(self.refresh_data)
+        self.set_interval(1.0, self._auto_refresh_tick)
+
+    def load_snapshot(self) -> None:
+        """Load the last known dashboard data from the on-disk snapshot."""
+        if not self.settings.cache_enabled:
+            return
 
-    async def load_data(self) -> None:
-        """Load dashboard data from API."""
         try:
-            self.is_loading = True
-            self.error_message = None
-            
-            # Initialize client
-            self.client = StrakerVerifyClient(
+            self.store = SnapshotStore(
+                Path(self.settings.cache_dir),
                 api_key=self.settings.straker_verify_api_key,
                 base_url=self.settings.straker_verify_base_url,
             )
+            stats = self.store.load_stats()
+            rows = self.store.load_project_rows()
+        except (OSError, sqlite3.Error, ValueError):
+            # A missing or corrupt snapshot just means a cold start
+            self.store = None
+            return
+
+        self.stats = stats
+        self._update_stats()
+        self._merge_rows(rows)
+        self._provisional = {row.id for row in rows}
+
+    async def save_snapshot(self) -> None:
+        """Save the current dashboard data to the on-disk snapshot."""
+        if self.store is None:
+            return
+
+        try:
+            if self.stats is not None:
+                await asyncio.to_thread(self.store.save_stats, self.stats)
+            # Never write back snapshot rows the API hasn't confirmed
+            confirmed = [row for row in self.projects.values() if row.id not in self._provisional]
+            await asyncio.to_thread(self.store.save_project_rows, confirmed)
+        except (OSError, sqlite3.Error):
+            pass
+
+    async def load_data(self) -> None:
+        """Load dashboard data from API.
+        
+        Stats, projects, token balance and languages are fetched concurrently,
+        and each panel is re-rendered as soon as its own data arrives.
+        """
+        started = time.perf_counter()
+        self.is_loading = True
+        self.error_message = None
+        
+        # Use the app's long-lived client so refreshes reuse its
+        # connection pool and response cache
+        if self.client is None:
+            self.client = await self.app.get_client()
             
             # Show notification about API mode
             if self.client.use_real_api:
                 self.app.notify("✓ Connected to Straker Verify API", severity="information", timeout=3)
             else:
                 self.app.notify("ℹ Using demo mode with mock data", severity="warning", timeout=3)
+        
+        results = await asyncio.gather(
+            self._load_panel("stats", self.client.get_stats, self._show_stats),
+            self._load_panel("projects", self._fetch_projects, self._show_projects),
+            self._load_panel("balance", self.client.get_token_balance, self._show_balance),
+            self._load_panel("languages", self.client.get_languages, self._show_languages),
+        )
+        self.is_loading = False
+        self.query_one("#projects", ProjectList).placeholder = self._projects_placeholder()
+        if self.stats is None:
+            self._update_stats()
+        
+        failures = [error for error in results if error is not None]
+        if failures:
+            # Only replace the dashboard with an error if there's nothing to show
+            if self.stats is None and not self.projects:
+                self.error_message = failures[0]
+            for error in failures:
+                self.app.notify(f"Error: {error}", severity="error")
+        else:
+            await self.save_snapshot()
+        
+        # Only the stats and projects panels drive refresh backoff; a failing
+        # balance or languages endpoint shouldn't slow project updates
+        stats_error, projects_error = results[:2]
+        self.app.refresh_scheduler.record_refresh(
+            (ProjectStatus(row.status) for row in self.projects.values()),
+            failed=stats_error is not None or projects_error is not None,
+        )
+        self.timings["refresh"] = time.perf_counter() - started
+        self.app.mark_startup("first_refresh")
+
+    async def _load_panel(
+        self,
+        name: str,
+        fetch: Callable[[], Awaitable[Any]],
+        show: Callable[[Any], Awaitable[None]],
+    ) -> Optional[str]:
+        """Fetch one panel's data and render it as soon as it arrives.
+        
+        Args:
+            name: Panel name (key into LOAD_TIMEOUTS)
+            fetch: Coroutine function returning the panel's data
+            show: Coroutine function rendering the panel
             
-            # Load stats and projects
-            self.stats = await self.client.get_stats()
-            self.projects = await self.client.list_projects()
-            
-            # Sort projects by update time (most recent first)
-            self.projects.sort(key=lambda p: p.updated_at, reverse=True)
-            
+        Returns:
+            Error message if loading failed, otherwise None
+        """
+        started = time.perf_counter()
+        try:
+            data = await asyncio.wait_for(fetch(), timeout=self.LOAD_TIMEOUTS[name])
+        except asyncio.TimeoutError:
+            return f"Timed out loading {name}"
         except Exception as e:
-            self.error_message = str(e)
-            self.app.notify(f"Error: {str(e)}", severity="error")
+            return f"Failed to load {name}: {e}"
         finally:
-            self.is_loading = False
-            # Refresh the screen to show new data
-            await self.recompose()
+            self.timings[f"fetch.{name}"] = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        await show(data)
+        self.timings[f"update.{name}"] = time.perf_counter() - started
+        return None
+
+    async def _fetch_projects(self) -> ProjectSync:
+        """Fetch project changes for this refresh.
+        
+        The first load pages through projects from the top; later refreshes
+        only ask the client for what changed since the last one.
+        
+        Returns:
+            Changed and removed projects
+        """
+        if self.client.high_water_mark is None:
+            page = await self._first_project_page()
+            complete = self._project_pages is None or len(page) < self.settings.projects_page_size
+            return ProjectSync(changed=page, removed=self._unconfirmed(page, complete, paged=True), full=complete)
+        
+        sync = await self.client.sync_projects(page_size=self.settings.projects_page_size)
+        # A full listing confirms every project that still exists
+        removed = self._unconfirmed(sync.changed, complete=sync.full)
+        if removed:
+            sync = sync.model_copy(update={"removed": sync.removed + removed})
+        return sync
+
+    def _unconfirmed(self, projects: List[Project], complete: bool, paged: bool = False) -> List[str]:
+        """Confirm snapshot projects against API results and find the gone ones.
+        
+        Args:
+            projects: Projects the API returned
+            complete: Whether the API has now returned every project
+            paged: Whether projects is the next page of the listing, most
+                recently updated first
+                
+        Returns:
+            IDs of snapshot projects the API no longer has
+        """
+        if not self._provisional:
+            return []
+        self._provisional.difference_update(project.id for project in projects)
+        if complete:
+            gone = set(self._provisional)
+        elif paged and projects:
+            # Anything newer than this page's oldest project would have been
+            # listed by now
+            oldest = projects[-1].updated_at
+            gone = {
+                project_id for project_id in self._provisional
+                if project_id in self.projects and self.projects[project_id].updated_at > oldest
+            }
+        else:
+            gone = set()
+        self._provisional -= gone
+        return list(gone)
 
-    async def refresh_data(self) -> None:
-        """Refresh dashboard data."""
-        await self.load_data()
+    async def _first_project_page(self) -> List[Project]:
+        """Start paging through projects and fetch the first page.
+        
+        Returns:
+            First page of projects (most recently updated first)
+        """
+        # A page fetch in flight still owns the old generator; it notices the
+        # restart and drops its page, and the generator is garbage collected
+        if self._project_pages is not None and not self._fetching_more():
+            await self._project_pages.aclose()
+        self._project_pages = self.client.iter_projects(page_size=self.settings.projects_page_size)
+        try:
+            return await self._project_pages.__anext__()
+        except StopAsyncIteration:
+            self._project_pages = None
+            return []
+
+    def on_project_list_near_end(self, message: ProjectList.NearEnd) -> None:
+        """Fetch the next page of projects when scrolled near the end.
+        
+        Args:
+            message: Near-end message from the project list
+        """
+        # Scrolling posts NearEnd repeatedly; never start a second fetch (or
+        # cancel the running one, which would finish the shared generator)
+        if self._project_pages is not None and not self._fetching_more():
+            self._more_worker = self.run_worker(self._load_more_projects(), group="more")
+
+    def _fetching_more(self) -> bool:
+        """Check whether a next-page fetch is in flight.
+        
+        Returns:
+            True if a next-page fetch hasn't finished yet
+        """
+        return self._more_worker is not None and not self._more_worker.is_finished
 
-    def watch_is_loading(self, is_loading: bool) -> None:
-        """Watch loading state changes.
+    async def _load_more_projects(self) -> None:
+        """Fetch the next page of projects and append it to the list."""
+        pages = self._project_pages
+        if pages is None:
+            return
+        
+        try:
+            page = await pages.__anext__()
+        except StopAsyncIteration:
+            page = []
+        except Exception as e:
+            self.app.notify(f"Error: Failed to load more projects: {e}", severity="error")
+            return
+        
+        # A refresh may have restarted paging while this page was in flight
+        if pages is not self._project_pages:
+            return
+        if not page:
+            self._project_pages = None
+        
+        removed = self._unconfirmed(page, complete=not page, paged=True)
+        if page or removed:
+            self._merge_projects(page, removed=removed)
+        self._hydrate_projects(page)
+
+    async def _show_stats(self, stats: ProjectStats) -> None:
+        """Render the stats panel.
         
         Args:
-            is_loading: New loading state
+            stats: Project statistics
         """
-        if not is_loading:
-            # Trigger recompose when loading completes
-            self.call_later(self.recompose)
+        self.stats = stats
+        self._update_stats()
+
+    def _update_stats(self) -> None:
+        """Update stat box values in place."""
+        for key, value in self._stat_values().items():
+            self.query_one(f"#stat-{key}", StatBox).set_value(value)
+
+    async def _show_projects(self, sync: ProjectSync) -> None:
+        """Render the projects list.
+        
+        Args:
+            sync: Changed and removed projects
+        """
+        if not sync.changed and not sync.removed:
+            return
+        self._merge_projects(sync.changed, removed=sync.removed)
+        self._hydrate_projects(sync.changed)
+
+    def _merge_projects(self, projects: List[Project], removed: Iterable[str] = ()) -> None:
+        """Merge projects into the list, keyed by project id.
+        
+        Args:
+            projects: Projects to merge
+            removed: IDs of projects to drop
+        """
+        self._merge_rows([ProjectRow.from_project(project) for project in projects], removed)
+
+    def _merge_rows(self, rows: List[ProjectRow], removed: Iterable[str] = ()) -> None:
+        """Merge project rows into the list, keyed by project id.
+        
+        Known projects are updated in place and new ones inserted, keeping
+        the list ordered by update time (most recent first). Only the given
+        rows are touched, and only cards whose fields changed are repainted.
+        
+        Args:
+            rows: Project rows to merge
+            removed: IDs of projects to drop
+        """
+        merged = []
+        for row in rows:
+            known = self.projects.get(row.id)
+            # Never let an older response overwrite a newer one
+            if known is None or row.updated_at >= known.updated_at:
+                self.projects[row.id] = row
+                merged.append(row)
+        gone = [project_id for project_id in removed if self.projects.pop(project_id, None) is not None]
+        if merged or gone:
+            self.query_one("#projects", ProjectList).update_rows(merged, removed=gone)
+
+    def _hydrate_projects(self, projects: List[Project]) -> None:
+        """Fetch details for completed projects listed without a quality score.
+        
+        Args:
+            projects: Projects that were just listed
+        """
+        project_ids = [
+            p.id for p in projects
+            if p.quality_score is None and p.status == ProjectStatus.COMPLETE
+        ]
+        if project_ids:
+            self.run_worker(self._hydrate_worker(project_ids), group="hydrate")
+
+    async def _hydrate_worker(self, project_ids: List[str]) -> None:
+        """Stream project details in and update their cards in batches.
+        
+        Args:
+            project_ids: IDs of projects to fetch
+        """
+        batch: List[Project] = []
+        try:
+            async for project in self.client.get_projects(
+                project_ids, concurrency=self.settings.hydrate_concurrency
+            ):
+                batch.append(project)
+                if len(batch) >= self.settings.hydrate_concurrency:
+                    self._merge_projects(batch)
+                    batch = []
+        except Exception:
+            # Cards simply keep showing no quality bar
+            pass
+        if batch:
+            self._merge_projects(batch)
+
+    async def _show_balance(self, balance: TokenBalance) -> None:
+        """Render the token balance.
+        
+        Args:
+            balance: Token balance
+        """
+        self.balance = balance
+        self.query_one("#balance", Label).update(self._balance_text())
+
+    async def _show_languages(self, languages: List[Language]) -> None:
+        """Render the supported languages.
+        
+        Args:
+            languages: Supported languages
+        """
+        self.languages = languages
+        self.query_one("#languages", Label).update(self._languages_text())
+
+    def refresh_data(self) -> None:
+        """Refresh dashboard data in the background.
+        
+        Does nothing if a refresh is already running, so manual and automatic
+        refreshes never overlap.
+        """
+        if self._load_worker is not None and self._load_worker.is_running:
+            return
+        self._load_worker = self.run_worker(self.load_data(), group="load")
+
+    def _auto_refresh_tick(self) -> None:
+        """Start an automatic refresh when the scheduler says one is due."""
+        if self.app.refresh_scheduler.is_due():
+            self.refresh_data()
 
     def watch_error_message(self, error_message: Optional[str]) -> None:
         """Watch error state changes.
@@ -249,10 +611,10 @@ class DashboardScreen(Screen):
         Args:
             error_message: New error message
         """
-        if error_message:
-            self.call_later(self.recompose)
-    
-    async def on_unmount(self) -> None:
-        """Handle screen unmount event - cleanup resources."""
-        if self.client:
-            await self.client.close()
\ No newline at end of file
+        try:
+            error = self.query_one("#error", Label)
+        except NoMatches:
+            # Not composed yet; compose() will pick up the message
+            return
+        error.update(f"Error: {error_message}")
+        error.display = bool(error_message)
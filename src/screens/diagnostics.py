@@ -0,0 +1,213 @@
+"""Diagnostics overlay for Straker Verify application.
+
+Shows, refreshed every second, where the dashboard's time goes: API latency
+per endpoint, how long each panel took to fetch (request plus parsing) and to
+update, the last refresh and recompose, and the process's memory. When fetch
+times are far above endpoint p95 the client is to blame; when update or
+recompose times dominate, rendering is.
+"""
+
+import os
+import sys
+from typing import Any, Dict, Optional
+
+from rich.table import Table
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import VerticalScroll
+from textual.screen import ModalScreen
+from textual.widgets import Static
+
+from ..utils.formatters import format_file_size, format_number, format_percentage
+from .dashboard import DashboardScreen
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def process_rss() -> Optional[int]:
+    """Get the resident set size of this process.
+
+    Returns:
+        Current RSS in bytes (peak RSS where the current value isn't
+        available), or None if unknown
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if not peak:
+        return None
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def format_ms(seconds: Optional[float]) -> str:
+    """Format a duration in milliseconds.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Formatted duration, or "—" if unknown
+    """
+    if seconds is None:
+        return "—"
+    return f"{seconds * 1000:,.1f} ms"
+
+
+class DiagnosticsScreen(ModalScreen):
+    """Live performance overlay on top of the dashboard."""
+
+    CSS = """
+    DiagnosticsScreen {
+        align: right top;
+    }
+
+    #diagnostics {
+        width: 72;
+        height: 100%;
+        border: solid $accent;
+        background: $panel;
+        padding: 0 1;
+    }
+    """
+
+    BINDINGS = [
+        Binding("escape", "dismiss", "Close", show=True),
+        Binding("c", "recompose_dashboard", "Time Recompose", show=True),
+    ]
+
+    # Seconds between updates
+    UPDATE_INTERVAL = 1.0
+
+    def compose(self) -> ComposeResult:
+        """Compose the diagnostics overlay.
+
+        Yields:
+            Diagnostics widgets
+        """
+        with VerticalScroll(id="diagnostics"):
+            yield Static(id="diagnostics-body")
+
+    def on_mount(self) -> None:
+        """Handle screen mount event."""
+        self.update_diagnostics()
+        self.set_interval(self.UPDATE_INTERVAL, self.update_diagnostics)
+
+    def _dashboard(self) -> Optional[DashboardScreen]:
+        """Find the dashboard screen underneath.
+
+        Returns:
+            Dashboard screen, or None if it isn't on the stack
+        """
+        for screen in self.app.screen_stack:
+            if isinstance(screen, DashboardScreen):
+                return screen
+        return None
+
+    def update_diagnostics(self) -> None:
+        """Redraw the diagnostics from current measurements."""
+        metrics = self.app.client.metrics_snapshot()
+        dashboard = self._dashboard()
+        body = Table.grid(padding=(0, 1))
+        body.add_column()
+        body.add_row(Text("Diagnostics", style="bold"))
+        body.add_row(self._overview_table(metrics, dashboard))
+        if dashboard is not None:
+            body.add_row(self._panels_table(dashboard.timings))
+        body.add_row(self._endpoints_table(metrics["endpoints"]))
+        self.query_one("#diagnostics-body", Static).update(body)
+
+    def _overview_table(self, metrics: Dict[str, Any], dashboard: Optional[DashboardScreen]) -> Table:
+        """Build the overview table.
+
+        Args:
+            metrics: Client metrics snapshot
+            dashboard: Dashboard screen, if any
+
+        Returns:
+            Table of headline figures
+        """
+        timings = dashboard.timings if dashboard is not None else {}
+        cache = metrics.get("cache")
+        rss = process_rss()
+
+        table = Table(show_header=False, box=None, padding=(0, 1))
+        table.add_column(style="dim")
+        table.add_column(justify="right")
+        table.add_row("Last refresh", format_ms(timings.get("refresh")))
+        table.add_row("Last recompose", format_ms(timings.get("recompose")))
+        table.add_row("Requests in flight", format_number(metrics["in_flight"]))
+        table.add_row(
+            "Requests / errors / retries",
+            f"{metrics['requests']:,} / {metrics['errors']:,} / {metrics['retries']:,}",
+        )
+        table.add_row(
+            "Cache hit rate",
+            format_percentage(cache["hit_ratio"] * 100) if cache else "disabled",
+        )
+        table.add_row(
+            "Widgets",
+            format_number(len(list(dashboard.walk_children()))) if dashboard is not None else "—",
+        )
+        table.add_row("Process RSS", format_file_size(rss) if rss is not None else "—")
+        return table
+
+    def _panels_table(self, timings: Dict[str, float]) -> Table:
+        """Build the table of per-panel fetch and update times.
+
+        Args:
+            timings: Dashboard timings
+
+        Returns:
+            Table with one row per panel
+        """
+        table = Table(title="Last refresh by panel", box=None, padding=(0, 1), title_justify="left")
+        table.add_column("Panel")
+        table.add_column("Fetch + parse", justify="right")
+        table.add_column("Update", justify="right")
+        for name in DashboardScreen.LOAD_TIMEOUTS:
+            table.add_row(name, format_ms(timings.get(f"fetch.{name}")), format_ms(timings.get(f"update.{name}")))
+        return table
+
+    def _endpoints_table(self, endpoints: Dict[str, Dict[str, Any]]) -> Table:
+        """Build the table of per-endpoint latency.
+
+        Args:
+            endpoints: Endpoint metrics from the client snapshot
+
+        Returns:
+            Table with one row per endpoint, slowest first
+        """
+        table = Table(title="API latency by endpoint", box=None, padding=(0, 1), title_justify="left")
+        table.add_column("Endpoint")
+        table.add_column("Reqs", justify="right")
+        table.add_column("p50", justify="right")
+        table.add_column("p95", justify="right")
+        rows = sorted(endpoints.items(), key=lambda item: -(item[1]["p95_ms"] or 0))
+        for name, endpoint in rows:
+            p50, p95 = endpoint["p50_ms"], endpoint["p95_ms"]
+            table.add_row(
+                name,
+                format_number(endpoint["requests"]),
+                f"{p50:,.1f} ms" if p50 is not None else "—",
+                f"{p95:,.1f} ms" if p95 is not None else "—",
+            )
+        if not rows:
+            table.add_row(Text("No API requests yet (demo mode makes none)", style="dim"), "", "", "")
+        return table
+
+    async def action_recompose_dashboard(self) -> None:
+        """Rebuild the dashboard's widgets once to measure recompose time."""
+        dashboard = self._dashboard()
+        if dashboard is not None:
+            await dashboard.recompose()
+            self.update_diagnostics()
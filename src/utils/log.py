@@ -0,0 +1,76 @@
+"""Logging setup: structured JSON lines written to LOG_FILE."""
+
+import json
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+from typing import Optional
+
+
+# Root of every logger in the application
+LOGGER_NAME = "straker_verify"
+
+# Size at which LOG_FILE is rotated, and how many rotated files are kept
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line.
+
+    Structured fields passed as ``extra={"fields": {...}}`` are merged into
+    the object.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record.
+
+        Args:
+            record: Log record
+
+        Returns:
+            JSON line
+        """
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
+    """Configure the application logger.
+
+    Logs only go to a file: writing to the terminal would corrupt the TUI.
+    The file is rotated at LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT old files
+    (``LOG_FILE.1`` and so on), so a long-running dashboard that logs every
+    request can't fill the disk.
+
+    Args:
+        level: Logging level name
+        log_file: Path of the JSON-lines log file, or None to disable logging
+
+    Returns:
+        Application root logger
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    if log_file:
+        handler: logging.Handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+        )
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler = logging.NullHandler()
+    logger.addHandler(handler)
+    return logger
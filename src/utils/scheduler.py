@@ -0,0 +1,105 @@
+"""Auto-refresh scheduling for the dashboard."""
+
+import time
+from typing import Callable, Iterable
+
+from ..api.models import ProjectStatus
+
+
+# Statuses that mean a project may still change on its own
+ACTIVE_STATUSES = {ProjectStatus.PENDING, ProjectStatus.PROCESSING}
+
+# Hard limits on the adaptive interval, matching the AUTO_REFRESH_INTERVAL bounds
+MIN_INTERVAL = 1.0
+MAX_INTERVAL = 300.0
+
+
+class RefreshScheduler:
+    """Decides when the dashboard should refresh next.
+
+    The base interval is adapted to what is on screen: it is halved while any
+    project is still being processed, stretched while everything has settled,
+    and backed off exponentially after failed refreshes. Refreshing pauses
+    while the app is unfocused or the user has been idle.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        idle_timeout: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            interval: Base refresh interval in seconds
+            idle_timeout: Seconds without user activity before pausing (0 disables)
+            clock: Monotonic time source (overridable for testing)
+        """
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self.focused = True
+        self.failures = 0
+        self.last_activity = clock()
+        self.next_due = clock() + interval
+
+    def next_delay(self, statuses: Iterable[ProjectStatus]) -> float:
+        """Compute the delay until the next refresh.
+
+        Args:
+            statuses: Statuses of the projects currently shown
+
+        Returns:
+            Delay in seconds
+        """
+        if self.failures:
+            delay = self.interval * 2 ** min(self.failures, 8)
+        else:
+            statuses = set(statuses)
+            if statuses & ACTIVE_STATUSES:
+                delay = self.interval / 2
+            elif statuses:
+                delay = self.interval * 4
+            else:
+                delay = self.interval
+
+        return max(MIN_INTERVAL, min(delay, MAX_INTERVAL))
+
+    def record_refresh(self, statuses: Iterable[ProjectStatus], failed: bool = False) -> float:
+        """Record a finished refresh and schedule the next one.
+
+        Args:
+            statuses: Statuses of the projects currently shown
+            failed: Whether the refresh failed
+
+        Returns:
+            Delay in seconds until the next refresh
+        """
+        self.failures = self.failures + 1 if failed else 0
+        delay = self.next_delay(statuses)
+        self.next_due = self._clock() + delay
+        return delay
+
+    def record_activity(self) -> None:
+        """Record user activity, resuming refreshes if idle."""
+        self.last_activity = self._clock()
+
+    @property
+    def paused(self) -> bool:
+        """Whether refreshing is paused because the app is unfocused or idle.
+
+        Returns:
+            True if paused
+        """
+        if not self.focused:
+            return True
+        return bool(self.idle_timeout) and self._clock() - self.last_activity > self.idle_timeout
+
+    def is_due(self) -> bool:
+        """Check whether a refresh should start now.
+
+        Returns:
+            True if the next refresh is due and not paused
+        """
+        return not self.paused and self._clock() >= self.next_due
@@ -0,0 +1,49 @@
+"""Startup timing for --profile-startup."""
+
+import sys
+import time
+from typing import Any, Dict, Optional
+
+
+# Modules that should not be loaded before the first frame is painted
+DEFERRED_MODULES = ("httpx", "numpy", "src.api.client", "src.screens.diagnostics")
+
+
+class StartupProfile:
+    """Records how long each startup milestone took to reach."""
+
+    def __init__(self, started: Optional[float] = None):
+        """Initialize the profile.
+
+        Args:
+            started: time.perf_counter() value startup is measured from
+                (defaults to now)
+        """
+        self.started = time.perf_counter() if started is None else started
+        self.marks: Dict[str, float] = {}
+        self.loaded_at_first_paint: Dict[str, bool] = {}
+
+    def mark(self, name: str) -> None:
+        """Record reaching a milestone; only the first time counts.
+
+        Args:
+            name: Milestone name
+        """
+        if name in self.marks:
+            return
+        self.marks[name] = time.perf_counter() - self.started
+        if name == "first_paint":
+            self.loaded_at_first_paint = {module: module in sys.modules for module in DEFERRED_MODULES}
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize startup.
+
+        Returns:
+            Milliseconds to each milestone, in the order reached, and which
+            deferred modules were already loaded at first paint
+        """
+        return {
+            "milestones_ms": {name: round(seconds * 1000, 1) for name, seconds in self.marks.items()},
+            "loaded_at_first_paint": self.loaded_at_first_paint,
+            "modules_loaded": len(sys.modules),
+        }
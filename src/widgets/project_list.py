@@ -0,0 +1,286 @@
+"""Virtualized project list widget.
+
+Renders project cards with Textual's Line API, so only the rows currently in
+the viewport are ever drawn, no matter how many projects are loaded. Rows are
+kept most recently updated first and changed by project id, so merging a few
+projects into a long list only touches those rows.
+"""
+
+from datetime import datetime
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional
+
+from rich.segment import Segment
+from rich.text import Text
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from ..api.records import ProjectRow
+from ..utils.formatters import (
+    format_percentage,
+    format_quality_bar,
+    format_status_badge,
+    format_time_ago,
+)
+
+
+# Lines per card: top border, three content lines, bottom border, gap
+CARD_HEIGHT = 6
+
+
+class ProjectList(ScrollView, can_focus=True):
+    """Scrollable list of project cards that only renders visible rows."""
+
+    COMPONENT_CLASSES = {
+        "project-list--border",
+        "project-list--meta",
+    }
+
+    DEFAULT_CSS = """
+    ProjectList {
+        height: 1fr;
+    }
+
+    ProjectList > .project-list--border {
+        color: $primary;
+    }
+
+    ProjectList > .project-list--meta {
+        color: $text-muted;
+    }
+    """
+
+    placeholder: reactive[str] = reactive("")
+
+    class NearEnd(Message):
+        """Posted when the list is scrolled to within a screen of its end.
+
+        Also posted when rows are added or the list is resized and the rows
+        don't reach a screen past the viewport, since a list that can't
+        scroll would otherwise never ask for more.
+        """
+
+        def __init__(self, project_list: "ProjectList") -> None:
+            """Initialize the message.
+
+            Args:
+                project_list: List that was scrolled
+            """
+            super().__init__()
+            self.project_list = project_list
+
+    def __init__(self, rows: Iterable[ProjectRow] = (), placeholder: str = "", **kwargs):
+        """Initialize project list.
+
+        Args:
+            rows: Initial rows, in any order
+            placeholder: Text shown when there are no rows
+            **kwargs: Additional widget arguments
+        """
+        super().__init__(**kwargs)
+        self.rows: List[ProjectRow] = sorted(rows, key=attrgetter("updated_at"), reverse=True)
+        # Project ID -> index into rows
+        self._positions: Dict[str, int] = {}
+        self._reindex(0)
+        self.placeholder = placeholder
+
+    def on_mount(self) -> None:
+        """Handle mount event."""
+        super().on_mount()
+        self.watch(self, "scroll_y", self._check_near_end, init=False)
+
+    def update_rows(self, rows: Iterable[ProjectRow], removed: Iterable[str] = ()) -> int:
+        """Insert, update and remove rows by project id.
+
+        A row equal to the one already shown is skipped, a row whose update
+        time is unchanged is patched in place, and any other row is moved to
+        its place in the order. Only cards that changed or shifted, and are
+        in the viewport, are repainted.
+
+        Args:
+            rows: New or updated rows
+            removed: IDs of projects to remove
+
+        Returns:
+            Number of rows that changed
+        """
+        patched: List[int] = []
+        moved: Dict[str, ProjectRow] = {}
+        for row in rows:
+            index = self._positions.get(row.id)
+            if index is None:
+                moved[row.id] = row
+            elif self.rows[index] != row:
+                if self.rows[index].updated_at == row.updated_at:
+                    self.rows[index] = row
+                    patched.append(index)
+                else:
+                    moved[row.id] = row
+        dropped = {project_id for project_id in removed if project_id in self._positions}
+        dropped.update(project_id for project_id in moved if project_id in self._positions)
+
+        count = len(patched) + len(moved) + len(dropped - moved.keys())
+        if not moved and not dropped:
+            self._repaint(patched)
+            return count
+
+        # Delete from the end so the remaining positions stay valid
+        first = len(self.rows)
+        for index in sorted((self._positions.pop(project_id) for project_id in dropped), reverse=True):
+            del self.rows[index]
+            first = index
+        for row in moved.values():
+            index = self._insertion_point(row.updated_at)
+            self.rows.insert(index, row)
+            first = min(first, index)
+        self._reindex(first)
+
+        self._update_virtual_size()
+        self._repaint(patched, shifted_from=first)
+        self._check_near_end()
+        return count
+
+    def _insertion_point(self, updated_at: datetime) -> int:
+        """Find where a row belongs, after any rows updated at the same time.
+
+        Args:
+            updated_at: Row's update time
+
+        Returns:
+            Index to insert the row at
+        """
+        low, high = 0, len(self.rows)
+        while low < high:
+            middle = (low + high) // 2
+            if self.rows[middle].updated_at >= updated_at:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _reindex(self, first: int) -> None:
+        """Bring the position of every row from an index onwards up to date.
+
+        Args:
+            first: Index of the first row that may have moved
+        """
+        self._positions.update(zip(map(attrgetter("id"), self.rows[first:]), range(first, len(self.rows))))
+
+    def _repaint(self, indices: Iterable[int], shifted_from: Optional[int] = None) -> None:
+        """Repaint the cards that changed, if they're in the viewport.
+
+        Args:
+            indices: Indices of cards patched in place
+            shifted_from: Index of the first card that moved, if any; it and
+                every card below it are repainted
+        """
+        scroll_y = self.scroll_offset.y
+        height = self.size.height
+        for index in indices:
+            top = index * CARD_HEIGHT - scroll_y
+            if -CARD_HEIGHT < top < height:
+                self.refresh(Region(0, top, self.size.width, CARD_HEIGHT))
+        if shifted_from is not None:
+            top = max(0, shifted_from * CARD_HEIGHT - scroll_y)
+            if top < height:
+                self.refresh(Region(0, top, self.size.width, height - top))
+
+    def _update_virtual_size(self) -> None:
+        """Resize the scrollable area to fit all rows."""
+        self.virtual_size = Size(self.size.width, len(self.rows) * CARD_HEIGHT)
+
+    def on_resize(self) -> None:
+        """Handle resize event."""
+        self._update_virtual_size()
+        self._check_near_end()
+
+    def watch_placeholder(self) -> None:
+        """Repaint when the placeholder text changes."""
+        self.refresh()
+
+    def _check_near_end(self, scroll_y: Optional[float] = None) -> None:
+        """Post NearEnd when the viewport is within a screen of the end.
+
+        Args:
+            scroll_y: New vertical scroll offset (defaults to the current one)
+        """
+        if not self.rows or not self.size.height:
+            return
+        if scroll_y is None:
+            scroll_y = self.scroll_y
+        if scroll_y >= self.max_scroll_y - self.size.height:
+            self.post_message(self.NearEnd(self))
+
+    def render_line(self, y: int) -> Strip:
+        """Render one line of the visible region.
+
+        Args:
+            y: Line offset from the top of the viewport
+
+        Returns:
+            Rendered line
+        """
+        width = self.scrollable_content_region.width
+        base_style = self.rich_style
+
+        if not self.rows:
+            text = Text(self.placeholder) if y == 0 else Text()
+            return self._text_strip(text, width)
+
+        index, line = divmod(self.scroll_offset.y + y, CARD_HEIGHT)
+        if index >= len(self.rows) or line == CARD_HEIGHT - 1 or width < 4:
+            return Strip.blank(width, base_style)
+
+        border_style = base_style + self.get_component_rich_style("project-list--border")
+        if line == 0:
+            return Strip([Segment("┌" + "─" * (width - 2) + "┐", border_style)])
+        if line == CARD_HEIGHT - 2:
+            return Strip([Segment("└" + "─" * (width - 2) + "┘", border_style)])
+
+        content = self._text_strip(self._card_line(self.rows[index], line - 1), width - 4)
+        return Strip.join([
+            Strip([Segment("│ ", border_style)]),
+            content,
+            Strip([Segment(" │", border_style)]),
+        ])
+
+    def _card_line(self, row: ProjectRow, line: int) -> Text:
+        """Build the text for one content line of a card.
+
+        Args:
+            row: Project row
+            line: Content line (0 header, 1 meta, 2 quality)
+
+        Returns:
+            Line text
+        """
+        if line == 0:
+            text = Text(row.name, style="bold")
+            text.append("  ")
+            text.append_text(format_status_badge(row.status))
+            return text
+
+        if line == 1:
+            meta_style = self.get_component_rich_style("project-list--meta")
+            return Text(f"{row.language_pair}  {format_time_ago(row.updated_at)}", style=meta_style)
+
+        if row.quality is not None:
+            return Text(f"Quality: {format_quality_bar(row.quality)} {format_percentage(row.quality)}")
+        return Text()
+
+    def _text_strip(self, text: Text, width: int) -> Strip:
+        """Render text to a strip of an exact width.
+
+        Args:
+            text: Text to render
+            width: Cell width of the strip
+
+        Returns:
+            Rendered strip
+        """
+        text.truncate(width, overflow="ellipsis")
+        segments = list(text.render(self.app.console, end=""))
+        return Strip(segments).apply_style(self.rich_style).adjust_cell_length(width, self.rich_style)
@@ -0,0 +1,134 @@
+"""Tests for the response cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.api.cache import ResponseCache, cached
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeClient:
+    """Minimal client exposing what @cached needs."""
+
+    def __init__(self, cache, responses):
+        self._cache = cache
+        self.responses = list(responses)
+        self.calls = 0
+
+    @cached("stats")
+    async def get_stats(self):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    @cached("projects")
+    async def list_projects(self, page=0):
+        self.calls += 1
+        return [page]
+
+
+def status_error(code: int) -> httpx.HTTPStatusError:
+    """Build an HTTP status error."""
+    request = httpx.Request("GET", "https://api.test/v1/stats")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(code, request=request))
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(default_ttl=10, clock=clock)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    clock.now = 10
+    assert cache.get("key") is None
+    assert cache.get_stale("key") == "value"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_is_capped_by_default_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(default_ttl=5, clock=clock)
+    cache.set("key", "value", ttl=60)
+    clock.now = 5
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get_stale("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_invalidate_by_endpoint_prefix():
+    cache = ResponseCache()
+    cache.set(("projects", 1), "page 1")
+    cache.set(("projects", 2), "page 2")
+    cache.set(("stats",), "stats")
+    cache.invalidate("projects")
+    assert len(cache) == 1
+    assert cache.get(("stats",)) == "stats"
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_cached_method_reuses_fresh_results_per_arguments():
+    client = FakeClient(ResponseCache(), [])
+
+    async def scenario():
+        first = await client.list_projects(1)
+        first.append("mutated")
+        return await client.list_projects(1), await client.list_projects(2)
+
+    assert asyncio.run(scenario()) == ([1], [2])
+    assert client.calls == 2
+
+
+def test_stale_value_is_served_when_api_is_unavailable():
+    clock = FakeClock()
+    client = FakeClient(ResponseCache(clock=clock), ["fresh", status_error(503), httpx.ConnectError("down")])
+
+    async def scenario():
+        await client.get_stats()
+        clock.now = 3600
+        return await client.get_stats(), await client.get_stats()
+
+    assert asyncio.run(scenario()) == ("fresh", "fresh")
+
+
+def test_client_errors_are_not_masked_by_stale_values():
+    clock = FakeClock()
+    client = FakeClient(ResponseCache(clock=clock), ["fresh", status_error(404)])
+
+    async def scenario():
+        await client.get_stats()
+        clock.now = 3600
+        await client.get_stats()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(scenario())
+
+
+def test_disabled_cache_calls_through():
+    client = FakeClient(None, ["a", "b"])
+
+    async def scenario():
+        return await client.get_stats(), await client.get_stats()
+
+    assert asyncio.run(scenario()) == ("a", "b")
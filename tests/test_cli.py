@@ -0,0 +1,51 @@
+"""Tests for the headless command-line mode."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from src import cli
+from src.api.client import StrakerVerifyClient
+from src.config import Settings
+from src.main import main
+
+
+@pytest.fixture(autouse=True)
+def demo_settings(monkeypatch):
+    settings = Settings(_env_file=None, STRAKER_VERIFY_API_KEY="demo", MOCK_LATENCY=0, CACHE_ENABLED=False)
+    monkeypatch.setattr(cli, "load_settings", lambda: settings)
+    return settings
+
+
+def test_status_choices_cover_every_project_status():
+    result = CliRunner().invoke(main, ["projects", "--status", "cancelled", "--format", "json"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == []
+
+
+def test_json_listing_is_closed_on_success():
+    result = CliRunner().invoke(main, ["projects", "--format", "json"])
+    assert result.exit_code == 0, result.output
+    assert len(json.loads(result.output)) > 0
+
+
+def test_json_listing_left_open_when_a_page_fails(monkeypatch):
+    async def failing_pages(self, page_size=100):
+        yield list(self._projects.values())[:1]
+        raise RuntimeError("connection lost")
+
+    monkeypatch.setattr(StrakerVerifyClient, "iter_projects", failing_pages)
+    result = CliRunner().invoke(main, ["projects", "--format", "json"])
+
+    assert result.exit_code == 1
+    assert result.stdout.startswith("[\n  {")
+    assert not result.stdout.rstrip().endswith("]")
+    with pytest.raises(ValueError):
+        json.loads(result.stdout)
+
+
+def test_json_flag_implies_once():
+    result = CliRunner().invoke(main, ["--json"])
+    assert result.exit_code == 0, result.output
+    assert "total_projects" in json.loads(result.output)
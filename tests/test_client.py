@@ -0,0 +1,234 @@
+"""Tests for StrakerVerifyClient against an in-process API."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from src.api.cache import ResponseCache
+from src.api.resilience import RetryPolicy
+from src.api.client import StrakerVerifyClient
+
+
+API_KEY = "sk_test_" + "0" * 32
+BASE_URL = "https://api.test"
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def project_json(index: int, **fields) -> dict:
+    """Build a project as the API returns it."""
+    updated_at = NOW - timedelta(minutes=index)
+    project = {
+        "id": f"proj-{index}",
+        "name": f"Project {index}",
+        "source_language": "en",
+        "target_language": "es",
+        "status": "complete",
+        "quality_score": {"overall": 90.0},
+        "files": [],
+        "created_at": (updated_at - timedelta(hours=1)).isoformat(),
+        "updated_at": updated_at.isoformat(),
+    }
+    project.update(fields)
+    return project
+
+
+def make_client(handler, cache: bool = True, clock=None) -> StrakerVerifyClient:
+    """Build a real-API client served by an in-process handler."""
+    client = StrakerVerifyClient(
+        API_KEY,
+        BASE_URL,
+        cache_enabled=cache,
+        transport=httpx.MockTransport(handler),
+    )
+    client.retry_policy = RetryPolicy(max_attempts=1)
+    if cache and clock is not None:
+        client._cache = ResponseCache(clock=clock)
+    return client
+
+
+STATS = {
+    "total_projects": 999,
+    "active_projects": 10,
+    "completed_projects": 900,
+    "failed_projects": 89,
+    "total_files": 1500,
+    "average_quality": 91.0,
+}
+
+
+def test_get_stats_serves_stale_cache_during_outage():
+    clock = FakeClock()
+    state = {"down": False}
+
+    def handler(request):
+        if state["down"]:
+            return httpx.Response(503)
+        if request.url.path == "/v1/stats":
+            return httpx.Response(200, json=STATS)
+        return httpx.Response(200, json={"projects": [project_json(0)]})
+
+    async def scenario():
+        client = make_client(handler, clock=clock)
+        try:
+            await client.list_projects()
+            assert (await client.get_stats()).total_projects == 999
+            clock.now += 3600
+            state["down"] = True
+            during = await client.get_stats()
+            state["down"] = False
+            after = await client.get_stats()
+        finally:
+            await client.close()
+        return during.total_projects, after.total_projects
+
+    assert asyncio.run(scenario()) == (999, 999)
+
+
+def test_get_stats_falls_back_to_local_projects_without_caching_them():
+    state = {"down": True}
+
+    def handler(request):
+        if request.url.path == "/v1/stats":
+            return httpx.Response(503) if state["down"] else httpx.Response(200, json=STATS)
+        return httpx.Response(200, json={"projects": [project_json(0)]})
+
+    async def scenario():
+        client = make_client(handler)
+        try:
+            await client.list_projects()
+            during = await client.get_stats()
+            state["down"] = False
+            after = await client.get_stats()
+        finally:
+            await client.close()
+        return during.total_projects, after.total_projects
+
+    assert asyncio.run(scenario()) == (1, 999)
+
+
+def test_get_projects_never_overwrites_newer_synced_project():
+    state = {"detail": project_json(0, status="processing", quality_score=None)}
+
+    def handler(request):
+        if request.url.path == "/v1/projects/proj-0":
+            return httpx.Response(200, json=state["detail"])
+        newer = project_json(0, updated_at=(NOW + timedelta(minutes=5)).isoformat())
+        return httpx.Response(200, json={"projects": [newer]})
+
+    async def scenario():
+        client = make_client(handler)
+        try:
+            # Cache an older detail, then sync a newer summary
+            await client.get_project("proj-0")
+            await client.list_projects()
+            [detail] = [p async for p in client.get_projects(["proj-0"])]
+            stats = client._projects.stats()
+        finally:
+            await client.close()
+        return detail.status.value, client._projects["proj-0"].status.value, stats.completed_projects
+
+    assert asyncio.run(scenario()) == ("processing", "complete", 1)
+
+
+def test_worker_pools_reject_zero_concurrency():
+    async def scenario():
+        client = StrakerVerifyClient("demo", cache_enabled=False)
+        errors = []
+        for pool in (
+            client.get_projects(["a"], concurrency=0),
+            client.upload_files("a", [], concurrency=0),
+            client.iter_projects(page_size=0),
+        ):
+            try:
+                await asyncio.wait_for(pool.__anext__(), timeout=1)
+            except ValueError as e:
+                errors.append(str(e))
+        await client.close()
+        return errors
+
+    assert len(asyncio.run(scenario())) == 3
+
+
+def test_sync_projects_reports_deleted_ids_from_filtered_server():
+    requests = []
+    state = {"projects": [project_json(0), project_json(1), project_json(2)]}
+
+    def handler(request):
+        requests.append(dict(request.url.params))
+        if "updated_since" not in request.url.params:
+            return httpx.Response(200, json={"projects": state["projects"]})
+        changed = project_json(1, status="failed", updated_at=(NOW + timedelta(minutes=1)).isoformat())
+        return httpx.Response(200, json={"projects": [changed], "deleted_ids": ["proj-2", "proj-unknown"]})
+
+    async def scenario():
+        client = make_client(handler)
+        try:
+            first = await client.sync_projects()
+            second = await client.sync_projects()
+        finally:
+            await client.close()
+        return client, first, second
+
+    client, first, second = asyncio.run(scenario())
+    assert first.full and len(first.changed) == 3 and first.removed == []
+    assert requests[1]["updated_since"] == NOW.isoformat()
+    assert not second.full
+    assert [p.id for p in second.changed] == ["proj-1"]
+    assert second.removed == ["proj-2"]
+    assert sorted(client._projects) == ["proj-0", "proj-1"]
+    assert second.high_water_mark == NOW + timedelta(minutes=1)
+
+
+def test_sync_projects_diffs_full_list_when_server_ignores_filter():
+    state = {"projects": [project_json(0), project_json(1), project_json(2)]}
+
+    def handler(request):
+        # Ignores updated_since and always returns everything
+        return httpx.Response(200, json={"projects": state["projects"]})
+
+    async def scenario():
+        client = make_client(handler)
+        try:
+            await client.sync_projects()
+            state["projects"] = [project_json(0, status="failed"), project_json(1)]
+            sync = await client.sync_projects()
+        finally:
+            await client.close()
+        return client, sync
+
+    client, sync = asyncio.run(scenario())
+    assert sync.full
+    assert [p.id for p in sync.changed] == ["proj-0"]
+    assert sync.removed == ["proj-2"]
+    assert sorted(client._projects) == ["proj-0", "proj-1"]
+
+
+def test_get_languages_falls_back_to_built_in_list_without_caching_it():
+    state = {"down": True}
+    languages = {"languages": [{"id": "mi", "code": "mi", "name": "Māori"}]}
+
+    def handler(request):
+        return httpx.Response(503) if state["down"] else httpx.Response(200, json=languages)
+
+    async def scenario():
+        client = make_client(handler)
+        try:
+            during = await client.get_languages()
+            state["down"] = False
+            after = await client.get_languages()
+        finally:
+            await client.close()
+        return len(during), [lang.code for lang in after]
+
+    assert asyncio.run(scenario()) == (8, ["mi"])
@@ -0,0 +1,41 @@
+"""Tests for settings validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.config import Settings
+
+
+def make_settings(**values) -> Settings:
+    """Build settings isolated from the user's environment."""
+    return Settings(_env_file=None, STRAKER_VERIFY_API_KEY="demo", **values)
+
+
+@pytest.mark.parametrize("name", ["PROJECTS_PAGE_SIZE", "HYDRATE_CONCURRENCY"])
+@pytest.mark.parametrize("value", [0, -1, 100000])
+def test_pool_and_page_sizes_are_bounded(name, value):
+    with pytest.raises(ValidationError):
+        make_settings(**{name: value})
+
+
+def test_defaults_are_valid():
+    settings = make_settings()
+    assert settings.projects_page_size >= 1
+    assert settings.hydrate_concurrency >= 1
+
+
+@pytest.mark.parametrize("mix", [
+    "complete=0.6,failed=-0.1",
+    "complete=nan",
+    "complete=lots",
+    "finished=1",
+    "complete=0,failed=0",
+])
+def test_invalid_mock_status_mix_is_rejected(mix):
+    with pytest.raises(ValidationError):
+        make_settings(MOCK_STATUS_MIX=mix)
+
+
+def test_mock_status_mix_accepts_zero_weights():
+    settings = make_settings(MOCK_STATUS_MIX="complete=1,failed=0")
+    assert settings.mock_status_mix == "complete=1,failed=0"
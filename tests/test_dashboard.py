@@ -0,0 +1,131 @@
+"""Tests for the dashboard screen."""
+
+import asyncio
+
+from src.app import StrakerVerifyApp
+from src.config import Settings
+from src.widgets.project_list import ProjectList
+
+
+def make_settings(tmp_path, **overrides) -> Settings:
+    """Build demo-mode settings isolated from the user's environment."""
+    values = {
+        "STRAKER_VERIFY_API_KEY": "demo",
+        "CACHE_DIR": str(tmp_path),
+        "MOCK_LATENCY": 0.01,
+        "AUTO_REFRESH_INTERVAL": 300,
+    }
+    values.update(overrides)
+    return Settings(_env_file=None, **values)
+
+
+async def wait_for_first_load(app, pilot):
+    """Wait until the dashboard's first refresh has finished."""
+    screen = app.screen
+    while screen._load_worker is None:
+        await pilot.pause()
+    await screen._load_worker.wait()
+    await pilot.pause()
+    return screen
+
+
+def test_repeated_near_end_keeps_paging(tmp_path):
+    settings = make_settings(tmp_path, MOCK_PROJECTS=500, PROJECTS_PAGE_SIZE=20)
+
+    async def scenario():
+        app = StrakerVerifyApp(settings)
+        async with app.run_test(size=(120, 40)) as pilot:
+            screen = await wait_for_first_load(app, pilot)
+            project_list = screen.query_one("#projects", ProjectList)
+
+            for _ in range(3):
+                # Scrolling posts NearEnd on every tick near the end
+                project_list.post_message(ProjectList.NearEnd(project_list))
+                await pilot.pause(0.005)
+                project_list.post_message(ProjectList.NearEnd(project_list))
+                await screen._more_worker.wait()
+                await pilot.pause()
+            return len(screen.projects), screen._project_pages is not None
+
+    loaded, more = asyncio.run(scenario())
+    # The list may also post NearEnd itself as rows arrive
+    assert 80 <= loaded < 500
+    assert more
+
+
+def test_snapshot_projects_gone_from_api_are_dropped(tmp_path):
+    # Demo-mode sample projects get new IDs on every launch, so each start
+    # sees the previous run's projects in the snapshot but not in the API
+    settings = make_settings(tmp_path, CACHE_ENABLED=True)
+
+    async def launch():
+        app = StrakerVerifyApp(settings)
+        async with app.run_test(size=(120, 40)) as pilot:
+            screen = await wait_for_first_load(app, pilot)
+            return len(screen.projects), screen.stats.total_projects
+
+    counts = [asyncio.run(launch()) for _ in range(3)]
+    assert counts == [(2, 2)] * 3
+
+
+def test_unconfirmed_snapshot_rows_are_kept_until_paged_past(tmp_path):
+    settings = make_settings(tmp_path, MOCK_PROJECTS=100, PROJECTS_PAGE_SIZE=20)
+
+    async def scenario():
+        app = StrakerVerifyApp(settings)
+        async with app.run_test(size=(120, 40)) as pilot:
+            screen = await wait_for_first_load(app, pilot)
+            ordered = list(screen.query_one("#projects", ProjectList).rows)
+            newest, oldest = ordered[0], ordered[-1]
+            ghost_new = newest._replace(id="ghost-new")
+            ghost_old = oldest._replace(id="ghost-old", updated_at=oldest.updated_at.replace(year=2000))
+            screen._provisional = {ghost_new.id, ghost_old.id}
+            screen._merge_rows([ghost_new, ghost_old])
+
+            removed = screen._unconfirmed(ordered[2:10], complete=False, paged=True)
+            assert removed == ["ghost-new"]
+            assert screen._provisional == {"ghost-old"}
+            assert screen._unconfirmed([], complete=True) == ["ghost-old"]
+
+    asyncio.run(scenario())
+
+
+def test_only_stats_and_projects_failures_back_off_refresh(tmp_path):
+    settings = make_settings(tmp_path)
+
+    async def scenario():
+        app = StrakerVerifyApp(settings)
+        async with app.run_test(size=(120, 40)) as pilot:
+            screen = await wait_for_first_load(app, pilot)
+
+            async def unavailable():
+                raise RuntimeError("unavailable")
+
+            screen.client.get_token_balance = unavailable
+            screen.client.get_languages = unavailable
+            await screen.load_data()
+            secondary = app.refresh_scheduler.failures
+
+            screen.client.get_stats = unavailable
+            await screen.load_data()
+            primary = app.refresh_scheduler.failures
+            return secondary, primary
+
+    assert asyncio.run(scenario()) == (0, 1)
+
+
+def test_pages_load_until_the_list_can_scroll(tmp_path):
+    settings = make_settings(tmp_path, MOCK_PROJECTS=200, PROJECTS_PAGE_SIZE=3, MOCK_LATENCY=0)
+
+    async def scenario():
+        app = StrakerVerifyApp(settings)
+        async with app.run_test(size=(120, 60)) as pilot:
+            screen = await wait_for_first_load(app, pilot)
+            for _ in range(50):
+                await pilot.pause(0.01)
+            project_list = screen.query_one("#projects", ProjectList)
+            return len(screen.projects), project_list.max_scroll_y, project_list.size.height
+
+    loaded, max_scroll_y, height = asyncio.run(scenario())
+    assert 3 < loaded < 200
+    assert max_scroll_y > height
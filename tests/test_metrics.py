@@ -0,0 +1,65 @@
+"""Tests for request metrics collected through httpx event hooks."""
+
+import asyncio
+import logging
+
+import httpx
+
+from src.api.metrics import ClientMetrics
+
+
+class Chunks(httpx.AsyncByteStream):
+    """Response body sent in chunks, without a Content-Length."""
+
+    def __init__(self, *chunks: bytes):
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def make_http(metrics: ClientMetrics) -> httpx.AsyncClient:
+    def handler(request):
+        return httpx.Response(200, stream=Chunks(b"a" * 1000, b"b" * 500))
+
+    return httpx.AsyncClient(
+        base_url="https://api.test",
+        transport=httpx.MockTransport(handler),
+        event_hooks=metrics.event_hooks,
+    )
+
+
+def test_bytes_received_counted_from_stream_without_content_length(caplog):
+    metrics = ClientMetrics()
+
+    async def scenario():
+        async with make_http(metrics) as http:
+            response = await http.get("/v1/stats")
+        return response
+
+    with caplog.at_level(logging.INFO, logger="straker_verify.http"):
+        response = asyncio.run(scenario())
+
+    assert "Content-Length" not in response.headers
+    endpoint = metrics.snapshot()["endpoints"]["GET /v1/stats"]
+    assert endpoint["requests"] == 1
+    assert endpoint["bytes_received"] == 1500
+    [record] = [r for r in caplog.records if r.getMessage() == "http_request"]
+    assert record.fields["bytes_received"] == 1500
+
+
+def test_partially_read_stream_counts_bytes_read():
+    metrics = ClientMetrics()
+
+    async def scenario():
+        async with make_http(metrics) as http:
+            async with http.stream("GET", "/v1/files/f-1/download") as response:
+                async for _ in response.aiter_raw():
+                    break
+
+    asyncio.run(scenario())
+
+    endpoint = metrics.snapshot()["endpoints"]["GET /v1/files/{id}/download"]
+    assert endpoint["bytes_received"] == 1000
+    assert metrics.in_flight == 0
@@ -0,0 +1,157 @@
+"""Tests for ProjectIndex's incrementally maintained statistics."""
+
+import random
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from src.api.models import FileInfo, Project, ProjectStats, ProjectStatus, QualityScore
+from src.api.project_index import ProjectIndex
+
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_project(
+    project_id: str,
+    status: ProjectStatus = ProjectStatus.COMPLETE,
+    files: int = 0,
+    quality: Optional[float] = None,
+) -> Project:
+    """Build a project with the fields the statistics depend on."""
+    return Project(
+        id=project_id,
+        name=project_id,
+        source_language="en",
+        target_language="es",
+        status=status,
+        quality_score=QualityScore(overall=quality) if quality is not None else None,
+        files=[FileInfo(id=f"{project_id}-{i}", name=f"{i}.txt", size=1) for i in range(files)],
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def recount(projects: Iterable[Project]) -> ProjectStats:
+    """Compute statistics with a full pass, as the index must agree with."""
+    projects = list(projects)
+    qualities = [
+        p.quality_score.overall
+        for p in projects
+        if p.status == ProjectStatus.COMPLETE and p.quality_score
+    ]
+    return ProjectStats(
+        total_projects=len(projects),
+        active_projects=sum(p.status == ProjectStatus.PROCESSING for p in projects),
+        completed_projects=sum(p.status == ProjectStatus.COMPLETE for p in projects),
+        failed_projects=sum(p.status == ProjectStatus.FAILED for p in projects),
+        total_files=sum(len(p.files) for p in projects),
+        average_quality=sum(qualities) / len(qualities) if qualities else None,
+    )
+
+
+def assert_matches_recount(index: ProjectIndex) -> None:
+    stats = index.stats()
+    expected = recount(index.values())
+    assert stats.model_dump(exclude={"average_quality"}) == expected.model_dump(exclude={"average_quality"})
+    if expected.average_quality is None:
+        assert stats.average_quality is None
+    else:
+        assert abs(stats.average_quality - expected.average_quality) < 1e-6
+
+
+def test_replace_subtracts_previous_contribution():
+    index = ProjectIndex()
+    index.put(make_project("a", ProjectStatus.PROCESSING, files=3))
+    index.put(make_project("b", ProjectStatus.COMPLETE, files=1, quality=80.0))
+
+    index.put(make_project("a", ProjectStatus.COMPLETE, files=2, quality=90.0))
+
+    stats = index.stats()
+    assert stats.total_projects == 2
+    assert stats.active_projects == 0
+    assert stats.completed_projects == 2
+    assert stats.total_files == 3
+    assert stats.average_quality == 85.0
+
+
+def test_replace_with_unscored_project_drops_quality():
+    index = ProjectIndex()
+    index.put(make_project("a", quality=70.0))
+
+    index.put(make_project("a", ProjectStatus.FAILED))
+
+    stats = index.stats()
+    assert stats.failed_projects == 1
+    assert stats.completed_projects == 0
+    assert stats.average_quality is None
+
+
+def test_delete_retracts_contribution():
+    index = ProjectIndex()
+    index.put(make_project("a", ProjectStatus.FAILED, files=4))
+    index.put(make_project("b", quality=60.0))
+
+    del index["a"]
+    del index["b"]
+
+    assert index.stats() == ProjectStats()
+    assert len(index) == 0
+
+
+def test_in_place_change_needs_reassignment():
+    index = ProjectIndex()
+    project = make_project("a", ProjectStatus.PROCESSING)
+    index.put(project)
+
+    project.status = ProjectStatus.COMPLETE
+    assert index.stats().active_projects == 1
+
+    index[project.id] = project
+    assert index.stats().active_projects == 0
+    assert index.stats().completed_projects == 1
+
+
+def test_average_quality_is_clamped_after_float_drift():
+    index = ProjectIndex()
+    index.put(make_project("keep", quality=100.0))
+    for i in range(1000):
+        index.put(make_project(f"p{i}", quality=100.0 - i % 7 * 0.1))
+    for i in range(1000):
+        del index[f"p{i}"]
+
+    assert 0.0 <= index.stats().average_quality <= 100.0
+    assert abs(index.stats().average_quality - 100.0) < 1e-6
+
+
+def test_counters_match_recount_under_random_churn():
+    rng = random.Random(1234)
+    index = ProjectIndex()
+    statuses = list(ProjectStatus)
+    for _ in range(2000):
+        project_id = f"p{rng.randrange(50)}"
+        if project_id in index and rng.random() < 0.3:
+            del index[project_id]
+        else:
+            status = rng.choice(statuses)
+            quality = round(rng.uniform(0, 100), 2) if rng.random() < 0.8 else None
+            index.put(make_project(project_id, status, files=rng.randrange(5), quality=quality))
+
+    assert_matches_recount(index)
+
+
+def test_reads_build_independent_copies():
+    index = ProjectIndex()
+    project = make_project("a", files=2, quality=90.0)
+    project.metadata["team"] = "docs"
+    index.put(project)
+
+    stored = index["a"]
+    assert stored == project
+    assert stored is not project
+
+    stored.files.clear()
+    stored.quality_score.overall = 10.0
+    stored.metadata.clear()
+    assert index["a"] == project
+    assert index.record("a").quality.overall == 90.0
+    assert [f.name for f in index.record("a").files] == ["0.txt", "1.txt"]
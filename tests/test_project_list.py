@@ -0,0 +1,113 @@
+"""Tests for the virtualized project list."""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from textual.app import App, ComposeResult
+
+from src.api.records import ProjectRow
+from src.widgets.project_list import ProjectList
+
+
+NOW = datetime(2024, 1, 1)
+
+
+def make_row(index: int, minutes: Optional[float] = None, **fields) -> ProjectRow:
+    """Build a row updated some minutes before NOW."""
+    row = ProjectRow(
+        id=f"proj-{index}",
+        name=f"Project {index}",
+        status="complete",
+        language_pair="EN → ES",
+        updated_at=NOW - timedelta(minutes=index if minutes is None else minutes),
+        quality=90.0,
+    )
+    return row._replace(**fields)
+
+
+class ListApp(App):
+    def __init__(self, rows):
+        super().__init__()
+        self.initial_rows = rows
+
+    def compose(self) -> ComposeResult:
+        yield ProjectList(self.initial_rows)
+
+
+def run_with_list(rows, check):
+    """Mount a project list and run a check against it."""
+
+    async def scenario():
+        app = ListApp(rows)
+        async with app.run_test(size=(80, 40)) as pilot:
+            await pilot.pause()
+            return check(app.query_one(ProjectList))
+
+    return asyncio.run(scenario())
+
+
+def assert_consistent(project_list: ProjectList) -> None:
+    rows = project_list.rows
+    assert [row.updated_at for row in rows] == sorted((row.updated_at for row in rows), reverse=True)
+    assert project_list._positions == {row.id: index for index, row in enumerate(rows)}
+
+
+def test_rows_are_sorted_on_creation():
+    def check(project_list):
+        assert_consistent(project_list)
+        return [row.id for row in project_list.rows]
+
+    assert run_with_list([make_row(2), make_row(0), make_row(1)], check) == ["proj-0", "proj-1", "proj-2"]
+
+
+def test_unchanged_rows_are_skipped_and_patches_stay_in_place():
+    def check(project_list):
+        unchanged = project_list.update_rows([make_row(5)])
+        patched = project_list.update_rows([make_row(5, quality=50.0)])
+        assert_consistent(project_list)
+        return unchanged, patched, project_list.rows[5].quality
+
+    assert run_with_list([make_row(i) for i in range(10)], check) == (0, 1, 50.0)
+
+
+def test_insert_move_and_remove_by_id():
+    def check(project_list):
+        changed = project_list.update_rows(
+            [make_row(100, minutes=-1), make_row(7, minutes=-2), make_row(200, minutes=3.5)],
+            removed=["proj-2", "proj-unknown"],
+        )
+        assert_consistent(project_list)
+        return changed, [row.id for row in project_list.rows[:6]], len(project_list.rows)
+
+    changed, top, total = run_with_list([make_row(i) for i in range(10)], check)
+    assert changed == 4
+    assert top == ["proj-7", "proj-100", "proj-0", "proj-1", "proj-3", "proj-200"]
+    assert total == 11
+
+
+def test_random_changes_keep_order_and_positions():
+    rng = random.Random(7)
+
+    def check(project_list):
+        for _ in range(200):
+            rows = [make_row(rng.randrange(300), minutes=rng.randrange(500)) for _ in range(rng.randrange(4))]
+            removed = [f"proj-{rng.randrange(300)}" for _ in range(rng.randrange(3))]
+            project_list.update_rows(rows, removed=removed)
+            assert_consistent(project_list)
+        return True
+
+    assert run_with_list([make_row(i) for i in range(100)], check)
+
+
+def test_merging_one_row_into_a_long_list_is_fast():
+    def check(project_list):
+        started = time.perf_counter()
+        project_list.update_rows([make_row(-1)])
+        return time.perf_counter() - started, project_list.rows[0].id
+
+    elapsed, top = run_with_list([make_row(i) for i in range(50000)], check)
+    assert top == "proj--1"
+    assert elapsed < 0.1
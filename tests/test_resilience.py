@@ -0,0 +1,134 @@
+"""Tests for retry policy and circuit breaker."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.api.client import StrakerVerifyClient
+from src.api.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+
+
+API_KEY = "sk_test_" + "0" * 32
+BASE_URL = "https://api.test"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_client(handler) -> StrakerVerifyClient:
+    """Build a real-API client served by an in-process handler."""
+    client = StrakerVerifyClient(
+        API_KEY,
+        BASE_URL,
+        cache_enabled=False,
+        transport=httpx.MockTransport(handler),
+    )
+    client.retry_policy = RetryPolicy(max_attempts=1)
+    return client
+
+
+def test_circuit_opens_after_threshold_and_fails_fast():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_half_open_allows_one_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.before_request() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.before_request() is False
+
+
+def test_failed_trial_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 10
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_released_trial_lets_next_request_through():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.before_request()
+    breaker.release_trial()
+    assert breaker.before_request()
+
+
+def test_cancelled_trial_request_does_not_wedge_the_circuit():
+    async def slow(request):
+        await asyncio.sleep(10)
+        return httpx.Response(200, json={})
+
+    async def scenario():
+        clock = FakeClock()
+        client = make_client(slow)
+        client.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        client.circuit_breaker.record_failure()
+        clock.now = 10
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client._request("GET", "/v1/stats"), timeout=0.01)
+            # The backend recovered; the next trial must be let through
+            client.http_client._transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+            response = await client._request("GET", "/v1/stats")
+        finally:
+            await client.close()
+        return response.status_code, client.circuit_breaker.state
+
+    assert asyncio.run(scenario()) == (200, CircuitBreaker.CLOSED)
+
+
+def test_retry_policy_retries_transient_statuses_only():
+    policy = RetryPolicy(max_attempts=3)
+    request = httpx.Request("GET", BASE_URL)
+    assert policy.should_retry(0, httpx.Response(503, request=request))
+    assert policy.should_retry(0, None)
+    assert not policy.should_retry(0, httpx.Response(404, request=request))
+    assert not policy.should_retry(2, httpx.Response(503, request=request))
+
+
+def test_retry_policy_backoff_is_bounded():
+    policy = RetryPolicy(max_attempts=5, base_delay=1, max_delay=3)
+    for attempt in range(5):
+        assert 0 <= policy.delay(attempt) <= min(3, 2 ** attempt)
+
+
+def test_retry_after_is_honored_and_capped():
+    request = httpx.Request("GET", BASE_URL)
+    policy = RetryPolicy(max_delay=5)
+    assert policy.delay(0, httpx.Response(429, headers={"Retry-After": "2"}, request=request)) == 2
+    assert policy.delay(0, httpx.Response(429, headers={"Retry-After": "60"}, request=request)) == 5
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "soon"}, request=request)) is None
+    assert parse_retry_after(
+        httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, request=request)
+    ) == 0
@@ -0,0 +1,91 @@
+"""Tests for the adaptive auto-refresh scheduler."""
+
+import pytest
+
+from src.api.models import ProjectStatus
+from src.utils.scheduler import MAX_INTERVAL, MIN_INTERVAL, RefreshScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize("status", [ProjectStatus.PENDING, ProjectStatus.PROCESSING])
+def test_interval_is_halved_while_projects_are_active(status):
+    scheduler = RefreshScheduler(30, clock=FakeClock())
+    assert scheduler.next_delay([ProjectStatus.COMPLETE, status]) == 15
+
+
+def test_interval_is_stretched_when_everything_has_settled():
+    scheduler = RefreshScheduler(30, clock=FakeClock())
+    assert scheduler.next_delay([ProjectStatus.COMPLETE, ProjectStatus.FAILED]) == 120
+    assert scheduler.next_delay([]) == 30
+
+
+def test_interval_is_clamped():
+    assert RefreshScheduler(1, clock=FakeClock()).next_delay([ProjectStatus.PROCESSING]) == MIN_INTERVAL
+    assert RefreshScheduler(100, clock=FakeClock()).next_delay([ProjectStatus.COMPLETE]) == MAX_INTERVAL
+
+
+def test_failures_back_off_exponentially_and_reset_on_success():
+    clock = FakeClock()
+    scheduler = RefreshScheduler(2, clock=clock)
+    active = [ProjectStatus.PROCESSING]
+
+    delays = [scheduler.record_refresh(active, failed=True) for _ in range(10)]
+    assert delays[:5] == [4, 8, 16, 32, 64]
+    assert delays[-1] == MAX_INTERVAL
+    assert scheduler.failures == 10
+
+    assert scheduler.record_refresh(active) == 1
+    assert scheduler.failures == 0
+
+
+def test_backoff_exponent_is_capped():
+    scheduler = RefreshScheduler(1, clock=FakeClock())
+    scheduler.failures = 1000
+    assert scheduler.next_delay([]) == 256
+
+
+def test_refresh_is_due_after_the_delay():
+    clock = FakeClock()
+    scheduler = RefreshScheduler(10, idle_timeout=0, clock=clock)
+    delay = scheduler.record_refresh([ProjectStatus.COMPLETE])
+
+    clock.now += delay - 0.1
+    assert not scheduler.is_due()
+    clock.now += 0.1
+    assert scheduler.is_due()
+
+
+def test_unfocused_app_pauses_refreshes():
+    clock = FakeClock()
+    scheduler = RefreshScheduler(10, clock=clock)
+    clock.now += 60
+    scheduler.focused = False
+    assert scheduler.paused and not scheduler.is_due()
+    scheduler.focused = True
+    assert scheduler.is_due()
+
+
+def test_idle_user_pauses_refreshes_until_activity():
+    clock = FakeClock()
+    scheduler = RefreshScheduler(10, idle_timeout=300, clock=clock)
+    clock.now += 301
+    assert scheduler.paused and not scheduler.is_due()
+
+    scheduler.record_activity()
+    assert not scheduler.paused and scheduler.is_due()
+
+
+def test_idle_timeout_of_zero_never_pauses():
+    clock = FakeClock()
+    scheduler = RefreshScheduler(10, idle_timeout=0, clock=clock)
+    clock.now += 10 ** 6
+    assert not scheduler.paused
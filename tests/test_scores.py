@@ -0,0 +1,46 @@
+"""Tests for the columnar segment score store."""
+
+import math
+
+import pytest
+
+from src.api.models import QualityScore
+from src.api.scores import SegmentScores
+
+
+def make_scores(*overall) -> SegmentScores:
+    """Build a store from overall scores (None for unscored segments)."""
+    scores = SegmentScores()
+    scores.extend(QualityScore(overall=value) if value is not None else None for value in overall)
+    return scores
+
+
+def test_store_can_grow_while_a_column_is_held():
+    scores = make_scores(80.0, 90.0)
+    column = scores.column()
+    scores.append(QualityScore(overall=100.0))
+    scores.extend([QualityScore(overall=70.0)])
+    assert list(column) == [80.0, 90.0]
+    assert len(scores) == 4
+
+
+def test_aggregates_ignore_missing_scores():
+    scores = make_scores(60.0, None, 80.0, 100.0)
+    assert scores.count() == 3
+    assert scores.mean() == 80.0
+    assert scores.min_max() == (60.0, 100.0)
+    assert scores.percentile(50) == 80.0
+    assert sum(scores.histogram(bins=4)) == 3
+    assert math.isnan(scores.column()[1])
+
+
+def test_empty_store():
+    scores = SegmentScores()
+    assert scores.mean() is None
+    assert scores.summary() is None
+    assert len(scores.column()) == 0
+
+
+def test_unknown_dimension():
+    with pytest.raises(ValueError):
+        SegmentScores().column("speed")
@@ -0,0 +1,151 @@
+"""Tests for paging a project's segments."""
+
+import asyncio
+
+import httpx
+
+from src.api.client import SEGMENT_CACHE_SIZE, StrakerVerifyClient
+from src.api.resilience import RetryPolicy
+from src.api.synthetic import SyntheticBackend
+
+
+def make_client(segments: int = 250, **options) -> StrakerVerifyClient:
+    """Build a demo-mode client with one synthetic account."""
+    backend = SyntheticBackend(projects=20, segments_per_project=segments, latency=0)
+    return StrakerVerifyClient("demo", mock_backend=backend, **options)
+
+
+def generated_project(client: StrakerVerifyClient) -> str:
+    """Find a project with generated segments."""
+    return next(pid for pid in client._projects if client._mock.segment_count(pid))
+
+
+def test_file_filter_combines_generated_and_uploaded_segments(tmp_path):
+    upload = tmp_path / "extra.txt"
+    upload.write_text("Hello")
+
+    async def scenario():
+        client = make_client()
+        project_id = generated_project(client)
+        generated_file = client._projects[project_id].files[0].id
+        file_info = await client.upload_file(project_id, upload)
+        uploaded = await client.get_project_segments(project_id, file_id=file_info.id)
+        generated = await client.get_project_segments(project_id, file_id=generated_file)
+        everything = await client.get_project_segments(project_id)
+        expected = client._mock.segment_count(project_id, generated_file)
+        await client.close()
+        return uploaded, generated, everything, generated_file, expected
+
+    uploaded, generated, everything, generated_file, expected = asyncio.run(scenario())
+    assert len(uploaded) == 4
+    assert {s.file_id for s in generated} == {generated_file}
+    assert len(generated) == expected
+    assert len(everything) == 250 + 4
+    assert everything[-4:] == uploaded
+
+
+def segment_server(total: int = 250):
+    """Serve a project's segments, alternating between two files."""
+    requests = []
+    segments = [
+        {"id": f"seg-{i}", "file_id": "file-a" if i % 2 == 0 else "file-b", "source_text": "s", "target_text": "t"}
+        for i in range(total)
+    ]
+
+    def handler(request):
+        params = request.url.params
+        requests.append((int(params["offset"]), params.get("file_id")))
+        matching = [s for s in segments if params.get("file_id") in (None, s["file_id"])]
+        offset, limit = int(params["offset"]), int(params["limit"])
+        return httpx.Response(200, json={"segments": matching[offset:offset + limit], "total": len(matching)})
+
+    return handler, requests
+
+
+def real_client(handler, **options) -> StrakerVerifyClient:
+    client = StrakerVerifyClient(
+        "sk_test_" + "0" * 32,
+        "https://api.test",
+        transport=httpx.MockTransport(handler),
+        **options,
+    )
+    client.retry_policy = RetryPolicy(max_attempts=1)
+    return client
+
+
+def test_window_spans_page_boundaries_and_stops_at_the_end():
+    handler, requests = segment_server()
+
+    async def scenario():
+        client = real_client(handler)
+        try:
+            middle = await client.get_segment_window("proj-0", start=95, count=10)
+            tail = await client.get_segment_window("proj-0", start=245, count=10)
+            past = await client.get_segment_window("proj-0", start=400, count=10)
+        finally:
+            await client.close()
+        return middle, tail, past
+
+    middle, tail, past = asyncio.run(scenario())
+    assert [s.id for s in middle.segments] == [f"seg-{i}" for i in range(95, 105)]
+    assert (middle.offset, middle.total) == (95, 250)
+    assert [s.id for s in tail.segments] == [f"seg-{i}" for i in range(245, 250)]
+    assert past.segments == [] and past.total == 250
+    # Page-aligned fetches: 0 and 100 for the middle window, 200 for the tail
+    assert sorted(requests)[:3] == [(0, None), (100, None), (200, None)]
+
+
+def test_file_filter_is_sent_and_paged():
+    handler, requests = segment_server()
+
+    async def scenario():
+        client = real_client(handler)
+        try:
+            window = await client.get_segment_window("proj-0", start=120, count=10, file_id="file-b")
+            every = await client.get_project_segments("proj-0", file_id="file-b")
+        finally:
+            await client.close()
+        return window, every
+
+    window, every = asyncio.run(scenario())
+    assert window.total == 125
+    assert [s.id for s in window.segments] == [f"seg-{2 * i + 1}" for i in range(120, 125)]
+    assert len(every) == 125 and {s.file_id for s in every} == {"file-b"}
+    assert all(file_id == "file-b" for _, file_id in requests)
+
+
+def test_scrolling_back_reuses_recent_pages_with_caching_disabled():
+    handler, requests = segment_server(total=1000)
+
+    async def scenario():
+        client = real_client(handler, cache_enabled=False)
+        try:
+            for start in (0, 150, 300, 150, 0):
+                await client.get_segment_window("proj-0", start=start, count=40)
+            fetched = len(requests)
+            client.invalidate_cache("segments")
+            await client.get_segment_window("proj-0", start=0, count=40)
+        finally:
+            await client.close()
+        return fetched, len(requests)
+
+    assert asyncio.run(scenario()) == (3, 4)
+
+
+def test_segment_pages_have_their_own_lru():
+    handler, requests = segment_server(total=SEGMENT_CACHE_SIZE * 200)
+
+    async def scenario():
+        client = real_client(handler)
+        try:
+            for page in range(SEGMENT_CACHE_SIZE + 1):
+                await client.get_segment_page("proj-0", offset=page * 100)
+            cached_elsewhere = len(client._cache)
+            await client.get_segment_page("proj-0", offset=SEGMENT_CACHE_SIZE * 100)
+            await client.get_segment_page("proj-0", offset=0)
+        finally:
+            await client.close()
+        return cached_elsewhere, len(requests)
+
+    # The first page was evicted; the newest was still cached
+    assert asyncio.run(scenario()) == (0, SEGMENT_CACHE_SIZE + 2)
@@ -0,0 +1,80 @@
+"""Tests for request coalescing."""
+
+import asyncio
+
+import pytest
+
+from src.api.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def scenario():
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+        return results, len(flight)
+
+    results, in_flight = asyncio.run(scenario())
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert in_flight == 0
+
+
+def test_different_keys_are_not_shared():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return len(calls)
+
+    async def scenario():
+        flight = SingleFlight()
+        return await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
+
+
+def test_errors_reach_every_caller_and_are_not_remembered():
+    attempts = []
+
+    async def fetch():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    async def scenario():
+        flight = SingleFlight()
+        results = await asyncio.gather(flight.do("key", fetch), flight.do("key", fetch), return_exceptions=True)
+        return results, await flight.do("key", fetch)
+
+    results, retried = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert retried == "ok"
+
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def scenario():
+        flight = SingleFlight()
+        impatient = asyncio.ensure_future(flight.do("key", fetch))
+        patient = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await impatient
+        return await patient
+
+    assert asyncio.run(scenario()) == "result"
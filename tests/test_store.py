@@ -0,0 +1,52 @@
+"""Tests for the on-disk dashboard snapshot."""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+
+from src.api.models import Project, ProjectStatus, QualityScore
+from src.api.records import ProjectRow
+from src.api.store import SnapshotStore
+
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_project(index: int) -> Project:
+    return Project(
+        id=f"proj-{index}",
+        name=f"Project {index}",
+        source_language="en",
+        target_language="es",
+        status=ProjectStatus.COMPLETE,
+        quality_score=QualityScore(overall=80.0 + index),
+        created_at=NOW,
+        updated_at=NOW - timedelta(minutes=index),
+    )
+
+
+def tables(store: SnapshotStore):
+    with closing(sqlite3.connect(store.path)) as conn:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+def test_save_replaces_rows(tmp_path):
+    store = SnapshotStore(tmp_path, api_key="demo", base_url="https://api.test")
+    store.save_project_rows([ProjectRow.from_project(make_project(i)) for i in (0, 1)])
+    store.save_project_rows([ProjectRow.from_project(make_project(i)) for i in (2, 1)])
+
+    loaded = store.load_project_rows()
+    assert loaded == [ProjectRow.from_project(make_project(i)) for i in (1, 2)]
+    assert loaded[0].updated_at.tzinfo is not None
+    assert tables(store) == {"project_rows", "stats"}
+
+
+def test_legacy_tables_are_dropped(tmp_path):
+    store = SnapshotStore(tmp_path, api_key="demo", base_url="https://api.test")
+    with closing(sqlite3.connect(store.path)) as conn, conn:
+        conn.execute("CREATE TABLE segments (project_id TEXT, position INTEGER, data TEXT)")
+        conn.execute("CREATE TABLE projects (id TEXT PRIMARY KEY, updated_at TEXT, data TEXT)")
+        conn.execute("INSERT INTO segments VALUES ('gone', 0, '{}')")
+
+    reopened = SnapshotStore(tmp_path, api_key="demo", base_url="https://api.test")
+    assert tables(reopened) == {"project_rows", "stats"}
@@ -0,0 +1,97 @@
+"""Tests for resumable downloads."""
+
+import asyncio
+
+import httpx
+
+from src.api.client import StrakerVerifyClient
+from src.api.resilience import RetryPolicy
+from src.api.transfer import part_path, validator_path
+
+
+API_KEY = "sk_test_" + "0" * 32
+BASE_URL = "https://api.test"
+
+
+class FileServer:
+    """Serves one file with ETag, Range and If-Range support."""
+
+    def __init__(self, content: bytes, etag: str = '"v1"'):
+        self.content = content
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(dict(request.headers))
+        headers = {"ETag": self.etag}
+        byte_range = request.headers.get("Range")
+        if_range = request.headers.get("If-Range")
+        if byte_range and (if_range is None or if_range == self.etag):
+            start = int(byte_range.split("=")[1].rstrip("-"))
+            if start >= len(self.content):
+                headers["Content-Range"] = f"bytes */{len(self.content)}"
+                return httpx.Response(416, headers=headers)
+            headers["Content-Range"] = f"bytes {start}-{len(self.content) - 1}/{len(self.content)}"
+            return httpx.Response(206, content=self.content[start:], headers=headers)
+        return httpx.Response(200, content=self.content, headers=headers)
+
+
+def download(server: FileServer, output_path) -> bytes:
+    """Download the served file and return what ended up on disk."""
+
+    async def scenario():
+        client = StrakerVerifyClient(
+            API_KEY, BASE_URL, cache_enabled=False, transport=httpx.MockTransport(server)
+        )
+        client.retry_policy = RetryPolicy(max_attempts=1)
+        try:
+            await client.download_file("f1", output_path)
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+    return output_path.read_bytes()
+
+
+def test_resumes_partial_download_when_unchanged(tmp_path):
+    output = tmp_path / "out.txt"
+    part_path(output).write_bytes(b"hello ")
+    validator_path(part_path(output)).write_text('"v1"')
+    server = FileServer(b"hello world")
+
+    assert download(server, output) == b"hello world"
+    assert server.requests[0]["range"] == "bytes=6-"
+    assert server.requests[0]["if-range"] == '"v1"'
+    assert not validator_path(part_path(output)).exists()
+
+
+def test_restarts_when_file_changed_on_server(tmp_path):
+    output = tmp_path / "out.txt"
+    part_path(output).write_bytes(b"old con")
+    validator_path(part_path(output)).write_text('"v1"')
+    server = FileServer(b"brand new content", etag='"v2"')
+
+    assert download(server, output) == b"brand new content"
+
+
+def test_partial_without_validator_is_not_resumed(tmp_path):
+    output = tmp_path / "out.txt"
+    part_path(output).write_bytes(b"stale")
+    server = FileServer(b"fresh content")
+
+    assert download(server, output) == b"fresh content"
+    assert "range" not in server.requests[0]
+
+
+def test_416_only_accepted_when_sizes_match(tmp_path):
+    output = tmp_path / "out.txt"
+    part_path(output).write_bytes(b"0123456789")
+    validator_path(part_path(output)).write_text('"v1"')
+    server = FileServer(b"short")
+
+    assert download(server, output) == b"short"
+    assert len(server.requests) == 2
+
+    part_path(output).write_bytes(b"short")
+    validator_path(part_path(output)).write_text('"v1"')
+    assert download(server, output) == b"short"
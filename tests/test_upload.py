@@ -0,0 +1,143 @@
+"""Tests for uploads against an in-process API."""
+
+import asyncio
+import re
+
+import httpx
+
+from src.api.client import StrakerVerifyClient
+from src.api.resilience import RetryPolicy
+
+
+API_KEY = "sk_test_" + "0" * 32
+BASE_URL = "https://api.test"
+
+
+class UploadServer:
+    """Accepts multipart uploads and chunked resumable upload sessions."""
+
+    def __init__(self, fail_chunk_at=None):
+        self.fail_chunk_at = fail_chunk_at
+        self.sessions = {}
+        self.files = {}
+        self.requests = []
+        self.completed = None
+
+    def file_json(self, name: str, size: int) -> dict:
+        file_id = f"file-{len(self.files)}"
+        self.files[file_id] = name
+        return {"id": file_id, "name": name, "size": size}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests.append((request.method, path, dict(request.headers)))
+        if request.method == "POST" and path.endswith("/files"):
+            body = request.content
+            name = re.search(rb'filename="([^"]+)"', body).group(1).decode()
+            _, _, rest = body.partition(b"\r\n\r\n")
+            return httpx.Response(201, json=self.file_json(name, len(rest.rsplit(b"\r\n--", 1)[0])))
+        if request.method == "POST" and path.endswith("/uploads"):
+            upload_id = f"up-{len(self.sessions)}"
+            self.sessions[upload_id] = {"data": b""}
+            return httpx.Response(201, json={"upload_id": upload_id, "offset": 0})
+        upload_id = path.split("/")[3]
+        session = self.sessions.get(upload_id)
+        if session is None:
+            return httpx.Response(404)
+        if request.method == "GET":
+            return httpx.Response(200, json={"upload_id": upload_id, "offset": len(session["data"])})
+        if request.method == "PUT":
+            start = int(request.headers["Content-Range"].split()[1].split("-")[0])
+            if start == self.fail_chunk_at:
+                self.fail_chunk_at = None
+                return httpx.Response(400)
+            assert start == len(session["data"])
+            session["data"] += request.content
+            return httpx.Response(200, json={"offset": len(session["data"])})
+        del self.sessions[upload_id]
+        self.completed = session["data"]
+        return httpx.Response(200, json=self.file_json("big.bin", len(session["data"])))
+
+
+def make_client(server: UploadServer) -> StrakerVerifyClient:
+    client = StrakerVerifyClient(API_KEY, BASE_URL, cache_enabled=False, transport=httpx.MockTransport(server))
+    client.retry_policy = RetryPolicy(max_attempts=1)
+    return client
+
+
+def test_upload_files_reports_each_file(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_bytes(b"x" * (100 * (i + 1)))
+        paths.append(path)
+    server = UploadServer()
+    events = []
+
+    async def scenario():
+        client = make_client(server)
+        try:
+            return [r async for r in client.upload_files("proj-0", paths, concurrency=2, progress=events.append)]
+        finally:
+            await client.close()
+
+    results = asyncio.run(scenario())
+    assert sorted(r.path.name for r in results) == [p.name for p in paths]
+    assert all(r.error is None for r in results)
+    assert {r.path.name: r.file.size for r in results} == {p.name: p.stat().st_size for p in paths}
+    final = {e.path.name: e.bytes_sent for e in events}
+    assert final == {p.name: p.stat().st_size for p in paths}
+
+
+def test_resumable_upload_resumes_after_a_failed_chunk(tmp_path):
+    path = tmp_path / "big.bin"
+    content = bytes(range(256)) * 40
+    path.write_bytes(content)
+    server = UploadServer(fail_chunk_at=4096)
+
+    async def scenario():
+        client = make_client(server)
+        try:
+            try:
+                await client._upload_resumable("proj-0", path, None, chunk_size=4096)
+            except httpx.HTTPStatusError:
+                pass
+            else:
+                raise AssertionError("the failed chunk should fail the upload")
+            return await client._upload_resumable("proj-0", path, None, chunk_size=4096)
+        finally:
+            await client.close()
+
+    file_info = asyncio.run(scenario())
+    assert file_info.size == len(content)
+    assert server.completed == content
+    puts = [headers for method, _, headers in server.requests if method == "PUT"]
+    assert [h["content-range"] for h in puts] == [
+        "bytes 0-4095/10240", "bytes 4096-8191/10240", "bytes 4096-8191/10240", "bytes 8192-10239/10240",
+    ]
+    assert {h["content-type"] for h in puts} == {"application/octet-stream"}
+    # One session was created and then resumed
+    assert [m for m, p, _ in server.requests if p.endswith("/uploads")] == ["POST"]
+    assert ("GET", "/v1/uploads/up-0") in [(m, p) for m, p, _ in server.requests]
+
+
+def test_expired_session_starts_over(tmp_path):
+    path = tmp_path / "big.bin"
+    path.write_bytes(b"z" * 10000)
+    server = UploadServer(fail_chunk_at=4096)
+
+    async def scenario():
+        client = make_client(server)
+        try:
+            try:
+                await client._upload_resumable("proj-0", path, None, chunk_size=4096)
+            except httpx.HTTPStatusError:
+                pass
+            server.sessions.clear()
+            return await client._upload_resumable("proj-0", path, None, chunk_size=4096)
+        finally:
+            await client.close()
+
+    file_info = asyncio.run(scenario())
+    assert file_info.size == 10000
+    assert [m for m, p, _ in server.requests if p.endswith("/uploads")] == ["POST", "POST"]